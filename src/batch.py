@@ -0,0 +1,155 @@
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Headless entry point: applies a filter/fit recipe to every cycler file of a folder.
+# Usage: python src/batch.py recipe.json data/ [--output filtered_data/] [--workers 8]
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "h2f_F01_03")
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
+
+from reader_registry import reader_for
+from data_archives import list_cycler_files, base_name, display_name
+from data_schema import working_columns
+from dataset_catalog import file_stamp
+from processing import DEFAULT_FILTER_OPTIONS, DEFAULT_MODIFICATION_OPTIONS, recipe_options, required_columns
+from processing import process_dataset, output_filename, result_to_save
+
+MANIFEST_FILE = "batch_manifest.json"
+
+
+def load_recipe(recipe_path):
+    """
+    Reads a recipe: a JSON object with the keys of HC2FCApp.get_filter_options and get_modification_options.
+    Missing keys get the defaults of the widgets.
+    """
+    with open(recipe_path, "r", encoding="utf-8") as f:
+        recipe = json.load(f)
+    unknown = sorted(set(recipe) - set(DEFAULT_FILTER_OPTIONS) - set(DEFAULT_MODIFICATION_OPTIONS))
+    if unknown:
+        raise ValueError(f"Unknown recipe keys: {', '.join(unknown)}")
+    return recipe_options(recipe)
+
+
+def recipe_key(options):
+    return hashlib.blake2b(json.dumps(options, sort_keys=True).encode("utf-8"), digest_size=8).hexdigest()
+
+
+def process_file(file_path, options, output_folder):
+    """
+    Runs in a worker process: parses the file, applies the recipe and writes the result. Returns the manifest entry.
+    """
+    start = time.perf_counter()
+    columns = working_columns()
+    if columns is not None:
+        columns += [col for col in required_columns(options) if col not in columns]
+
+    data = reader_for(file_path).read(file_path, columns=columns)
+    filtered_data, fit_data = process_dataset(data, options)
+    result = result_to_save(filtered_data, fit_data, options)
+
+    output_path = os.path.join(output_folder, output_filename(base_name(file_path), options))
+    tmp_path = f"{output_path}.tmp"
+    result.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, output_path)
+    return {
+        "status": "done",
+        "output": output_path,
+        "rows_read": len(data),
+        "rows_written": len(result),
+        "seconds": time.perf_counter() - start,
+    }
+
+
+class BatchManifest:
+    """
+    Results of a batch run in the output folder. Files that were processed with the same recipe and have not changed
+    since are skipped when the run is repeated, so an interrupted run continues where it stopped.
+    """
+
+    def __init__(self, output_folder, options):
+        self.path = os.path.join(output_folder, MANIFEST_FILE)
+        self.recipe = recipe_key(options)
+        self.files = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            if manifest.get("recipe") == self.recipe:
+                self.files = manifest.get("files", {})
+        except (OSError, ValueError):
+            pass
+
+    def is_done(self, file_path):
+        entry = self.files.get(file_path, {})
+        return entry.get("status") == "done" and entry.get("stamp") == file_stamp(file_path) and os.path.exists(entry.get("output", ""))
+
+    def record(self, file_path, entry):
+        self.files[file_path] = {**entry, "stamp": file_stamp(file_path)}
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"recipe": self.recipe, "files": self.files}, f, indent=1)
+        os.replace(tmp_path, self.path)
+
+
+def print_progress(done, total, rows, start):
+    seconds = max(time.perf_counter() - start, 1e-9)
+    remaining = (total - done) * seconds / done if done else 0
+    print(f"\r[{done}/{total}] {rows / seconds:,.0f} rows/s, {remaining:.0f} s left   ", end="", flush=True)
+
+
+def run_batch(options, data_folder, output_folder, workers=None):
+    """
+    Processes every cycler file of data_folder in a process pool. Returns (processed, skipped, failed).
+    """
+    os.makedirs(output_folder, exist_ok=True)
+    manifest = BatchManifest(output_folder, options)
+    files = list_cycler_files(data_folder)
+    pending = [path for path in files if not manifest.is_done(path)]
+    workers = min(workers or os.cpu_count() or 1, max(len(pending), 1))
+    print(f"Processing {len(pending)} of {len(files)} files on {workers} workers ({len(files) - len(pending)} already done)")
+
+    start = time.perf_counter()
+    failed, rows = 0, 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(process_file, path, options, output_folder): path for path in pending}
+        for done, future in enumerate(as_completed(futures), start=1):
+            path = futures[future]
+            try:
+                entry = future.result()
+                rows += entry["rows_read"]
+            except Exception as e:
+                failed += 1
+                entry = {"status": "failed", "error": str(e)}
+                print(f"\r⚠️ Failed to process {display_name(path)}: {e}")
+            manifest.record(path, entry)
+            print_progress(done, len(pending), rows, start)
+
+    print(f"\n✅ Processed {len(pending) - failed} files in {time.perf_counter() - start:.1f} s ({failed} failed)")
+    return len(pending) - failed, len(files) - len(pending), failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Applies a filter/fit recipe to all cycler files of a folder.")
+    parser.add_argument("recipe", nargs="?", help="JSON file with filter and modification options")
+    parser.add_argument("folder", nargs="?", help="Folder with the cycler files")
+    parser.add_argument("--output", default=os.path.join(os.getcwd(), "filtered_data"), help="Folder of the results and the manifest")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument("--template", action="store_true", help="Print a recipe with all options and their defaults")
+    args = parser.parse_args()
+
+    if args.template:
+        print(json.dumps(recipe_options({}), indent=2))
+        return
+    if not args.recipe or not args.folder:
+        parser.error("recipe and folder are required")
+
+    _, _, failed = run_batch(load_recipe(args.recipe), args.folder, args.output, args.workers)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+# Benchmark of the import and processing stages of the app on synthetic cycler exports
+# Usage: python src/benchmarks/bench_pipeline.py --rows 5_000_000 --files 2 [--data data/synthetic]
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_DIR = os.path.join(os.path.dirname(BENCH_DIR), "h2f_F01_03")
+for path in (BENCH_DIR, APP_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from synthetic_data import generate_files
+
+from settings import DataSettings
+from reader_registry import reader_for
+from data_schema import apply_compact_schema, working_columns, CYCLE, ABS_CYCLE
+from data_validation import validate_dataset
+from data_cache import DatasetCache
+from column_store import ColumnStore
+from cycle_tools import compute_abs_cycle, CycleSegmentIndex
+from processing import FilterPipeline, process_dataset, add_abs_cycle
+from result_cache import ResultCache
+
+# Filter recipe of the processing stage: one charge half cycle without pauses, with dU/dQ and a U-t fit
+RECIPE = {
+    "remove_pause": True,
+    "select_cycle": True,
+    "selected_cycle": "2",
+    "cycle_column": ABS_CYCLE,  # Cyc-Count of the synthetic files restarts every 3 cycles
+    "select_charge_half_cycle": True,
+    "compute_du_dq": True,
+    "fit_option": "linear spline",
+}
+
+
+def timed(results, stage, rows, function, *args, **kwargs):
+    """
+    Runs function, adds (stage, rows, seconds) to results and returns the result of the function.
+    """
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    results.append((stage, rows, time.perf_counter() - start))
+    return result
+
+
+def benchmark_file(file_path, cache_dir):
+    """
+    Runs the stages of a load on one file and returns [(stage, rows, seconds)].
+    """
+    reader = reader_for(file_path)
+    start = time.perf_counter()
+    data = reader.read(file_path, columns=working_columns())
+    rows = len(data)
+    results = [("parse", rows, time.perf_counter() - start)]
+
+    timed(results, "validate", rows, validate_dataset, data)
+    data, _ = timed(results, "compact schema", rows, apply_compact_schema, data)
+
+    for name, cache in (("feather", DatasetCache(os.path.join(cache_dir, "feather"))), ("npy", ColumnStore(os.path.join(cache_dir, "npy")))):
+        if not cache.enabled:
+            continue
+        timed(results, f"cache store ({name})", rows, cache.store, file_path, data, reader.last_header, {})
+        timed(results, f"cache load ({name})", rows, cache.load, file_path)
+
+    timed(results, "abs cycle", rows, compute_abs_cycle, data[CYCLE].to_numpy())
+    timed(results, "filter", rows, FilterPipeline(RECIPE).apply, data)
+    timed(results, "filter + fit", rows, process_dataset, data, RECIPE)
+
+    # Cycle and half cycle selection as slices of the segment index (built once per dataset in the app)
+    with_abs = add_abs_cycle(data)
+    segments = timed(results, "segment index", rows, CycleSegmentIndex, with_abs, ABS_CYCLE)
+    timed(results, "filter (segment index)", rows, FilterPipeline(RECIPE, segments).apply, with_abs)
+
+    # Step size sweep: with cached stage outputs (and abs_cycle kept as column like in the app) only the fit reruns
+    stage_cache = ResultCache().stage_cache(file_path)
+    process_dataset(with_abs, RECIPE, stage_cache, segments)
+    timed(results, "fit step size (cached)", rows, process_dataset, with_abs, {**RECIPE, "use_step_size": True, "step_size_value": 0.001}, stage_cache, segments)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time of the import and processing stages on synthetic cycler exports.")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Rows per synthetic file")
+    parser.add_argument("--files", type=int, default=1, help="Number of synthetic files")
+    parser.add_argument("--cycles", type=int, default=20, help="Cycles per synthetic file")
+    parser.add_argument("--electrode", choices=("anode", "cathode"), default="cathode", help="OCV curve of the synthetic files")
+    parser.add_argument("--data", default=None, help="Keep the synthetic files in this folder and reuse them in later runs")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        DataSettings.CACHE_DIR = os.path.join(work_dir, "cache")
+        data_dir = args.data or os.path.join(work_dir, "data")
+        prefix = f"bench_{args.electrode}_{args.rows}_{args.cycles}"
+        paths = [os.path.join(data_dir, f"{prefix}_c{i + 1}.txt") for i in range(args.files)]
+        if not all(os.path.exists(path) for path in paths):
+            paths = generate_files(data_dir, args.files, rows=args.rows, cycles=args.cycles, electrode=args.electrode, prefix=prefix)
+
+        print()
+        print(f"{'File':<34}{'Stage':<22}{'Rows':>12}{'Seconds':>10}{'Rows/s':>14}")
+        for path in paths:
+            for stage, rows, seconds in benchmark_file(path, os.path.join(work_dir, "cache")):
+                print(f"{os.path.basename(path):<34}{stage:<22}{rows:>12,}{seconds:>10.3f}{rows / max(seconds, 1e-9):>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+# Benchmark the readers of the app on scaled copies of the fixture files
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "h2f_F01_03")
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
+
+from reader_registry import reader_for, ExcelFileReader
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def scale_text_fixture(fixture_path, target_path, reader, rows):
+    """
+    Writes a copy of a text fixture whose data rows are repeated until the copy has the given number of rows.
+    """
+    with open(fixture_path, "rb") as f:
+        reader.scan_header(f)
+        data_offset = f.tell()
+        f.seek(0)
+        content = f.read()
+    head, data_lines = content[:data_offset], content[data_offset:].splitlines(keepends=True)
+    repeats, remainder = divmod(rows, len(data_lines))
+    with open(target_path, "wb") as f:
+        f.write(head)
+        block = b"".join(data_lines)
+        for _ in range(repeats):
+            f.write(block)
+        f.write(b"".join(data_lines[:remainder]))
+
+
+def scale_workbook_fixture(fixture_path, target_path, rows):
+    """
+    Writes a copy of a workbook fixture whose data sheet rows are repeated until the copy has the given number of rows.
+    """
+    import openpyxl
+
+    source = openpyxl.load_workbook(fixture_path, read_only=True)
+    target = openpyxl.Workbook(write_only=True)
+    for sheet in source.worksheets:
+        sheet_rows = list(sheet.iter_rows(values_only=True))
+        target_sheet = target.create_sheet(sheet.title)
+        if sheet is not source.worksheets[-1]:
+            for row in sheet_rows:
+                target_sheet.append(row)
+            continue
+        target_sheet.append(sheet_rows[0])
+        data_rows = sheet_rows[1:]
+        for i in range(rows):
+            target_sheet.append(data_rows[i % len(data_rows)])
+    source.close()
+    target.save(target_path)
+
+
+def benchmark_file(file_path, repeat):
+    """
+    Reads a file repeat times and returns (reader name, rows, best seconds).
+    """
+    best, rows, name = float("inf"), 0, ""
+    for _ in range(repeat):
+        reader = reader_for(file_path)
+        start = time.perf_counter()
+        data = reader.read(file_path)
+        best = min(best, time.perf_counter() - start)
+        rows, name = len(data), reader.name
+    return name, rows, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Throughput of the cycler file readers on scaled fixture files.")
+    parser.add_argument("--rows", type=int, default=500_000, help="Rows of the scaled text files")
+    parser.add_argument("--xlsx-rows", type=int, default=20_000, help="Rows of the scaled workbook (slow to write)")
+    parser.add_argument("--repeat", type=int, default=3, help="Reads per file, the best time is reported")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        for name in sorted(os.listdir(FIXTURE_DIR)):
+            fixture_path = os.path.join(FIXTURE_DIR, name)
+            target_path = os.path.join(work_dir, name)
+            reader = reader_for(fixture_path)
+            if isinstance(reader, ExcelFileReader):
+                scale_workbook_fixture(fixture_path, target_path, args.xlsx_rows)
+            else:
+                scale_text_fixture(fixture_path, target_path, reader, args.rows)
+
+            reader_name, rows, seconds = benchmark_file(target_path, args.repeat)
+            size_mb = os.path.getsize(target_path) / 1024 ** 2
+            results.append((name, reader_name, rows, size_mb, seconds))
+
+    print()
+    print(f"{'File':<24}{'Reader':<11}{'Rows':>10}{'MB':>9}{'Seconds':>10}{'Rows/s':>13}{'MB/s':>9}")
+    for name, reader_name, rows, size_mb, seconds in results:
+        print(f"{name:<24}{reader_name:<11}{rows:>10,}{size_mb:>9.1f}{seconds:>10.3f}{rows / seconds:>13,.0f}{size_mb / seconds:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
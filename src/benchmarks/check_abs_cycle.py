@@ -0,0 +1,73 @@
+import io
+import os
+import sys
+import argparse
+import contextlib
+import numpy as np
+
+# Compares the vectorized compute_abs_cycle with the row loop of cyc_alg.calc_abs_cycle on random Cyc-Count series
+# Usage: python src/benchmarks/check_abs_cycle.py [--cases 2000] [--seed 0]
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_DIR = os.path.join(SRC_DIR, "h2f_F01_03")
+for path in (SRC_DIR, APP_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+with contextlib.redirect_stdout(io.StringIO()):
+    from cyc_alg import calc_abs_cycle  # Prints its example at import
+
+from cycle_tools import compute_abs_cycle
+
+
+def random_cyc_count(rng, max_runs=40):
+    """
+    Returns a random Cyc-Count series as float64 array: runs of held, counting, restarting (e.g. after a
+    continued test) and missing values, starting at any value.
+    """
+    values = []
+    value = float(rng.integers(0, 5))
+    for _ in range(rng.integers(1, max_runs)):
+        step = rng.choice(["next", "hold", "reset", "jump", "back", "nan"], p=[0.4, 0.15, 0.15, 0.1, 0.1, 0.1])
+        if step == "next":
+            value += 1
+        elif step == "reset":
+            value = float(rng.integers(0, 3))
+        elif step == "jump":
+            value += float(rng.integers(2, 5))
+        elif step == "back":
+            value = max(value - float(rng.integers(1, 3)), 0.0)
+        if step == "nan":
+            values.extend([np.nan] * int(rng.integers(1, 4)))
+        else:
+            values.extend([value] * int(rng.integers(1, 6)))
+    return np.asarray(values, dtype=np.float64)
+
+
+def check(cases, seed):
+    """
+    Returns the first Cyc-Count series on which both implementations differ, or None.
+    """
+    rng = np.random.default_rng(seed)
+    for _ in range(cases):
+        cyc_count = random_cyc_count(rng)
+        if rng.random() < 0.5 and not np.isnan(cyc_count).any():
+            cyc_count = cyc_count.astype(np.int64)  # Cyc-Count is an integer column without gaps
+        if not np.array_equal(compute_abs_cycle(cyc_count), np.asarray(calc_abs_cycle(cyc_count.tolist()), dtype=np.int64)):
+            return cyc_count
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fuzz check of compute_abs_cycle against cyc_alg.calc_abs_cycle.")
+    parser.add_argument("--cases", type=int, default=2000, help="Number of random Cyc-Count series")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the random series")
+    args = parser.parse_args()
+
+    mismatch = check(args.cases, args.seed)
+    if mismatch is not None:
+        sys.exit(f"❌ compute_abs_cycle differs from calc_abs_cycle for Cyc-Count {mismatch.tolist()}")
+    print(f"✅ compute_abs_cycle matches calc_abs_cycle on {args.cases:,} random series")
+
+
+if __name__ == "__main__":
+    main()
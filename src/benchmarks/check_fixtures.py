@@ -0,0 +1,55 @@
+import os
+import sys
+
+# Checks that every fixture layout imports to the canonical columns the filters need
+# Usage: python src/benchmarks/check_fixtures.py
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "h2f_F01_03")
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
+
+from reader_registry import reader_for
+from data_schema import apply_compact_schema, working_columns, COMMAND, CURRENT
+from processing import FilterPipeline
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# Filter options that read the Command column, with the sign of the current their rows must have
+COMMAND_FILTERS = {
+    "remove_pause": lambda current: current != 0,
+    "select_charge_half_cycle": lambda current: current > 0,
+    "select_discharge_half_cycle": lambda current: current < 0,
+}
+
+
+def check_fixture(file_path):
+    """
+    Imports a fixture with the working columns and applies each Command filter. Returns a list of problems.
+    """
+    problems = []
+    data, _ = apply_compact_schema(reader_for(file_path).read(file_path, columns=working_columns()))
+    if COMMAND not in data.columns:
+        return [f"no {COMMAND} column"]
+
+    for option, expected_sign in COMMAND_FILTERS.items():
+        filtered = data[FilterPipeline({option: True}).mask(data)[0]]
+        if filtered.empty:
+            problems.append(f"{option} keeps no rows")
+        elif not expected_sign(filtered[CURRENT].to_numpy()).all():
+            problems.append(f"{option} keeps rows with the wrong current sign")
+    if data[COMMAND].isna().any():
+        problems.append(f"{int(data[COMMAND].isna().sum())} rows without {COMMAND}")
+    return problems
+
+
+def main():
+    failed = 0
+    for name in sorted(os.listdir(FIXTURE_DIR)):
+        problems = check_fixture(os.path.join(FIXTURE_DIR, name))
+        failed += bool(problems)
+        print(f"{'❌' if problems else '✅'} {name}" + "".join(f"\n   {problem}" for problem in problems))
+    if failed:
+        sys.exit(f"{failed} fixture(s) failed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+import os
+import sys
+import gzip
+import time
+import argparse
+import numpy as np
+import pandas as pd
+
+# Generator of synthetic cycler exports in the layout of the app (12 "~" metadata lines, comma separated table)
+# Usage: python src/benchmarks/synthetic_data.py out/ --rows 10_000_000 --files 4 --electrode anode
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "h2f_F01_03")
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
+
+from data_schema import TIME, VOLTAGE, CURRENT, Q_CHARGE, Q_DISCHARGE, CYCLE, LINE, COMMAND
+
+EXPORT_COLUMNS = [TIME, "DataSet", "Date", LINE, COMMAND, VOLTAGE, CURRENT, "Ah[Ah]", Q_CHARGE, Q_DISCHARGE, CYCLE, "State"]
+BLOCK_ROWS = 200_000  # Rows generated and written at once, memory use does not depend on the file size
+
+# Program lines of the test plan: rest, then per cycle charge, rest, discharge, rest
+LINE_START_REST, LINE_CHARGE, LINE_CHARGE_REST, LINE_DISCHARGE, LINE_DISCHARGE_REST = 1, 2, 3, 4, 5
+
+
+def _sigmoid(x):
+    return 1.0 / (1.0 + np.exp(-x))
+
+
+def cathode_ocv(x):
+    """
+    Open circuit voltage of an NMC half cell vs. Li in V over the state of charge x (0..1).
+    """
+    x = np.clip(x, 0.0, 1.0)
+    return 3.55 + 0.6 * x + 0.12 * (x - 0.45) ** 3 + 0.04 * np.log((x + 0.02) / (1.02 - x))
+
+
+def anode_ocv(x):
+    """
+    Open circuit voltage of a graphite half cell vs. Li in V over the delithiation x (0..1),
+    with the staging plateaus at about 85, 120 and 200 mV and the steep rise at the end.
+    """
+    x = np.clip(x, 0.0, 1.0)
+    return (
+        0.085 + 0.03 * x + 0.035 * _sigmoid((x - 0.5) / 0.03) + 0.08 * _sigmoid((x - 0.85) / 0.02)
+        + 0.6 * np.exp((x - 1.0) / 0.025) - 0.02 * np.exp(-x / 0.02)
+    )
+
+
+OCV_CURVES = {"cathode": cathode_ocv, "anode": anode_ocv}
+
+
+class SyntheticCycler:
+    """
+    Simulates a constant current test of a half cell and streams it as cycler export.
+    Every cycle charges and discharges the capacity of the cycle (fading by `fade` per cycle) with rests in between.
+    The voltage follows the OCV curve of the electrode plus the IR drop, relaxes during rests and carries
+    Gaussian noise. Cyc-Count restarts at 1 every `reset_every` cycles, like after a change of the test program.
+    """
+
+    def __init__(
+        self, electrode="cathode", capacity=0.005, c_rate=0.5, cycles=10, sample_seconds=30.0, rest_minutes=30.0,
+        noise_mv=0.5, fade=0.002, resistance=2.0, reset_every=3, max_rows=None, seed=0, cell="synthetic_c1",
+        start_time="2024-01-05 10:00:00",
+    ):
+        if electrode not in OCV_CURVES:
+            raise ValueError(f"Unknown electrode '{electrode}', use one of {', '.join(OCV_CURVES)}.")
+        if cycles is None and max_rows is None:
+            raise ValueError("Either the number of cycles or the number of rows is needed.")
+        self.electrode = electrode
+        self.ocv = OCV_CURVES[electrode]
+        self.capacity = capacity
+        self.current = c_rate * capacity
+        self.cycles = cycles
+        self.sample_hours = sample_seconds / 3600
+        self.rest_hours = rest_minutes / 60
+        self.noise = noise_mv / 1000
+        self.fade = fade
+        self.resistance = resistance
+        self.reset_every = reset_every
+        self.max_rows = max_rows
+        self.seed = seed
+        self.cell = cell
+        self.start_time = pd.Timestamp(start_time)
+        # Decimals of the Ah columns, enough to resolve the charge of one sample (fast sampling gives tiny steps)
+        self.ah_decimals = max(6, int(np.ceil(-np.log10(self.current * self.sample_hours))) + 2)
+
+    def header_lines(self):
+        """
+        Returns the 12 "~" metadata lines written above the column header.
+        """
+        return [
+            f"~Cell: {self.cell}",
+            f"~Testplan: synthetic_{self.electrode}_cc",
+            f"~Channel: {self.seed + 1}",
+            f"~Start time: {self.start_time:%Y-%m-%d %H:%M:%S}",
+            "~Device: synthetic cycler",
+            f"~Electrode: {self.electrode}",
+            f"~Nominal capacity [Ah]: {self.capacity}",
+            f"~C-rate: {self.current / self.capacity:g}",
+            f"~Sample interval [s]: {self.sample_hours * 3600:g}",
+            f"~Rest [min]: {self.rest_hours * 60:g}",
+            f"~Noise [mV]: {self.noise * 1000:g}",
+            f"~Seed: {self.seed}",
+        ]
+
+    def cycle_capacity(self, cycle):
+        return self.capacity * (1.0 - self.fade) ** cycle
+
+    def steps(self):
+        """
+        Yields the steps of the test as (command, line, cycle index, duration in h, current in A).
+        """
+        yield "Pause", LINE_START_REST, 0, self.rest_hours, 0.0
+        cycle = 0
+        while self.cycles is None or cycle < self.cycles:
+            duration = self.cycle_capacity(cycle) / self.current
+            yield "Charge", LINE_CHARGE, cycle, duration, self.current
+            yield "Pause", LINE_CHARGE_REST, cycle, self.rest_hours, 0.0
+            yield "Discharge", LINE_DISCHARGE, cycle, duration, -self.current
+            yield "Pause", LINE_DISCHARGE_REST, cycle, self.rest_hours, 0.0
+            cycle += 1
+
+    def duration_hours(self):
+        """
+        Returns the duration of the whole test (cycles must be set).
+        """
+        return sum(step[3] for step in self.steps())
+
+    def blocks(self, block_rows=BLOCK_ROWS):
+        """
+        Yields the rows of the export as DataFrames of at most block_rows rows.
+        """
+        rng = np.random.default_rng(self.seed)
+        time_h, rows = 0.0, 0
+        soc, voltage = 0.0, float(self.ocv(0.0))
+        q_charge = q_discharge = 0.0
+        start_day = np.datetime64(self.start_time.date(), "D")
+
+        for command, line, cycle, duration, current in self.steps():
+            step_rows = max(int(round(duration / self.sample_hours)), 1)
+            if command == "Charge":
+                q_charge = q_discharge = 0.0  # Ah-Cyc counters restart with every cycle
+            cyc_count = cycle % self.reset_every + 1 if self.reset_every else cycle + 1
+            capacity = self.cycle_capacity(cycle)
+            rest_start_voltage = voltage
+
+            for offset in range(0, step_rows, block_rows):
+                if self.max_rows is not None:
+                    if rows >= self.max_rows:
+                        return
+                    count = min(block_rows, step_rows - offset, self.max_rows - rows)
+                else:
+                    count = min(block_rows, step_rows - offset)
+                elapsed = (np.arange(offset, offset + count) + 1) * self.sample_hours
+                step_ah = current * elapsed
+
+                if current > 0:
+                    block_soc = soc + step_ah / capacity
+                    ah_charge, ah_discharge = q_charge + step_ah, np.full(count, q_discharge)
+                elif current < 0:
+                    block_soc = soc + step_ah / capacity
+                    ah_charge, ah_discharge = np.full(count, q_charge), q_discharge - step_ah
+                else:
+                    block_soc = np.full(count, soc)
+                    ah_charge, ah_discharge = np.full(count, q_charge), np.full(count, q_discharge)
+
+                if current:
+                    block_voltage = self.ocv(block_soc) + current * self.resistance
+                else:
+                    # Relaxation towards the OCV with a time constant of a tenth of the rest
+                    target = float(self.ocv(soc))
+                    block_voltage = target + (rest_start_voltage - target) * np.exp(-elapsed / (0.1 * max(duration, 1e-9)))
+                block_voltage = block_voltage + rng.normal(0.0, self.noise, count) if self.noise else block_voltage
+
+                block_time = time_h + elapsed
+                days = (self.start_time.hour + self.start_time.minute / 60 + block_time) // 24
+                yield pd.DataFrame({
+                    TIME: np.round(block_time, 6),
+                    "DataSet": 1,
+                    "Date": (start_day + days.astype("timedelta64[D]")).astype(str),
+                    LINE: line,
+                    COMMAND: command,
+                    VOLTAGE: np.round(block_voltage, 5),
+                    CURRENT: round(current, 6),
+                    "Ah[Ah]": np.round(step_ah, self.ah_decimals),
+                    Q_CHARGE: np.round(ah_charge, self.ah_decimals),
+                    Q_DISCHARGE: np.round(ah_discharge, self.ah_decimals),
+                    CYCLE: cyc_count,
+                    "State": 0,
+                }, columns=EXPORT_COLUMNS)
+                rows += count
+                voltage = float(block_voltage[-1])
+
+            time_h += step_rows * self.sample_hours
+            if current > 0:
+                soc, q_charge = 1.0, q_charge + capacity
+            elif current < 0:
+                soc, q_discharge = 0.0, q_discharge + capacity
+
+    def write(self, file_path, block_rows=BLOCK_ROWS):
+        """
+        Streams the export to file_path (gzip compressed for .gz) and returns the number of rows written.
+        """
+        if file_path.endswith(".gz"):
+            target = gzip.open(file_path, "wt", compresslevel=1, encoding="utf-8", newline="")  # Fast level, files are large
+        else:
+            target = open(file_path, "w", encoding="utf-8", newline="")
+        rows = 0
+        with target as f:
+            f.write("\n".join(self.header_lines()) + "\n")
+            f.write(",".join(EXPORT_COLUMNS) + "\n")
+            for block in self.blocks(block_rows):
+                block.to_csv(f, header=False, index=False, lineterminator="\n")
+                rows += len(block)
+        return rows
+
+
+def plan_sampling(rows=None, cycles=None, sample_seconds=None, **params):
+    """
+    Returns (cycles, sample_seconds, max_rows) from any two of rows, cycles and sample interval:
+    - rows and cycles: the sample interval is chosen so the cycles fill the rows
+    - rows and sample interval: cycles are run until the rows are written
+    - otherwise the given or default cycles and sample interval, without a row limit
+    """
+    if rows is not None and cycles is not None and sample_seconds is not None:
+        raise ValueError("Give at most two of rows, cycles and sample interval.")
+    if rows is not None and cycles is not None:
+        duration = SyntheticCycler(cycles=cycles, **params).duration_hours()
+        steps = 4 * cycles + 1
+        return cycles, duration * 3600 / (rows + steps), rows  # Steps are rounded to whole rows, the surplus is cut off
+    if rows is not None:
+        return None, sample_seconds or 30.0, rows
+    return cycles or 10, sample_seconds or 30.0, None
+
+
+def generate_files(folder, count=1, rows=None, cycles=None, sample_seconds=None, compress=False, prefix=None, **params):
+    """
+    Writes count exports into folder. Every file is a different cell (seed and capacity vary by a few percent).
+    Returns the written paths.
+    """
+    os.makedirs(folder, exist_ok=True)
+    prefix = prefix or f"synthetic_{params.get('electrode', 'cathode')}"
+    base_capacity = params.pop("capacity", 0.005)
+    seed = params.pop("seed", 0)
+    paths = []
+    for i in range(count):
+        capacity = base_capacity * (1.0 + 0.03 * np.random.default_rng(seed + i).standard_normal())
+        file_cycles, file_sample_seconds, max_rows = plan_sampling(rows, cycles, sample_seconds, capacity=capacity, **params)
+        cycler = SyntheticCycler(
+            cycles=file_cycles, sample_seconds=file_sample_seconds, max_rows=max_rows, capacity=capacity, seed=seed + i,
+            cell=f"{prefix}_c{i + 1}", **params,
+        )
+        path = os.path.join(folder, f"{prefix}_c{i + 1}.txt" + (".gz" if compress else ""))
+        start = time.perf_counter()
+        written = cycler.write(path)
+        seconds = time.perf_counter() - start
+        size_mb = os.path.getsize(path) / 1024 ** 2
+        print(f"✅ {os.path.basename(path)}: {written:,} rows, {size_mb:,.1f} MB in {seconds:.1f} s ({size_mb / seconds:,.1f} MB/s)")
+        paths.append(path)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Writes synthetic cycler exports for benchmarks and load tests.")
+    parser.add_argument("folder", help="Output folder")
+    parser.add_argument("--files", type=int, default=1, help="Number of files (cells)")
+    parser.add_argument("--rows", type=int, default=None, help="Rows per file")
+    parser.add_argument("--cycles", type=int, default=None, help="Cycles per file (default 10)")
+    parser.add_argument("--sample-seconds", type=float, default=None, help="Sample interval in s (default 30)")
+    parser.add_argument("--electrode", choices=sorted(OCV_CURVES), default="cathode", help="OCV curve of the half cell")
+    parser.add_argument("--capacity", type=float, default=0.005, help="Nominal capacity in Ah")
+    parser.add_argument("--c-rate", type=float, default=0.5, help="Charge and discharge current in C")
+    parser.add_argument("--rest-minutes", type=float, default=30.0, help="Rest after every half cycle in min")
+    parser.add_argument("--noise-mv", type=float, default=0.5, help="Standard deviation of the voltage noise in mV")
+    parser.add_argument("--fade", type=float, default=0.002, help="Capacity loss per cycle")
+    parser.add_argument("--reset-every", type=int, default=3, help="Cycles after which Cyc-Count restarts at 1 (0: never)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the first file")
+    parser.add_argument("--gzip", action="store_true", help="Write .txt.gz files")
+    args = parser.parse_args()
+
+    generate_files(
+        args.folder, args.files, rows=args.rows, cycles=args.cycles, sample_seconds=args.sample_seconds,
+        compress=args.gzip, electrode=args.electrode, capacity=args.capacity, c_rate=args.c_rate,
+        rest_minutes=args.rest_minutes, noise_mv=args.noise_mv, fade=args.fade, reset_every=args.reset_every, seed=args.seed,
+    )
+
+
+if __name__ == "__main__":
+    main()
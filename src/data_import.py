@@ -1,32 +1,33 @@
 # Import the necessary libraries
+import os
+import sys
 import pandas as pd
 import matplotlib
 matplotlib.use('TkAgg')
 import matplotlib.pyplot as plt
 
+# Canonical column names and unit conversions of the app
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "h2f_F01_03")
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
+
+from data_schema import TIME, VOLTAGE, normalize_columns
+
 def import_data(file_path):
-    # Read file to determine metadata lines
-    with open(file_path, 'r', encoding='utf-8', errors='replace') as file:
-        lines = file.readlines()
-    
-    # Determine number of metadata lines to skip
-    skip_lines = sum(1 for line in lines if line.startswith("~"))
-    
-    # Read data into DataFrame, skipping metadata lines
-    data = pd.read_csv(file_path, skiprows=skip_lines, delimiter=',', encoding='utf-8', on_bad_lines='skip')
+    with open(file_path, 'rb') as file:
+        # Skip the metadata lines by reading only the file prefix up to the column header
+        position = file.tell()
+        line = file.readline()
+        while line.startswith(b"~") or (line and not line.strip()):
+            position = file.tell()
+            line = file.readline()
+        file.seek(position)
+
+        # Read data into DataFrame from the column header on (single pass over the file)
+        data = pd.read_csv(file, delimiter=',', encoding='utf-8', on_bad_lines='skip')
     
-    # Rename columns for convenience
-    data = data.rename(columns=lambda x: x.strip())  # Remove any leading/trailing whitespace from column names
-    columns_to_rename = {
-        'Time[h]': 'Time',
-        'U[V]': 'Voltage',
-        'I[A]': 'Current',
-        'Ah[Ah]': 'Charge_Ah',
-        'Wh[Wh]': 'Energy_Wh',
-        'T1[°C]': 'Temperature'
-    }
-    data = data.rename(columns=columns_to_rename)
-    return data
+    # Canonical column names and units (also strips leading/trailing whitespace from column names)
+    return normalize_columns(data)
 
 
 
@@ -39,7 +40,7 @@ print(data.head())
 
 # Plot Time vs Voltage
 plt.figure(figsize=(10, 6))
-plt.plot(data['Time'], data['Voltage'], label='Voltage')
+plt.plot(data[TIME], data[VOLTAGE], label='Voltage')
 plt.xlabel('Time (hours)')
 plt.ylabel('Voltage (V)')
 plt.title('Time vs Voltage (Real Dataset)')
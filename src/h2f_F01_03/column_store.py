@@ -0,0 +1,84 @@
+import os
+import json
+import shutil
+import numpy as np
+import pandas as pd
+from settings import DataSettings
+from data_cache import DatasetCache
+
+
+class ColumnStore(DatasetCache):
+    """
+    On-disk store of raw datasets with one .npy file per column in a directory per imported file.
+    Loaded datasets are DataFrames over memory-mapped columns: the OS page cache decides which parts stay resident
+    and several GUI or batch processes share the same pages. Keys, index and eviction are the ones of DatasetCache.
+    """
+
+    MANIFEST_FILE = "columns.json"
+    memory_mapped = True
+
+    def __init__(self, cache_dir=None, max_bytes=None):
+        super().__init__(cache_dir or os.path.join(DataSettings.CACHE_DIR, "columns"), max_bytes)
+
+    def _sidecar_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.columns")
+
+### sidecar format
+
+    def format_available(self):
+        return True  # Needs NumPy only
+
+    def _read_sidecar(self, sidecar_path):
+        """
+        Returns a DataFrame whose columns are copy-on-write memory maps of the column files (no data is read here).
+        """
+        with open(os.path.join(sidecar_path, self.MANIFEST_FILE), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+
+        columns = {}
+        for entry in manifest["columns"]:
+            values = self._map_column(os.path.join(sidecar_path, entry["file"]))
+            if "categories" in entry:
+                values = pd.Categorical.from_codes(values, categories=entry["categories"], ordered=entry["ordered"])
+            columns[entry["name"]] = values
+        return pd.DataFrame(columns, copy=False)
+
+    @staticmethod
+    def _map_column(column_path):
+        try:
+            # Writes to the arrays stay private to the process and never reach the file
+            return np.load(column_path, mmap_mode="c")
+        except ValueError:  # Empty columns cannot be mapped
+            return np.load(column_path)
+
+    def _write_sidecar(self, data, sidecar_path):
+        """
+        Writes every column as .npy file. Text columns are stored as categorical codes, their categories go into the manifest.
+        """
+        tmp_path = f"{sidecar_path}.tmp"
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        os.makedirs(tmp_path)
+
+        manifest = {"rows": len(data), "columns": []}
+        for i, col in enumerate(data.columns):
+            values = data[col]
+            entry = {"name": str(col), "file": f"{i}.npy"}
+            array = None if isinstance(values.dtype, pd.CategoricalDtype) else values.to_numpy()
+            if array is None or array.dtype == object:
+                categorical = values.astype("category").cat
+                array = categorical.codes.to_numpy()
+                entry["categories"] = categorical.categories.tolist()
+                entry["ordered"] = bool(categorical.ordered)
+            np.save(os.path.join(tmp_path, entry["file"]), np.ascontiguousarray(array), allow_pickle=False)
+            manifest["columns"].append(entry)
+
+        with open(os.path.join(tmp_path, self.MANIFEST_FILE), "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+        shutil.rmtree(sidecar_path, ignore_errors=True)
+        os.replace(tmp_path, sidecar_path)
+
+    def _sidecar_bytes(self, sidecar_path):
+        return sum(entry.stat().st_size for entry in os.scandir(sidecar_path))
+
+    def _remove_sidecar(self, sidecar_path):
+        shutil.rmtree(sidecar_path, ignore_errors=True)
@@ -0,0 +1,163 @@
+import numpy as np
+import pandas as pd
+from data_schema import TIME, CYCLE, COMMAND, concat_datasets
+
+
+def compute_abs_cycle(cyc_count):
+    """
+    Returns the absolute cycle of every row as int64 array, with the same result as the row loop of
+    cyc_alg.calc_abs_cycle:
+    - rows of one run (consecutive equal Cyc-Count values) share one absolute cycle
+    - a new run increments the absolute cycle, unless its value equals the current absolute cycle
+    Runs are found by change detection and the absolute cycles are the cumsum of the increments of the runs.
+    """
+    values = np.asarray(cyc_count)
+    if len(values) == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    # First row of every run (NaN never equals its neighbour, like in the row loop)
+    run_starts = np.flatnonzero(np.r_[True, values[1:] != values[:-1]])
+    run_values = values[run_starts]
+    run_lengths = np.diff(np.r_[run_starts, len(values)])
+
+    # The first run starts at cycle 1 only if its value is 1, every later run increments unless it is held
+    first_cycle = 1 if run_values[0] == 1 else 2
+    increments = np.ones(len(run_values), dtype=np.int64)
+    increments[0] = first_cycle
+    increments[1:][_held_runs(run_values, first_cycle)] = 0
+    return np.repeat(np.cumsum(increments), run_lengths)
+
+
+def _held_runs(run_values, first_cycle):
+    """
+    Returns the positions (among the runs after the first) of the runs that keep the absolute cycle.
+    With k runs held before run i, run i is held if its value equals first_cycle + (i - 1) - k, i.e. if
+    gap[i] = first_cycle + (i - 1) - value equals k. The held runs are therefore the first run with gap 0,
+    the first later run with gap 1 and so on, found by one binary search per held run (not one step per run).
+    """
+    gaps = first_cycle + np.arange(len(run_values) - 1) - run_values[1:]
+    candidates = np.flatnonzero(np.isfinite(gaps) & (gaps >= 0) & (gaps == np.round(gaps)))
+    if len(candidates) == 0:
+        return candidates
+
+    # Candidate runs grouped by gap, in run order within each gap
+    order = np.lexsort((candidates, gaps[candidates]))
+    positions = candidates[order]
+    candidate_gaps = gaps[positions].astype(np.int64)
+    group_starts = np.searchsorted(candidate_gaps, np.arange(candidate_gaps[-1] + 2))
+
+    held, position = [], 0
+    for gap in range(candidate_gaps[-1] + 1):
+        group = positions[group_starts[gap]:group_starts[gap + 1]]
+        next_run = np.searchsorted(group, position)
+        if next_run == len(group):
+            break
+        position = int(group[next_run])
+        held.append(position)
+        position += 1
+    return np.asarray(held, dtype=np.int64)
+
+
+class CycleSegmentIndex:
+    """
+    Start and end row offsets of the segments of a dataset: runs of consecutive rows with one cycle value and
+    one Command. Built once per dataset with a single change detection pass, it turns cycle and half cycle
+    selection into slices of the segments instead of comparing every row, and lists the cycles without a
+    unique() scan. Rows with a missing cycle value are segments of their own (like in compute_abs_cycle).
+    """
+
+    def __init__(self, data, cycle_column=CYCLE, command_column=COMMAND):
+        self.column = cycle_column
+        self.rows = len(data)
+        cycles = data[cycle_column].to_numpy() if cycle_column in data.columns else np.full(len(data), np.nan)
+        changes = cycles[1:] != cycles[:-1]
+        commands = data[command_column] if command_column in data.columns else None
+        if commands is not None:
+            codes = commands.cat.codes.to_numpy() if isinstance(commands.dtype, pd.CategoricalDtype) else pd.factorize(commands)[0]
+            changes |= codes[1:] != codes[:-1]
+
+        self.starts = np.flatnonzero(np.r_[True, changes]) if len(data) else np.zeros(0, dtype=np.int64)
+        self.ends = np.r_[self.starts[1:], len(data)].astype(np.int64)
+        self.cycles = cycles[self.starts]
+        self.commands = commands.iloc[self.starts].reset_index(drop=True) if commands is not None else None
+
+    def __len__(self):
+        return len(self.starts)
+
+    def cycle_values(self):
+        """
+        Returns the sorted distinct cycle values (for the cycle dropdown).
+        """
+        return np.unique(self.cycles[~pd.isna(self.cycles)]).tolist()
+
+    def row_mask(self, segment_mask):
+        """
+        Expands a boolean mask over the segments to a mask over the rows.
+        """
+        return np.repeat(segment_mask, self.ends - self.starts)
+
+    def row_slices(self, segment_mask):
+        """
+        Returns the selected rows as list of slices; adjacent selected segments form one slice.
+        """
+        edges = np.diff(np.r_[0, segment_mask.astype(np.int8), 0])
+        first, last = np.flatnonzero(edges == 1), np.flatnonzero(edges == -1) - 1
+        return [slice(int(self.starts[i]), int(self.ends[j])) for i, j in zip(first, last)]
+
+    def cycle_rows(self):
+        """
+        Returns {cycle value: rows} in cycle order, rows as slice for cycles of one block of rows or as positions,
+        the grouping of 'Show Cycles' without sorting the rows.
+        """
+        valid = np.flatnonzero(~pd.isna(self.cycles))
+        order = valid[np.argsort(self.cycles[valid], kind="stable")]  # Segments by cycle, in row order per cycle
+        values = self.cycles[order]
+        bounds = np.flatnonzero(np.r_[True, values[1:] != values[:-1], True])
+        groups = {}
+        for first, last in zip(bounds[:-1], bounds[1:]):
+            segments = order[first:last]
+            if segments[-1] - segments[0] == len(segments) - 1:
+                groups[values[first].item()] = slice(int(self.starts[segments[0]]), int(self.ends[segments[-1]]))
+            else:
+                groups[values[first].item()] = np.concatenate([np.arange(self.starts[i], self.ends[i]) for i in segments])
+        return groups
+
+    def reduce_max(self, values):
+        """
+        Returns the maximum of values (one per row) per segment, ignoring missing values.
+        """
+        values = np.asarray(values)
+        if len(self.starts) == 0:
+            return values[:0]
+        return np.fmax.reduceat(values, self.starts)
+
+
+def stitch_datasets(parts, source_names=None, time_column=TIME, cycle_column=CYCLE):
+    """
+    Combines the datasets of a test run that was split across several export files into one dataset.
+    Every part continues time and cycle count of the part before it:
+    - time_column is offset by the last time of the previous part
+    - cycle_column is offset by the highest cycle count of the previous part
+    With source_names a categorical "Source" column records the file of every row.
+    """
+    continued = []
+    time_offset, cycle_offset = 0.0, 0
+    for part in parts:
+        offsets = {}
+        if time_column in part.columns and len(part):
+            offsets[time_column] = part[time_column].to_numpy(dtype=np.float64) + time_offset
+        if cycle_column in part.columns and len(part):
+            cycles = part[cycle_column].to_numpy()
+            offsets[cycle_column] = cycles.astype(np.int64 if np.issubdtype(cycles.dtype, np.integer) else np.float64) + cycle_offset
+        continued.append(part.assign(**offsets) if offsets else part)
+
+        if time_column in offsets:
+            time_offset = float(offsets[time_column][-1])
+        if cycle_column in offsets:
+            cycle_offset = int(np.nanmax(offsets[cycle_column]))
+
+    data = concat_datasets(continued)
+    if source_names is not None:
+        codes = np.repeat(np.arange(len(parts)), [len(part) for part in parts])
+        data["Source"] = pd.Categorical.from_codes(codes, categories=list(source_names))
+    return data
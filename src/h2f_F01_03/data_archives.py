@@ -0,0 +1,161 @@
+import io
+import os
+import gzip
+import zipfile
+from contextlib import contextmanager, ExitStack
+
+try:
+    import zstandard
+except ImportError:  # .zst archives can only be read with zstandard installed
+    zstandard = None
+
+CYCLER_FILE_SUFFIXES = (".txt", ".csv", ".tsv", ".mpt", ".xlsx")
+ARCHIVE_SUFFIXES = (".gz", ".zst", ".zip")
+MEMBER_SEPARATOR = "::"  # "campaign.zip::cell_01.txt" addresses a member of a zip archive
+
+
+def split_member(path):
+    """
+    Splits "archive.zip::member" into (archive path, member name). Member is None for other paths.
+    """
+    if MEMBER_SEPARATOR in path:
+        archive_path, member = path.split(MEMBER_SEPARATOR, 1)
+        return archive_path, member
+    return path, None
+
+
+def member_path(archive_path, member):
+    return f"{archive_path}{MEMBER_SEPARATOR}{member}"
+
+
+def is_archive(path):
+    return split_member(path)[0].lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def display_name(path):
+    """
+    Returns the file name shown in the UI, including the member of a zip archive.
+    """
+    archive_path, member = split_member(path)
+    return os.path.basename(archive_path) if member is None else f"{os.path.basename(archive_path)}{MEMBER_SEPARATOR}{member}"
+
+
+def base_name(path):
+    """
+    Returns the file name without archive and cycler suffixes (e.g. "cell_01" for "campaign.zip::cell_01.txt").
+    """
+    archive_path, member = split_member(path)
+    name = os.path.basename(member if member is not None else archive_path)
+    for suffixes in (ARCHIVE_SUFFIXES, CYCLER_FILE_SUFFIXES):
+        if name.lower().endswith(suffixes):
+            name = os.path.splitext(name)[0]
+    return name
+
+
+def source_exists(path):
+    return os.path.exists(split_member(path)[0])
+
+
+def source_size(path):
+    """
+    Returns the size of the file on disk (the compressed size for archives and zip members).
+    """
+    archive_path, member = split_member(path)
+    if member is not None:
+        with zipfile.ZipFile(archive_path) as archive:
+            return archive.getinfo(member).compress_size
+    return os.path.getsize(archive_path)
+
+
+def list_zip_members(archive_path):
+    """
+    Returns the cycler files inside a zip archive.
+    """
+    with zipfile.ZipFile(archive_path) as archive:
+        return [info.filename for info in archive.infolist() if not info.is_dir() and info.filename.lower().endswith(CYCLER_FILE_SUFFIXES)]
+
+
+def list_cycler_files(folder):
+    """
+    Returns the cycler files of a folder: plain .txt/.csv files, .gz/.zst compressed files and
+    every cycler file inside a zip archive (as "archive.zip::member").
+    """
+    file_paths = []
+    for name in sorted(os.listdir(folder)):
+        path = os.path.join(folder, name)
+        lower_name = name.lower()
+        if not os.path.isfile(path):
+            continue
+        if lower_name.endswith(".zip"):
+            file_paths.extend(member_path(path, member) for member in list_zip_members(path))
+        elif lower_name.endswith(CYCLER_FILE_SUFFIXES) or lower_name.endswith(ARCHIVE_SUFFIXES):
+            file_paths.append(path)
+    return file_paths
+
+
+def uncompressed_size_hint(path):
+    """
+    Estimates the decompressed size of a file without decompressing it (used to preallocate the import buffers).
+    """
+    archive_path, member = split_member(path)
+    lower_path = archive_path.lower()
+    compressed_size = os.path.getsize(archive_path)
+
+    if lower_path.endswith(".zip"):
+        with zipfile.ZipFile(archive_path) as archive:
+            return archive.getinfo(member or _single_member(archive_path)).file_size
+    if lower_path.endswith(".gz"):
+        # The gzip trailer stores the size modulo 4 GiB
+        with open(archive_path, "rb") as f:
+            f.seek(-4, os.SEEK_END)
+            size = int.from_bytes(f.read(4), "little")
+        while size < compressed_size:
+            size += 2 ** 32
+        return size
+    if lower_path.endswith(".zst") and zstandard is not None:
+        with open(archive_path, "rb") as f:
+            content_size = zstandard.frame_content_size(f.read(18))
+        if content_size > 0:
+            return content_size
+        return compressed_size * 8  # Typical ratio of cycler text exports
+    return compressed_size
+
+
+@contextmanager
+def open_source(path):
+    """
+    Opens a cycler file as binary stream, decompressing .gz, .zst and zip members on the fly (no temporary files).
+    Yields (stream, raw_file): raw_file is the file on disk, its position gives the compressed bytes read so far.
+    """
+    archive_path, member = split_member(path)
+    lower_path = archive_path.lower()
+    with ExitStack() as stack:
+        raw_file = stack.enter_context(open(archive_path, "rb"))
+
+        if lower_path.endswith(".zip"):
+            archive = stack.enter_context(zipfile.ZipFile(raw_file))
+            stream = stack.enter_context(archive.open(member or _single_member(archive_path)))
+        elif lower_path.endswith(".gz"):
+            stream = stack.enter_context(gzip.GzipFile(fileobj=raw_file))
+        elif lower_path.endswith(".zst"):
+            if zstandard is None:
+                raise ValueError("Reading .zst files needs the zstandard package (pip install zstandard).")
+            # Buffered for readline(), which the zstd reader does not provide
+            stream = stack.enter_context(io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(raw_file, closefd=False)))
+        else:
+            stream = raw_file
+
+        yield stream, raw_file
+
+
+def _single_member(archive_path):
+    """
+    Returns the only cycler file of a zip archive, archives with several files need an explicit member.
+    """
+    members = list_zip_members(archive_path)
+    if len(members) != 1:
+        raise ValueError(
+            f"{os.path.basename(archive_path)} contains {len(members)} cycler files, "
+            f"please choose one (e.g. {member_path(os.path.basename(archive_path), members[0]) if members else 'archive.zip::file.txt'})."
+        )
+    return members[0]
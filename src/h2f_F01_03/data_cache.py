@@ -0,0 +1,214 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from settings import DataSettings
+from data_reader import CyclerFileHeader
+from data_archives import split_member
+
+try:
+    import pyarrow.feather as feather
+except ImportError:  # Cache is disabled without pyarrow
+    feather = None
+
+
+def content_hash(file_path, size=None):
+    """
+    Returns a hash of the head, middle and tail blocks of a file (see DataSettings.CACHE_HASH_BLOCK_BYTES).
+    """
+    size = os.path.getsize(file_path) if size is None else size
+    block = DataSettings.CACHE_HASH_BLOCK_BYTES
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as f:
+        for position in (0, max(size // 2 - block // 2, 0), max(size - block, 0)):
+            f.seek(position)
+            digest.update(f.read(block))
+    return digest.hexdigest()
+
+
+def full_content_hash(file_path):
+    """
+    Returns a hash of the whole file content, read block by block.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(DataSettings.CACHE_HASH_BLOCK_BYTES), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class DatasetCache:
+    """
+    Columnar (Feather) sidecar cache for imported cycler files.
+    Sidecars are keyed by path, size, mtime and a content hash and evicted least recently used first.
+    """
+
+    INDEX_FILE = "index.json"
+    memory_mapped = False  # True if loaded DataFrames are views of the sidecar files instead of copies
+
+    def __init__(self, cache_dir=None, max_bytes=None):
+        self.cache_dir = cache_dir or DataSettings.CACHE_DIR
+        self.max_bytes = max_bytes or DataSettings.CACHE_MAX_BYTES
+        self.enabled = DataSettings.CACHE_ENABLED and self.format_available()
+        if DataSettings.CACHE_ENABLED and not self.enabled:
+            print("⚠️ pyarrow is not installed, the dataset cache is disabled.")
+        self._index = None
+        self._lock = threading.RLock()  # Background loads of several slots share the index
+
+### keys
+
+    def fingerprint(self, file_path):
+        """
+        Returns the cache key of a file from path, size, mtime and a hash of its head, middle and tail.
+        Members of a zip archive are keyed by the archive file and the member name.
+        """
+        archive_path, member = split_member(file_path)
+        stat = os.stat(archive_path)
+        key = f"{self._source(file_path)}|{stat.st_size}|{stat.st_mtime_ns}|{content_hash(archive_path, stat.st_size)}"
+        return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
+    @staticmethod
+    def _source(file_path):
+        archive_path, member = split_member(file_path)
+        return os.path.abspath(archive_path) if member is None else f"{os.path.abspath(archive_path)}::{member}"
+
+    def _sidecar_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.feather")
+
+### sidecar format
+
+    def format_available(self):
+        return feather is not None
+
+    def _read_sidecar(self, sidecar_path):
+        # Uncompressed Feather files are memory-mapped instead of parsed
+        return feather.read_feather(sidecar_path, memory_map=True)
+
+    def _write_sidecar(self, data, sidecar_path):
+        tmp_path = f"{sidecar_path}.tmp"
+        feather.write_feather(data.reset_index(drop=True), tmp_path, compression="uncompressed")
+        os.replace(tmp_path, sidecar_path)
+
+    def _sidecar_bytes(self, sidecar_path):
+        return os.path.getsize(sidecar_path)
+
+    def _remove_sidecar(self, sidecar_path):
+        try:
+            os.remove(sidecar_path)
+        except OSError:
+            pass
+
+### index handling
+
+    def _load_index(self):
+        if self._index is None:
+            index_path = os.path.join(self.cache_dir, self.INDEX_FILE)
+            try:
+                with open(index_path, "r", encoding="utf-8") as f:
+                    self._index = json.load(f)
+            except (OSError, ValueError):
+                self._index = {}
+        return self._index
+
+    def _save_index(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        index_path = os.path.join(self.cache_dir, self.INDEX_FILE)
+        tmp_path = f"{index_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._index, f, indent=2)
+        os.replace(tmp_path, index_path)
+
+### load / store
+
+    def load(self, file_path):
+        """
+        Returns (data, header, info) from the sidecar of the file, or None if there is no valid sidecar.
+        """
+        if not self.enabled:
+            return None
+
+        key = self.fingerprint(file_path)
+        sidecar_path = self._sidecar_path(key)
+        with self._lock:
+            entry = self._load_index().get(key)
+            if entry is None or not os.path.exists(sidecar_path):
+                return None
+
+        try:
+            data = self._read_sidecar(sidecar_path)
+        except Exception as e:
+            print(f"⚠️ Dropping unreadable cache entry for {file_path}: {e}")
+            with self._lock:
+                self._remove(key)
+                self._save_index()
+            return None
+
+        with self._lock:
+            entry["last_access"] = time.time()
+            self._save_index()
+        return data, CyclerFileHeader.from_dict(entry.get("header", {})), entry.get("info", {})
+
+    def store(self, file_path, data, header=None, info=None):
+        """
+        Writes the sidecar of a file and evicts old entries if the cache exceeds its size limit.
+        info is a JSON serializable dictionary returned again by load().
+        """
+        if not self.enabled:
+            return
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            key = self.fingerprint(file_path)
+            sidecar_path = self._sidecar_path(key)
+            self._write_sidecar(data, sidecar_path)
+        except Exception as e:
+            print(f"⚠️ Failed to write cache entry for {file_path}: {e}")
+            return
+
+        with self._lock:
+            index = self._load_index()
+            # Older sidecars of the same source file are outdated now
+            for old_key in [k for k, entry in index.items() if entry["source"] == self._source(file_path) and k != key]:
+                self._remove(old_key)
+
+            index[key] = {
+                "source": self._source(file_path),
+                "bytes": self._sidecar_bytes(sidecar_path),
+                "last_access": time.time(),
+                "header": header.to_dict() if header is not None else {},
+                "info": info or {},
+            }
+            self._evict()
+            self._save_index()
+
+### maintenance
+
+    def _remove(self, key):
+        self._load_index().pop(key, None)
+        self._remove_sidecar(self._sidecar_path(key))
+
+    def _evict(self):
+        """
+        Removes least recently used sidecars until the cache fits into max_bytes.
+        """
+        index = self._load_index()
+        total_bytes = sum(entry["bytes"] for entry in index.values())
+        for key in sorted(index, key=lambda k: index[k]["last_access"]):
+            if total_bytes <= self.max_bytes:
+                break
+            total_bytes -= index[key]["bytes"]
+            print(f"Evicting cache entry for {index[key]['source']}")
+            self._remove(key)
+
+    def clear(self):
+        """
+        Removes all sidecars of the cache.
+        """
+        with self._lock:
+            for key in list(self._load_index()):
+                self._remove(key)
+            self._save_index()
+
+    def size_bytes(self):
+        return sum(entry["bytes"] for entry in self._load_index().values())
@@ -1,10 +1,27 @@
 import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import tkinter as tk
 from tkinter import filedialog, messagebox
 import matplotlib.pyplot as plt
 import numpy as np
-from scipy.interpolate import interp1d
+from data_reader import LoadCancelled
+from data_cache import DatasetCache
+from column_store import ColumnStore
+from settings import DataSettings
+from data_schema import TIME, VOLTAGE, CURRENT, Q_CHARGE, Q_DISCHARGE, CYCLE, COMMAND, ABS_CYCLE
+from data_schema import apply_compact_schema, append_rows, schema_signature, memory_report_table, working_columns
+from reader_registry import reader_for
+from data_archives import source_exists, source_size, display_name, base_name, list_zip_members, member_path
+from cycle_tools import stitch_datasets, compute_abs_cycle, CycleSegmentIndex
+from metadata_catalog import MetadataCatalog
+from processing import ProcessingError, process_dataset, required_columns, uses_abs_cycle, step_change_filter, add_abs_cycle, linear_spline
+from processing import key_values, filter_suffix, modification_suffix, datatype_suffix, output_filename, result_to_save
+from data_validation import validate_dataset, repair_dataset, quality_report_text
+from dataset_pool import DatasetPool
+from result_cache import ResultCache
 
 
 class DataManager:
@@ -17,14 +34,24 @@ class DataManager:
         print("DEBUG: DataManager initialized. self.app:", self.app)
         print("DEBUG: DataManager initialized. self.app.filter_widgets:", getattr(self.app, "filter_widgets", None))
         
-        # Datasets dictionary
+        # Datasets dictionary: the shown (active) dataset of every slot and the pool keys of all datasets the slot holds
         self.datasets = {
-            "anode": {"data": None, "file_path": tk.StringVar(value="No file selected")},
-            "cathode": {"data": None, "file_path": tk.StringVar(value="No file selected")},
-            "full_cell": {"data": None, "file_path": tk.StringVar(value="No file selected")},            
+            dataset_type: {
+                "data": None, "members": [], "pool_key": None,
+                "file_path": tk.StringVar(value="No file selected"), "active_member": tk.StringVar(value=""),
+                "load_status": tk.StringVar(value=""), "metadata_label": tk.StringVar(value=""),
+            }
+            for dataset_type in ("anode", "cathode", "full_cell")
         }
+        self.result_cache = ResultCache()  # Filter/fit results of repeated actions on unchanged settings
+        self.pool = DatasetPool(on_release=self.result_cache.invalidate)  # Raw datasets of all slots, stored once per file content
         self.filtered_datasets = {"anode": [], "cathode": [], "full_cell": []}
         self.modified_datasets = {"anode": None, "cathode": None, "full_cell": None}
+        # Columnar sidecars of already imported files, or memory-mapped raw columns shared with other processes
+        self.cache = ColumnStore() if DataSettings.CACHE_FORMAT == "npy" else DatasetCache()
+        self.metadata_catalog = MetadataCatalog()  # Indexed cells_meta workbook
+        self.active_loads = {}  # Background loads per dataset type
+        self.followed = {}  # Pending follow updates (Tk after ids) per dataset type
 
 ### data import and quick check methods
 
@@ -37,51 +64,683 @@ class DataManager:
         Loads a dataset from a file and updates the application state.
         """
         try:
-            # Load dataset
-            data = pd.read_csv(file_path, skiprows=12, delimiter=",", encoding="utf-8", on_bad_lines="skip")
-            self.datasets[dataset_type]["data"] = data
-            self.datasets[dataset_type]["file_path"].set(os.path.basename(file_path))  # Update UI label
+            # Load dataset from the sidecar cache or in chunks with explicit dtypes
+            data, header, info, load_summary = self._read_dataset(file_path)
+            self._apply_loaded_dataset(dataset_type, file_path, data, header, info)
+            messagebox.showinfo("Success", f"{dataset_type.capitalize()} dataset loaded.\n{load_summary}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load {dataset_type} dataset: {e}")
 
+    def _apply_loaded_dataset(self, dataset_type, file_path, data, header, info=None, resolution="full", append=False):
+        """
+        Stores a loaded dataset and updates the dependent widgets. Must run on the Tk thread.
+        resolution is "preview" for a decimated subset that is replaced once the full data is loaded.
+        Full datasets go into the pool; with append the slot keeps its other datasets, otherwise they are released.
+        """
+        if resolution == "preview":
+            self._show_dataset(dataset_type, {"key": None, "name": display_name(file_path), "data": data, "header": header, "info": {}, "source_path": file_path, "resolution": resolution})
+            return
 
-            '''
-                # ✅ Update cycle dropdown options dynamically
-                if "Cyc-Count" in data.columns:
-                    unique_cycles = sorted(data["Cyc-Count"].unique())
+        info = info or {}
+        key = info.get("pool_key") or self.pool.key_for(info.get("source_files", [file_path]))
+        entry = self.pool.add(key, data, header, info, file_path)
+        members = self.datasets[dataset_type]["members"]
+        if key not in members:
+            self.pool.acquire(key)
+            members.append(key)
+        if not append:
+            for old_key in [member for member in members if member != key]:
+                self.pool.release(old_key)
+            members[:] = [key]
+        self._show_dataset(dataset_type, entry)
+
+    def _show_dataset(self, dataset_type, entry):
+        """
+        Makes a pool entry (or a preview) the shown dataset of a slot and updates the dependent widgets.
+        """
+        dataset = self.datasets[dataset_type]
+        dataset["data"] = entry["data"]
+        dataset["resolution"] = entry["resolution"]
+        dataset["header"] = entry["header"]  # Parsed "~" metadata block
+        dataset["info"] = entry["info"]  # Import reports (e.g. memory report)
+        dataset["source_path"] = entry["source_path"]
+        dataset["pool_key"] = entry["key"]
+        members = dataset["members"]
+        position = f" [{members.index(entry['key']) + 1} of {len(members)}]" if len(members) > 1 and entry["key"] in members else ""
+        dataset["file_path"].set(entry["name"] + position)  # Update UI label
+        dataset["active_member"].set(self.member_names(dataset_type)[members.index(entry["key"])] if entry["key"] in members else "")
+        self._update_metadata(dataset_type, entry["source_path"])
+        data = entry["data"]
+
+        # ✅ Check which cycle column is available
+        cycle_column = CYCLE if CYCLE in data.columns else ABS_CYCLE if ABS_CYCLE in data.columns else None
+
+        if cycle_column:
+            cycles = self.segment_index(dataset_type, cycle_column, entry).cycle_values()
+
+            # ✅ Dynamically update the correct filter widget
+            if dataset_type in self.app.filter_widgets:
+                self.app.filter_widgets[dataset_type].update_cycle_options(cycles)
+
+        # ✅ Update ModifyDataWidget dropdown
+        self.update_modify_widgets(dataset_type)
+
+    def _update_metadata(self, dataset_type, file_path):
+        """
+        Looks up the cell metadata of the loaded file in the metadata catalog and shows it next to the file.
+        """
+        try:
+            metadata = self.metadata_catalog.by_datafile(file_path)
+        except Exception as e:
+            print(f"⚠️ Metadata lookup failed: {e}")
+            metadata = None
+        self.datasets[dataset_type]["metadata"] = metadata or {}
+        if metadata:
+            label = " | ".join(f"{key}: {metadata[key]}" for key in ("cell", "test", "testplan") if key in metadata)
+        else:
+            label = "No metadata found" if self.metadata_catalog.sheets else ""
+        self.datasets[dataset_type]["metadata_label"].set(label)
+
+    def _warm_metadata_catalog(self):
+        """
+        Loads the metadata catalog on the worker thread, so a changed workbook is not converted on the Tk thread.
+        """
+        try:
+            self.metadata_catalog.load()
+        except Exception as e:
+            print(f"⚠️ Failed to load metadata catalog: {e}")
 
-                    # ✅ Dynamically update the correct filter widget
-                    if dataset_type in self.app.filter_widgets:
-                        self.app.filter_widgets[dataset_type].update_cycle_options(unique_cycles)
-                
-            '''
-            # ✅ Check which cycle column is available
-            cycle_column = "Cyc-Count" if "Cyc-Count" in data.columns else "abs_cycle" if "abs_cycle" in data.columns else None
-            
-            if cycle_column:
-                unique_cycles = sorted(data[cycle_column].unique())
-
-                # ✅ Dynamically update the correct filter widget
-                if dataset_type in self.app.filter_widgets:
-                    self.app.filter_widgets[dataset_type].update_cycle_options(unique_cycles)
-     
-            # ✅ Update ModifyDataWidget dropdown
-            self.update_modify_widgets(dataset_type)
-                
-            messagebox.showinfo("Success", f"{dataset_type.capitalize()} dataset loaded.")
+### datasets of a slot
+
+    def member_names(self, dataset_type):
+        """
+        Returns the numbered names of the datasets a slot holds, in the order in which they were loaded.
+        """
+        return [f"{i}: {self.pool.get(key)['name']}" for i, key in enumerate(self.datasets[dataset_type]["members"], start=1)]
+
+    def slot_datasets(self, dataset_type):
+        """
+        Returns the pool entries of all datasets a slot holds.
+        """
+        return [self.pool.get(key) for key in self.datasets[dataset_type]["members"]]
+
+    def select_member(self, dataset_type, index):
+        """
+        Shows another dataset of the slot. Filters, plots and exports work on the shown dataset.
+        """
+        dataset = self.datasets[dataset_type]
+        if dataset_type in self.active_loads:
+            messagebox.showwarning("Warning", f"Please wait until the {dataset_type} dataset is loaded.")
+            return
+        key = dataset["members"][index]
+        if key == dataset["pool_key"]:
+            return
+        if dataset_type in self.followed:
+            self.set_follow(dataset_type, False)
+        self._show_dataset(dataset_type, self.pool.get(key))
+
+    def remove_member(self, dataset_type):
+        """
+        Removes the shown dataset from the slot and shows the next one. The pool releases the data once
+        no slot holds it anymore and memory is needed.
+        """
+        dataset = self.datasets[dataset_type]
+        key = dataset["pool_key"]
+        if key not in dataset["members"] or dataset_type in self.active_loads:
+            return
+        if dataset_type in self.followed:
+            self.set_follow(dataset_type, False)
+
+        index = dataset["members"].index(key)
+        dataset["members"].remove(key)
+        self.pool.release(key)
+        if dataset["members"]:
+            self._show_dataset(dataset_type, self.pool.get(dataset["members"][min(index, len(dataset["members"]) - 1)]))
+            return
+
+        dataset.update({"data": None, "header": None, "info": {}, "source_path": None, "pool_key": None, "resolution": "full"})
+        dataset["file_path"].set("No file selected")
+        dataset["active_member"].set("")
+        dataset["metadata_label"].set("")
+        if dataset_type in self.app.filter_widgets:
+            self.app.filter_widgets[dataset_type].update_cycle_options([])
+        self.update_modify_widgets(dataset_type)
+        self._set_load_status(dataset_type, "")
+
+    def _read_dataset(self, file_path, reader=None, progress_callback=None, cancel_event=None, preview_callback=None):
+        """
+        Returns data, header, info and a load summary. Uses the sidecar cache if the file was imported before.
+        If preview_callback is given, a decimated preview is passed to it as (data, header) before the full parse.
+        """
+        reader = reader or reader_for(file_path)  # Layout detected from the first bytes of the file
+        start = time.perf_counter()
+        pool_key = self.pool.key_for([file_path])
+        pooled = self.pool.get(pool_key)
+        if pooled is not None:
+            # The same file content is already loaded (in this or another slot), the DataFrame is shared
+            return pooled["data"], pooled["header"], pooled["info"], f"{len(pooled['data']):,} rows, already loaded as {pooled['name']}"
+
+        cached = self.cache.load(file_path)
+        if cached is not None and cached[2].get("schema") == schema_signature():
+            data, header, info = cached
+            info["pool_key"] = pool_key
+            summary = f"{len(data):,} rows from cache in {time.perf_counter() - start:.2f} s"
+            return data, header, info, summary + self._quality_summary(info.get("quality_report"))
+
+        if preview_callback is not None:
+            preview_data, _ = apply_compact_schema(reader.read_preview(file_path, columns=working_columns()))
+            preview_callback(preview_data, reader.last_header)
+
+        data, header, info = self._parse_file(file_path, reader, progress_callback, cancel_event)
+        self.cache.store(file_path, data, header, info)
+        if self.cache.memory_mapped:
+            # Continue with views of the stored columns, so the parsed copy is released
+            stored = self.cache.load(file_path)
+            data = stored[0] if stored is not None else data
+        info["pool_key"] = pool_key
+        stats = reader.last_stats
+        summary = f"{stats['rows']:,} rows in {stats['seconds']:.2f} s ({stats['rows_per_second']:,.0f} rows/s)"
+        return data, header, info, summary + self._quality_summary(info["quality_report"])
+
+    def _parse_file(self, file_path, reader, progress_callback=None, cancel_event=None):
+        """
+        Parses a file, validates (and optionally repairs) it and applies the compact schema. Returns data, header and info.
+        """
+        data = reader.read(file_path, columns=working_columns(), progress_callback=progress_callback, cancel_event=cancel_event)
+        quality_report = validate_dataset(data, reader.last_stats["skipped_lines"])
+        if DataSettings.VALIDATION_REPAIR:
+            data, quality_report["repairs"] = repair_dataset(data)
+        data, memory_report = apply_compact_schema(data)
+        info = {
+            "schema": schema_signature(),
+            "memory_report": memory_report,
+            "quality_report": quality_report,
+            "end_offset": reader.last_stats["end_offset"],  # Follow mode continues parsing from here
+            "tail_rows": reader.last_stats.get("tail_rows", 0),  # Rows of an unterminated last line, replaced by follow mode
+        }
+        return data, reader.last_header, info
+
+    @staticmethod
+    def _quality_summary(quality_report):
+        """
+        Returns the hint on data quality problems appended to a load summary.
+        """
+        if not quality_report or not quality_report["issues"]:
+            return ""
+        return f"\n⚠️ {quality_report['issues']:,} data quality issues (see Quality Report)"
+
+### stitching of continued test runs
+
+    def _read_series(self, file_paths, progress_callback=None, cancel_event=None):
+        """
+        Parses the export files of a continued test run in parallel and stitches them into one dataset,
+        in which time and cycle count continue across the file boundaries.
+        Returns data, header, info and a load summary like _read_dataset.
+        """
+        start = time.perf_counter()
+        file_paths = self._order_series(file_paths)
+        pool_key = self.pool.key_for(file_paths)
+        pooled = self.pool.get(pool_key)
+        if pooled is not None:
+            return pooled["data"], pooled["header"], pooled["info"], f"{len(pooled['data']):,} rows, already loaded as {pooled['name']}"
+        progress = {path: (0, source_size(path), 0) for path in file_paths}
+
+        def read_part(path):
+            def on_progress(bytes_read, total_bytes, rows):
+                progress[path] = (bytes_read, total_bytes, rows)
+                if progress_callback is not None:
+                    progress_callback(*[sum(values) for values in zip(*progress.values())])
+
+            # Each file gets its own reader, the parts share the sidecar cache
+            return self._read_dataset(path, reader_for(path), on_progress, cancel_event)
+
+        with ThreadPoolExecutor(max_workers=min(len(file_paths), DataSettings.SERIES_MAX_WORKERS)) as pool:
+            parts = list(pool.map(read_part, file_paths))
+
+        names = [display_name(path) for path in file_paths]
+        data = stitch_datasets([part[0] for part in parts], source_names=names if len(set(names)) == len(names) else file_paths)
+        # Reversals across file boundaries only show up in the stitched data
+        quality_report = validate_dataset(data, sum(part[2].get("quality_report", {}).get("skipped_lines", 0) for part in parts))
+        if DataSettings.VALIDATION_REPAIR:
+            data, quality_report["repairs"] = repair_dataset(data)
+        data, memory_report = apply_compact_schema(data)
+        info = {"schema": schema_signature(), "memory_report": memory_report, "quality_report": quality_report, "source_files": file_paths, "pool_key": pool_key}
+        summary = f"{len(data):,} rows from {len(file_paths)} files in {time.perf_counter() - start:.2f} s"
+        return data, parts[0][1], info, summary + self._quality_summary(quality_report)
+
+    def _order_series(self, file_paths):
+        """
+        Orders the files of a test run by the start time in their header, or by name if a start time is missing.
+        """
+        start_times = {}
+        for path in file_paths:
+            start_times[path] = reader_for(path).read_header(path).start_time
+        if all(start_times.values()):
+            return sorted(file_paths, key=lambda path: start_times[path])
+        return sorted(file_paths, key=display_name)
+
+    def load_series_async(self, dataset_type, file_paths):
+        """
+        Loads an ordered set of export files of one test run as one dataset on a worker thread.
+        """
+        if dataset_type in self.active_loads:
+            messagebox.showwarning("Warning", f"A {dataset_type} dataset is already loading.")
+            return
+
+        job = self._new_load_job(file_paths[0], preview=False)
+        job["file_paths"] = list(file_paths)
+        self.active_loads[dataset_type] = job
+        self._set_load_status(dataset_type, f"Loading {len(file_paths)} files ...")
+
+        worker = threading.Thread(target=self._series_worker, args=(job,), daemon=True)
+        worker.start()
+        self.app.root.after(DataSettings.LOAD_POLL_MS, self._poll_load, dataset_type)
+
+    def _series_worker(self, job):
+        """
+        Runs on the worker thread. Only writes into the job dictionary, never touches Tk.
+        """
+        def on_progress(bytes_read, total_bytes, rows):
+            job["progress"] = (bytes_read, total_bytes, rows)
+
+        try:
+            self._warm_metadata_catalog()
+            job["result"] = self._read_series(job["file_paths"], on_progress, job["cancel_event"])
+            job["file_path"] = job["result"][2]["source_files"][0]  # First file after ordering
+        except Exception as e:
+            job["error"] = e
+        finally:
+            job["done"] = True
+
+    def select_files(self, dataset_type):
+        """
+        Allows the user to select the export files of a continued test run and loads them as one dataset.
+        """
+        initial_dir = os.path.join(os.getcwd(), "data")  # Default to /data subfolder
+        file_paths = filedialog.askopenfilenames(
+            title=f"Select {dataset_type.capitalize()} Data Files of one Test",
+            filetypes=[("Text Files", "*.txt *.tsv *.mpt"), ("CSV Files", "*.csv"), ("Excel Workbooks", "*.xlsx"), ("Compressed Files", "*.gz *.zst *.zip"), ("All Files", "*.*")],
+            initialdir=initial_dir,
+        )
+        # A zip archive contributes all of its cycler files to the series
+        file_paths = [
+            member for path in file_paths
+            for member in ([member_path(path, name) for name in list_zip_members(path)] if path.lower().endswith(".zip") else [path])
+        ]
+        if len(file_paths) == 1:
+            self.load_dataset_async(dataset_type, file_paths[0])
+        elif file_paths:
+            self.load_series_async(dataset_type, file_paths)
+
+### background loading
+
+    def load_dataset_async(self, dataset_type, file_path, preview=None, append=False):
+        """
+        Loads a dataset on a worker thread. Progress is shown in the DataWidget of the slot and the
+        result is applied on the Tk thread, so the window and the other slots stay usable.
+        With preview (default for large files) a decimated subset is shown first and replaced
+        by the full-resolution data once it is loaded.
+        With append the dataset is added to the datasets of the slot instead of replacing them (no preview).
+        """
+        if append:
+            preview = False
+        if preview is None:
+            # Compressed files and workbooks are streamed and have no random access for the preview
+            preview = (
+                DataSettings.PREVIEW_ENABLED and source_size(file_path) >= DataSettings.PREVIEW_MIN_BYTES
+                and reader_for(file_path).supports_random_access(file_path)
+            )
+
+        if dataset_type in self.active_loads:
+            messagebox.showwarning("Warning", f"A {dataset_type} dataset is already loading.")
+            return
+
+        job = self._new_load_job(file_path, preview)
+        job["append"] = append
+        self.active_loads[dataset_type] = job
+        self._set_load_status(dataset_type, f"Loading {display_name(file_path)} ...")
+
+        worker = threading.Thread(target=self._load_worker, args=(job,), daemon=True)
+        worker.start()
+        self.app.root.after(DataSettings.LOAD_POLL_MS, self._poll_load, dataset_type)
+
+    def _new_load_job(self, file_path, preview):
+        return {
+            "file_path": file_path,
+            "cancel_event": threading.Event(),
+            "progress": (0, source_size(file_path), 0),  # bytes read, total bytes (on disk), rows
+            "preview": preview,  # True, then (data, header) once the preview is read, False after it is shown
+            "result": None,
+            "error": None,
+            "done": False,
+            "append": False,  # Add to the datasets of the slot instead of replacing them
+        }
+
+    def _load_worker(self, job):
+        """
+        Runs on the worker thread. Only writes into the job dictionary, never touches Tk.
+        """
+        def on_progress(bytes_read, total_bytes, rows):
+            job["progress"] = (bytes_read, total_bytes, rows)
+
+        def on_preview(data, header):
+            job["preview"] = (data, header)
+
+        try:
+            self._warm_metadata_catalog()
+            # Each load gets its own reader, as the reader keeps per-read state
+            job["result"] = self._read_dataset(
+                job["file_path"], reader_for(job["file_path"]), on_progress, job["cancel_event"], on_preview if job["preview"] else None
+            )
         except Exception as e:
+            job["error"] = e
+        finally:
+            job["done"] = True
+
+    def _poll_load(self, dataset_type):
+        """
+        Shows the progress of a background load and applies its result once the worker is done.
+        """
+        job = self.active_loads.get(dataset_type)
+        if job is None:
+            return
+
+        if isinstance(job["preview"], tuple) and not job["done"]:
+            preview_data, header = job["preview"]
+            job["preview"] = False
+            try:
+                self._apply_loaded_dataset(dataset_type, job["file_path"], preview_data, header, resolution="preview")
+            except Exception as e:
+                print(f"⚠️ Failed to show preview of {dataset_type} dataset: {e}")
+
+        if not job["done"]:
+            bytes_read, total_bytes, rows = job["progress"]
+            percent = 100 * bytes_read / total_bytes if total_bytes else 0
+            status = f"{bytes_read / 1024 ** 2:,.1f} / {total_bytes / 1024 ** 2:,.1f} MB ({percent:.0f} %), {rows:,} rows"
+            if self.datasets[dataset_type].get("resolution") == "preview":
+                status = f"Preview shown, loading full data: {status}"
+            self._set_load_status(dataset_type, status)
+            self.app.root.after(DataSettings.LOAD_POLL_MS, self._poll_load, dataset_type)
+            return
+
+        del self.active_loads[dataset_type]
+        if isinstance(job["error"], LoadCancelled):
+            cancelled_with_preview = self.datasets[dataset_type].get("resolution") == "preview"
+            self._set_load_status(dataset_type, "Loading cancelled, keeping the preview." if cancelled_with_preview else "Loading cancelled.")
+            return
+        if job["error"] is not None:
+            self._set_load_status(dataset_type, "Loading failed.")
+            messagebox.showerror("Error", f"Failed to load {dataset_type} dataset: {job['error']}")
+            return
+
+        data, header, info, load_summary = job["result"]
+        try:
+            self._apply_loaded_dataset(dataset_type, job["file_path"], data, header, info, append=job["append"])
+        except Exception as e:
+            self._set_load_status(dataset_type, "Loading failed.")
             messagebox.showerror("Error", f"Failed to load {dataset_type} dataset: {e}")
+            return
+        self._set_load_status(dataset_type, load_summary)
+
+    def cancel_load(self, dataset_type):
+        """
+        Asks the background load of a slot to stop after the current chunk.
+        """
+        job = self.active_loads.get(dataset_type)
+        if job is None:
+            return
+        job["cancel_event"].set()
+        self._set_load_status(dataset_type, "Cancelling ...")
 
-    def select_file(self, dataset_type):
+    def _set_load_status(self, dataset_type, text):
+        status = self.datasets.get(dataset_type, {}).get("load_status")
+        if status is not None:
+            status.set(text)
+
+### tail-follow of growing files
+
+    def set_follow(self, dataset_type, enabled):
+        """
+        Starts or stops following the source file of a dataset. While followed, rows appended
+        by the cycler are parsed from the last parsed byte offset and added to the dataset.
+        Returns True if the dataset is followed afterwards.
+        """
+        after_id = self.followed.pop(dataset_type, None)
+        if after_id is not None:
+            self.app.root.after_cancel(after_id)
+        if not enabled:
+            self._set_load_status(dataset_type, "Follow stopped.")
+            return False
+
+        dataset = self.datasets[dataset_type]
+        if dataset.get("data") is None or dataset_type in self.active_loads or dataset.get("resolution") == "preview":
+            messagebox.showwarning("Warning", f"Please wait until the {dataset_type} dataset is fully loaded.")
+            return False
+        if len(dataset.get("info", {}).get("source_files", [])) > 1:
+            messagebox.showwarning("Warning", "Follow is only available for datasets loaded from a single file.")
+            return False
+        if not reader_for(dataset["source_path"]).supports_random_access(dataset["source_path"]):
+            messagebox.showwarning("Warning", "Follow is only available for uncompressed text export files.")
+            return False
+        if dataset.get("info", {}).get("end_offset") is None:
+            messagebox.showwarning("Warning", f"The {dataset_type} dataset was imported without a byte offset, please reload it to follow the file.")
+            return False
+
+        self._set_load_status(dataset_type, f"Following {display_name(dataset['source_path'])} ...")
+        self.followed[dataset_type] = self.app.root.after(DataSettings.FOLLOW_INTERVAL_MS, self._follow_tick, dataset_type)
+        return True
+
+    def _follow_tick(self, dataset_type):
+        """
+        Appends the rows written to the source file since the last update and schedules the next update.
+        Only the appended bytes are parsed, so an update does not depend on the size of the file.
+        """
+        if dataset_type not in self.followed:
+            return
+        self.followed[dataset_type] = self.app.root.after(DataSettings.FOLLOW_INTERVAL_MS, self._follow_tick, dataset_type)
+
+        dataset = self.datasets[dataset_type]
+        data = dataset.get("data")
+        if data is None or dataset_type in self.active_loads or dataset.get("resolution") == "preview":
+            return  # A reload is running, its result brings a new byte offset
+
+        source_path = dataset.get("source_path")
+        end_offset = dataset.get("info", {}).get("end_offset")
+        try:
+            file_size = os.path.getsize(source_path)
+            if end_offset is None or file_size < end_offset:
+                self.set_follow(dataset_type, False)
+                self._set_load_status(dataset_type, "Follow stopped: the source file was replaced, please reload it.")
+                return
+            if file_size == end_offset:
+                return
+
+            header = dataset["header"]
+            columns = [col for col in data.columns if col in header.columns or col == COMMAND]  # Command may be derived
+            new_rows, new_end = reader_for(source_path).read_appended(source_path, header, end_offset, columns=columns)
+            dataset["info"]["end_offset"] = new_end
+            if new_rows.empty:
+                return
+
+            tail_rows = dataset["info"].pop("tail_rows", 0)
+            if tail_rows:
+                # The unterminated last line of the load is complete now and part of the new rows
+                data = data.iloc[:len(data) - tail_rows]
+            data = append_rows(data, new_rows)
+            if ABS_CYCLE in data.columns and ABS_CYCLE not in header.columns:
+                data[ABS_CYCLE] = compute_abs_cycle(data[CYCLE].to_numpy())  # Derived column, the new rows continue it
+            dataset["data"] = data
+            self.pool.update(dataset["pool_key"], data)
+        except Exception as e:
+            print(f"⚠️ Follow update of {dataset_type} dataset failed: {e}")
+            return
+
+        # ✅ Add only the cycles that are new, the current selection is kept
+        cycle_column = CYCLE if CYCLE in data.columns else None
+        if cycle_column and dataset_type in self.app.filter_widgets:
+            new_cycles = data[cycle_column].iloc[len(data) - len(new_rows):].dropna().unique()
+            self.app.filter_widgets[dataset_type].add_cycle_options(new_cycles)
+
+        self._set_load_status(dataset_type, f"Following: +{len(new_rows):,} rows, {len(data):,} rows in total")
+
+### column projection
+
+    def get_available_columns(self, dataset_type):
+        """
+        Returns all columns of the source file, including columns that are not loaded yet.
+        """
+        dataset = self.datasets.get(dataset_type, {})
+        data = dataset.get("data")
+        if data is None:
+            return []
+        header = dataset.get("header")
+        file_columns = header.columns if header is not None else []
+        return list(data.columns) + [col for col in file_columns if col not in data.columns]
+
+    def ensure_columns(self, dataset_type, columns, dataset=None):
         """
-        Allows the user to select a dataset file and loads it.
+        Loads columns of the source file that were left out by the column projection.
+        The columns are parsed from the recorded source file and attached to the raw dataset
+        (the shown dataset of the slot, or the given pool entry of the slot).
+        """
+        dataset = dataset or self.datasets.get(dataset_type, {})
+        data = dataset.get("data")
+        header = dataset.get("header")
+        if data is None or header is None:
+            return
+
+        missing = [col for col in columns if col and col in header.columns and col not in data.columns]
+        if not missing:
+            return
+
+        source_path = dataset.get("source_path")
+        source_files = dataset.get("info", {}).get("source_files", [source_path])  # Several files for stitched test runs
+        if dataset.get("resolution") == "preview":
+            raise ValueError(f"Column(s) {', '.join(missing)} can be loaded once the full {dataset_type} dataset is available.")
+        if not source_path or not all(source_exists(path) for path in source_files):
+            raise ValueError(f"Source file of the {dataset_type} dataset is not available to load {', '.join(missing)}.")
+
+        print(f"Loading column(s) {missing} of {display_name(source_path)} on demand")
+        fetched = pd.concat([reader_for(path).read(path, columns=missing) for path in source_files], ignore_index=True)
+        if len(fetched) < len(data):
+            raise ValueError(f"Source file of the {dataset_type} dataset has changed, please reload it.")
+        fetched, memory_report = apply_compact_schema(fetched.iloc[:len(data)])
+        for col in missing:
+            data[col] = fetched[col].to_numpy()
+        dataset.setdefault("info", {}).setdefault("memory_report", {}).update(memory_report)
+        self.pool.update(dataset.get("pool_key", dataset.get("key")), data)
+
+    def ensure_abs_cycle(self, dataset_type, dataset=None):
+        """
+        Adds the absolute cycle as column of the raw dataset (computed once, reused by every filter run).
+        """
+        dataset = dataset or self.datasets.get(dataset_type, {})
+        data = dataset.get("data")
+        if data is None or ABS_CYCLE in data.columns or dataset.get("resolution") == "preview":
+            return  # Previews get it on the fly in process_dataset
+        self.ensure_columns(dataset_type, [CYCLE], dataset)
+        data = dataset["data"]
+        if CYCLE not in data.columns:
+            return  # process_dataset reports the missing column
+        data[ABS_CYCLE] = compute_abs_cycle(data[CYCLE].to_numpy())
+        self.pool.update(dataset.get("pool_key", dataset.get("key")), data)
+
+    def segment_index(self, dataset_type, cycle_column, dataset=None):
+        """
+        Returns the CycleSegmentIndex of the raw dataset of a slot (or the given pool entry) for cycle_column, or None
+        if the column is missing. The index is built once per pooled dataset and rebuilt after follow mode added rows.
+        """
+        dataset = dataset or self.datasets.get(dataset_type, {})
+        data = dataset.get("data")
+        if data is None or cycle_column not in data.columns:
+            return None
+        entry = self.pool.get(dataset.get("pool_key", dataset.get("key")))
+        indexes = entry["segments"] if entry is not None else {}  # Previews are not pooled
+        index = indexes.get(cycle_column)
+        if index is None or index.rows != len(data):
+            index = CycleSegmentIndex(data, cycle_column)
+            indexes[cycle_column] = index
+        return index
+
+    def cycle_values(self, dataset_type, cycle_column):
+        """
+        Returns the cycles of the raw dataset of a slot for the cycle dropdown.
+        """
+        if cycle_column == ABS_CYCLE:
+            self.ensure_abs_cycle(dataset_type)
+        index = self.segment_index(dataset_type, cycle_column)
+        return index.cycle_values() if index is not None else []
+
+    def rebuild_cache(self):
+        """
+        Clears the sidecar cache and re-imports the files of all loaded datasets into it.
+        """
+        try:
+            self.cache.clear()
+            rebuilt = []
+            for dataset in self.pool.entries.values():
+                source_path = dataset.get("source_path")
+                for path in dataset.get("info", {}).get("source_files", [source_path]):
+                    if path and path not in rebuilt and source_exists(path):
+                        self.cache.store(path, *self._parse_file(path, reader_for(path)))
+                        rebuilt.append(path)
+            messagebox.showinfo("Success", f"Cache rebuilt ({len(rebuilt)} file(s), {self.cache.size_bytes() / 1024 ** 2:.1f} MB).")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to rebuild cache: {e}")
+
+    def select_file(self, dataset_type, append=False):
+        """
+        Allows the user to select a dataset file and loads it (with append as additional dataset of the slot).
         """
         initial_dir = os.path.join(os.getcwd(), "data")  # Default to /data subfolder
         file_path = filedialog.askopenfilename(
             title=f"Select {dataset_type.capitalize()} Data File",
-            filetypes=[("Text Files", "*.txt"), ("CSV Files", "*.csv"), ("All Files", "*.*")],
+            filetypes=[("Text Files", "*.txt *.tsv *.mpt"), ("CSV Files", "*.csv"), ("Excel Workbooks", "*.xlsx"), ("Compressed Files", "*.gz *.zst *.zip"), ("All Files", "*.*")],
             initialdir=initial_dir,
         )
+        if file_path and file_path.lower().endswith(".zip"):
+            file_path = self.choose_archive_member(file_path)
         if file_path:
-            self.load_dataset(dataset_type, file_path)
+            self.load_dataset_async(dataset_type, file_path, append=append)
+
+    def choose_archive_member(self, archive_path):
+        """
+        Lets the user choose a cycler file of a zip archive. Returns "archive.zip::member" or None.
+        """
+        try:
+            members = list_zip_members(archive_path)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to open {os.path.basename(archive_path)}: {e}")
+            return None
+        if not members:
+            messagebox.showerror("Error", f"{os.path.basename(archive_path)} contains no cycler files.")
+            return None
+        if len(members) == 1:
+            return member_path(archive_path, members[0])
+
+        chooser = tk.Toplevel(self.app.root)
+        chooser.title(f"Select File - {os.path.basename(archive_path)}")
+        chooser.geometry("500x300")
+        chooser.transient(self.app.root)
+        chooser.grab_set()
+
+        listbox = tk.Listbox(chooser, selectmode="browse")
+        listbox.pack(fill="both", expand=True, padx=5, pady=5)
+        for member in members:
+            listbox.insert("end", member)
+        listbox.selection_set(0)
+
+        selected = {"member": None}
+
+        def confirm(event=None):
+            if listbox.curselection():
+                selected["member"] = members[listbox.curselection()[0]]
+            chooser.destroy()
+
+        listbox.bind("<Double-Button-1>", confirm)
+        tk.Button(chooser, text="Load", command=confirm).pack(pady=5)
+        chooser.wait_window()
+        return member_path(archive_path, selected["member"]) if selected["member"] else None
 
     def show_data_table(self, dataset_type):
         """
@@ -94,7 +753,7 @@ class DataManager:
 
         # Create a new window for displaying data
         table_window = tk.Toplevel(self.app.root)
-        table_window.title(f"Data Table - {dataset_type.capitalize()}")
+        table_window.title(f"Data Table - {dataset_type.capitalize()} ({self._resolution_label(dataset_type)})")
         table_window.geometry("800x600")
 
         # Add scrollbars
@@ -123,10 +782,11 @@ class DataManager:
 
         try:
             plt.figure(figsize=(8, 6))
-            plt.plot(data["Time[h]"], data["U[V]"], label=f"{dataset_type.capitalize()} Voltage")
+            is_preview = self.datasets[dataset_type].get("resolution") == "preview"
+            plt.plot(data[TIME], data[VOLTAGE], label=f"{dataset_type.capitalize()} Voltage", marker="." if is_preview else None)
             plt.xlabel("Time (h)")
             plt.ylabel("Voltage (V)")
-            plt.title(f"{dataset_type.capitalize()} Data Plot")
+            plt.title(f"{dataset_type.capitalize()} Data Plot ({self._resolution_label(dataset_type)})")
             plt.legend()
             plt.grid(True)
             plt.show()
@@ -135,6 +795,53 @@ class DataManager:
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred: {e}")
 
+    def show_memory_report(self, dataset_type):
+        """
+        Displays the memory used per column before and after applying the compact schema.
+        """
+        dataset = self.datasets.get(dataset_type, {})
+        report = dataset.get("info", {}).get("memory_report")
+        if dataset.get("data") is None or not report:
+            messagebox.showerror("Error", f"No memory report available for {dataset_type}.")
+            return
+
+        report_window = tk.Toplevel(self.app.root)
+        report_window.title(f"Memory Report - {dataset_type.capitalize()}")
+        report_window.geometry("700x400")
+
+        text = tk.Text(report_window, wrap="none")
+        text.pack(fill="both", expand=True)
+        table = memory_report_table(report).to_string(index=False, float_format=lambda mb: f"{mb:,.2f}")
+        text.insert("1.0", f"{table}\n\n{self.pool.summary()}\n{self.result_cache.summary()}")
+
+    def show_quality_report(self, dataset_type):
+        """
+        Displays the data quality report created when the dataset was imported.
+        """
+        dataset = self.datasets.get(dataset_type, {})
+        report = dataset.get("info", {}).get("quality_report")
+        if dataset.get("data") is None or not report:
+            messagebox.showerror("Error", f"No quality report available for {dataset_type}.")
+            return
+
+        report_window = tk.Toplevel(self.app.root)
+        report_window.title(f"Quality Report - {dataset_type.capitalize()}")
+        report_window.geometry("500x400")
+
+        text = tk.Text(report_window, wrap="none")
+        text.pack(fill="both", expand=True)
+        text.insert("1.0", quality_report_text(report))
+
+    def _resolution_label(self, dataset_type):
+        """
+        Describes whether the raw dataset of a slot is a preview or the full-resolution data.
+        """
+        dataset = self.datasets.get(dataset_type, {})
+        rows = len(dataset["data"]) if dataset.get("data") is not None else 0
+        if dataset.get("resolution") == "preview":
+            return f"preview, {rows:,} sampled rows - full data loading"
+        return f"full resolution, {rows:,} rows"
+
     def get_dataset(self, dataset_type):
         """ Returns the dataset for the given type ('anode' or 'cathode'). """
         return self.datasets.get(dataset_type, {}).get("data", None)
@@ -154,7 +861,7 @@ class DataManager:
         #    widget = self.app.modify_widgets["anode"] if dataset_type == "anode" else self.app.modify_widgets["cathode"]
 
             if dataset is not None:
-                column_names = dataset.columns.tolist()
+                column_names = self.get_available_columns(dataset_type)
                 widget.update_column_dropdown(column_names)
             else:
                 widget.update_column_dropdown([])  # Clear dropdown if no dataset is loaded
@@ -330,172 +1037,94 @@ def apply_filters(self, dataset_type):
     def apply_filters(self, dataset_type):
         """
         Applies selected filters and modifications to the given dataset.
+        The stages run headless in processing, like in the batch CLI; errors are shown here.
         """
         filter_options = self.app.get_filter_options(dataset_type) ## this is how i should have done it in the beginning
-        
+        if not filter_options:
+            messagebox.showerror("Error", f"No filter widget found for {dataset_type}.")
+            return None, None  # Exit early if the widget is missing
+        options = {**filter_options, **self.app.get_modification_options(dataset_type)}
+
         data = self.datasets.get(dataset_type, {}).get("data")
         if data is None:
             messagebox.showerror("Error", f"No {dataset_type} dataset loaded.")
             return None, None
 
-        filtered_data = data.copy()
-        
-        if dataset_type not in self.app.filter_widgets:
-            messagebox.showerror("Error", f"No filter widget found for {dataset_type}.")
-            return None, None  # Exit early if the widget is missing
-
-        filter_widget = self.app.filter_widgets[dataset_type]
-        modify_widget = self.app.modify_widgets.get(dataset_type) #hkw
-
-        ### Filters
-        # Pause filter
-        if filter_widget.remove_pause.get():
-            filtered_data = filtered_data[filtered_data['Command'] != 'Pause']
-
-        # Cycle filter
-        cycle_column = filter_widget.cycle_column.get()  # "Cyc-Count" or "abs_cycle"
-
-        if filter_widget.select_cycle.get():
-            selected_cycle = filter_widget.cycle_selection.get()
-            cycle_column = filter_widget.cycle_column.get()  # Get selected cycle column
-
-            # Ensure `abs_cycle` is computed before filtering
-            if cycle_column == "abs_cycle" and "abs_cycle" not in filtered_data.columns:
-                filtered_data = self.compute_absolute_cycle(filtered_data)  # Compute abs_cycle
-            
-            # Now check if column exists after computing it
-            if selected_cycle and selected_cycle != "All":
-                if cycle_column in filtered_data.columns:
-                    filtered_data = filtered_data[filtered_data[cycle_column] == int(selected_cycle)]
-                else:
-                    messagebox.showerror("Error", f"Column '{cycle_column}' not found in dataset.")
-                    return None, None  # ✅ Exit early if column is missing        
-        # Charge and discharge half cycle filter
-        if filter_widget.select_charge_half_cycle.get():
-            filtered_data = filtered_data[filtered_data['Command'].str.contains("Charge", na=False)]
-        if filter_widget.select_discharge_half_cycle.get():
-            filtered_data = filtered_data[filtered_data['Command'].str.contains("Discharge", na=False)]
-
-        # Step Change Filter
-        if filter_widget.apply_step_change.get():
-            step_column = filter_widget.step_change_column.get()
-            if step_column in filtered_data.columns:
-                filtered_data = self.step_change_filter(filtered_data, step_column)
-            else:
-                messagebox.showerror("Error", f"Column '{step_column}' not found in dataset.")
-
-        # Range Filter
-        if filter_widget.apply_range_filter.get():
-            selected_column = filter_widget.selected_column.get()
-            min_value, max_value = filter_widget.min_value.get(), filter_widget.max_value.get()
-
-            if selected_column in filtered_data.columns:
-                filtered_data = filtered_data[(filtered_data[selected_column] >= min_value) & (filtered_data[selected_column] <= max_value)]
-            else:
-                messagebox.showerror("Error", f"Column '{selected_column}' not found in dataset.")
-
-        ### Data modifications
-        # Absolute cycle modification
-        if modify_widget.compute_abs_cycle.get():
-            filtered_data = self.compute_absolute_cycle(filtered_data)
-
-        # dQ/dU modification
-        if modify_widget.compute_du_dq.get():
-            if "Ah-Cyc-Charge-0" in filtered_data.columns and "U[V]" in filtered_data.columns:
-                filtered_data["dU/dQ"] = np.gradient(filtered_data["U[V]"], filtered_data["Ah-Cyc-Charge-0"])
-
-        # Normalize voltage modification
-        if modify_widget.normalize_voltage.get():
-            if "U[V]" in filtered_data.columns:
-                max_voltage = filtered_data["U[V]"].max()
-                filtered_data["U_normalized"] = filtered_data["U[V]"] / max_voltage
-
-        # Apply Offset Modification
-        if modify_widget.apply_offset.get():
-            offset_column = modify_widget.selected_column.get()
-            offset_value = modify_widget.offset_value.get()
-            if offset_column and offset_column in filtered_data.columns:
-                filtered_data[offset_column] += offset_value  # ✅ Modify the column directly
-
-        # Generate fit data
-        if filter_widget.fit_option.get() == "linear spline":
-
-            # ✅ Determine columns dynamically based on the selected plot type
-
-            plot_type = filter_widget.plot_option.get()
-            
-            # Adjust x_col based on charge/discharge selection
-            if plot_type == "Q-U":
-                if filter_widget.select_charge_half_cycle.get():
-                    x_col = "Ah-Cyc-Charge-0"
-                elif filter_widget.select_discharge_half_cycle.get():
-                    x_col = "Ah-Cyc-Discharge-0"
-                else:
-                    messagebox.showerror("Error", "Please select either Charge or Discharge filter when using Q-U.")
-                    return None, None  # Prevent further execution
-                
-                y_col = "U[V]"
-
-            else:
-                column_map = {
-                    "U-t": ("Time[h]", "U[V]"),
-                    "I-t": ("Time[h]", "I[A]"),
-                }
-                if plot_type not in column_map:
-                    messagebox.showerror("Error", f"Invalid plot type '{plot_type}' selected.")
-                    return None, None
-                x_col, y_col = column_map[plot_type]
-            
-            # Ensure required columns exist
-            if not all(col in filtered_data.columns for col in [x_col, y_col]):
-                messagebox.showerror("Error", f"Dataset must contain columns: {x_col}, {y_col}")
-                return None, None
-            
-            # Ensure x_col is strictly increasing
-            if not all(np.diff(filtered_data[x_col]) > 0):
-                messagebox.showerror(
-                    "Error",
-                    "X-values must be strictly increasing. Adjust filter settings to prevent duplicate or decreasing values!"
-                )
-                return None, None
-    
+        # Load columns left out by the column projection before they are filtered on
+        try:
+            self.ensure_columns(dataset_type, required_columns(options))
+            if uses_abs_cycle(options):
+                self.ensure_abs_cycle(dataset_type)
+            data = self.datasets[dataset_type]["data"]
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load column: {e}")
+            return None, None
 
-            try:
-                # ✅ If "Use Step Size" is active, pass step size to compute_linear_spline
-                if filter_widget.use_step_size.get() and filter_widget.step_size_value.get() > 0:
-                    step_size = filter_widget.step_size_value.get()
-                    fit_data = self.compute_linear_spline(filtered_data[x_col], filtered_data[y_col], step_size)
-                else:
-                    fit_data = self.compute_linear_spline(filtered_data[x_col], filtered_data[y_col])
+        try:
+            # ✅ Always returns (filtered data, fit data or None)
+            return self._process_cached(dataset_type, self.datasets[dataset_type], options)
+        except ProcessingError as e:
+            messagebox.showerror("Error", str(e))
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to apply filters: {e}")
+        return None, None
 
-                if fit_data is None:
-                    return None, None
-    
-                # Convert to DataFrame with row numbers
-                fit_df = pd.DataFrame({x_col: fit_data["x"], y_col: fit_data["y"]})
-                fit_df["row"] = range(len(fit_df))
+    def apply_filters_to_slot(self, dataset_type):
+        """
+        Applies the selected filters and modifications of the slot to all datasets it holds in one batched call.
+        Returns a dict of dataset name -> (filtered data, fit data or None), or None after an error was shown.
+        """
+        options = {**self.app.get_filter_options(dataset_type), **self.app.get_modification_options(dataset_type)}
+        entries = self.slot_datasets(dataset_type)
+        if not entries:
+            messagebox.showerror("Error", f"No {dataset_type} dataset loaded.")
+            return None
 
-                return filtered_data, fit_df
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to generate fit data: {e}")
-                return None, None
+        results = {}
+        try:
+            for entry in entries:
+                self.ensure_columns(dataset_type, required_columns(options), entry)
+                if uses_abs_cycle(options):
+                    self.ensure_abs_cycle(dataset_type, entry)
+                name = base_name(entry["source_path"])
+                name = name if name not in results else f"{name}_{len(results) + 1}"
+                try:
+                    results[name] = self._process_cached(dataset_type, entry, options)
+                except ProcessingError as e:
+                    raise ProcessingError(f"{name}: {e}") from e
+            return results
+        except ProcessingError as e:
+            messagebox.showerror("Error", str(e))
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to apply filters: {e}")
+        return None
 
-        return filtered_data, None  # ✅ Always return the modified dataset
+    def _process_cached(self, dataset_type, dataset, options):
+        """
+        Runs process_dataset on the raw dataset of a slot (or a pool entry) with its segment index, reusing the
+        cached stage outputs of the same dataset and options. The fingerprint holds the row count and the columns,
+        so appended rows (follow mode) and loaded columns give new keys; datasets outside the pool (previews) are not cached.
+        The outputs are dropped with the pool entry (see DatasetPool.on_release), as they may be views into its data.
+        """
+        data = dataset["data"]
+        pool_key = dataset.get("pool_key", dataset.get("key"))
+        cycle_column = options.get("cycle_column", CYCLE) if options.get("select_cycle") else CYCLE
+        segments = self.segment_index(dataset_type, cycle_column, dataset)
+        if pool_key is None:
+            return process_dataset(data, options, segments=segments)
+        stage_cache = self.result_cache.stage_cache([pool_key, len(data), list(data.columns)], owner=pool_key)
+        return process_dataset(data, options, stage_cache, segments)
 
     def step_change_filter(self, df, column):
         """
         Keeps only the last row before the value in 'column' changes.
         """
-        if column not in df.columns:
-            messagebox.showerror("Error", f"Column '{column}' not found in dataset.")
+        try:
+            return step_change_filter(df, column)
+        except ProcessingError as e:
+            messagebox.showerror("Error", str(e))
             return df  # Return unmodified dataset to prevent breaking
 
-        # Identify rows where the column value changes
-        df["shifted"] = df[column].shift(-1)  # Shift column to compare with the next row
-        filtered_df = df[df[column] != df["shifted"]].drop(columns=["shifted"])  # Keep last row before change
-        
-        return filtered_df, None
-    
     def _generate_filter_suffix(self, dataset_type):
         """
         Generate a suffix string based on the applied filters.
@@ -503,37 +1132,7 @@ def apply_filters(self, dataset_type):
         if dataset_type not in self.app.filter_widgets:
             messagebox.showerror("Error", f"No filter widget found for {dataset_type}.")
             return None  # Exit early if the widget is missing
-        widget = self.app.filter_widgets[dataset_type]
-        suffixes = []
-
-        if widget.remove_pause.get():
-            suffixes.append("nopause")
-        if widget.select_cycle.get():
-            selected_cycle = widget.cycle_selection.get()
-            if selected_cycle and selected_cycle != "All":
-                suffixes.append(f"cycle{selected_cycle}")
-            else:
-                suffixes.append("allcycles")
-        if widget.select_charge_half_cycle.get():
-            suffixes.append("charge")
-        if widget.select_discharge_half_cycle.get():
-            suffixes.append("discharge")
-        if widget.apply_step_change.get():
-            suffixes.append("sc")  # Step Change filter suffix
-
-        if widget.apply_range_filter.get():
-            selected_column = widget.selected_column.get()
-            min_value, max_value = widget.min_value.get(), widget.max_value.get()
-            suffixes.append(f"{selected_column}_range_{min_value}-{max_value}")
-
-        # ✅ Range Filter integration
-        if widget.apply_range_filter.get():
-            selected_column = widget.selected_column.get()
-            if selected_column and selected_column != "Select Column":
-                min_value, max_value = widget.min_value.get(), widget.max_value.get()
-                suffixes.append(f"{selected_column}_range_{min_value}-{max_value}")
-
-        return "-".join(suffixes) if suffixes else "nofilter"
+        return filter_suffix(self.app.get_filter_options(dataset_type))
 
 ### modification methods
 
@@ -551,13 +1150,13 @@ def apply_filters(self, dataset_type):
         widget = self.anode_modify_widget if dataset_type == "anode" else self.cathode_modify_widget
 
         if widget.compute_du_dq.get():
-            if "Ah-Cyc-Discharge-0" in modified_data.columns and "U[V]" in modified_data.columns:
-                modified_data["dU/dQ"] = np.gradient(modified_data["U[V]"], modified_data["Ah-Cyc-Discharge-0"])
+            if Q_DISCHARGE in modified_data.columns and VOLTAGE in modified_data.columns:
+                modified_data["dU/dQ"] = np.gradient(modified_data[VOLTAGE], modified_data[Q_DISCHARGE])
 
         if widget.normalize_voltage.get():
-            if "U[V]" in modified_data.columns:
-                max_voltage = modified_data["U[V]"].max()
-                modified_data["U_normalized"] = modified_data["U[V]"] / max_voltage
+            if VOLTAGE in modified_data.columns:
+                max_voltage = modified_data[VOLTAGE].max()
+                modified_data["U_normalized"] = modified_data[VOLTAGE] / max_voltage
 
         # Apply Offset if enabled
         if widget.apply_offset.get():
@@ -578,47 +1177,17 @@ def apply_filters(self, dataset_type):
         - Cycles remain unchanged if already sequential.
         - Every time 'Cyc-Count' resets, 'abs_cycle' increments once.
         """
-        if "Cyc-Count" not in dataset.columns:
-            messagebox.showerror("Error", "Dataset is missing the 'Cyc-Count' column.")
+        try:
+            return add_abs_cycle(dataset)  # Applied per run, not per row
+        except ProcessingError as e:
+            messagebox.showerror("Error", str(e))
             return dataset  # Return original dataset to avoid breaking functionality
 
-        cyc_count = dataset["Cyc-Count"].tolist()  # Extract as a list
-        expected_cycle = 1
-        last_cycle = 1
-        abs_cycle = []
-
-        for cyc in cyc_count:
-            if cyc == expected_cycle:
-                abs_cycle.append(expected_cycle)
-            else:
-                if cyc != last_cycle:
-                    expected_cycle += 1
-                    abs_cycle.append(expected_cycle)
-                else:
-                    abs_cycle.append(expected_cycle)
-            last_cycle = cyc
-
-        dataset["abs_cycle"] = abs_cycle  # Add the computed column to the dataset
-        return dataset
-
     def _generate_modification_suffix(self, dataset_type):
         """
         Generate a suffix string based on the applied modifications.
         """
-    #    modify_widget = self.app.modify_widgets["anode"] if dataset_type == "anode" else self.app.modify_widgets["cathode"]
-        modify_widget = self.app.modify_widgets.get(dataset_type)
-        suffixes = []
-
-        if modify_widget.compute_abs_cycle.get():
-            suffixes.append("abs_cycle")
-        if modify_widget.compute_du_dq.get():
-            suffixes.append("du_dq")
-        if modify_widget.normalize_voltage.get():
-            suffixes.append("U_norm")
-        if modify_widget.apply_offset.get():
-            suffixes.append(f"offset_{modify_widget.selected_column.get()}")
-
-        return "-".join(suffixes) if suffixes else "nomod"
+        return modification_suffix(self.app.get_modification_options(dataset_type))
 
     def _show_modified_data(self, dataset_type):
         """
@@ -651,50 +1220,33 @@ def apply_filters(self, dataset_type):
 
     def compute_key_values(self, dataset_type):
         """
-        Computes key values (max voltage, max charge, max discharge) for the filtered dataset.
-        Returns a dictionary of results.
+        Computes key values (max voltage, max charge, max discharge) per cycle of the filtered dataset,
+        or of all datasets of the slot in one batched pass if "All datasets" is selected.
+        Returns a DataFrame of results.
         """
-        filtered_data = self.apply_filters(dataset_type)
-        if filtered_data is None:
-            return None
-
         if dataset_type not in self.app.key_values_widgets:
             messagebox.showerror("Error", f"No key_values widget found for {dataset_type}.")
             return None  # Exit early if the widget is missing
 
         widget = self.app.key_values_widgets[dataset_type]
-
-        # Prepare results
-        results = {"Cycle": []}
-        if widget.extract_max_voltage.get():
-            results["Max Voltage (V)"] = []
-        if widget.extract_max_charge.get():
-            results["Max Charge (Ah)"] = []
-        if widget.extract_max_discharge.get():
-            results["Max Discharge (Ah)"] = []
-
-        # Group data by cycle if Cyc-Count column exists
-        grouped_data = filtered_data.groupby("Cyc-Count") if "Cyc-Count" in filtered_data.columns else [("", filtered_data)]
-
-        for cycle, group in grouped_data:
-            results["Cycle"].append(cycle)
-
-            if widget.extract_max_voltage.get():
-                results["Max Voltage (V)"].append(group["U[V]"].max())
-
-            if widget.extract_max_charge.get():
-                if "Ah-Cyc-Charge-0" in group.columns:
-                    results["Max Charge (Ah)"].append(group["Ah-Cyc-Charge-0"].max())
-                else:
-                    results["Max Charge (Ah)"].append("N/A")
-
-            if widget.extract_max_discharge.get():
-                if "Ah-Cyc-Discharge-0" in group.columns:
-                    results["Max Discharge (Ah)"].append(group["Ah-Cyc-Discharge-0"].max())
-                else:
-                    results["Max Discharge (Ah)"].append("N/A")
-
-        return results
+        extract = [
+            key for key, selected in (
+                ("max_voltage", widget.extract_max_voltage.get()),
+                ("max_charge", widget.extract_max_charge.get()),
+                ("max_discharge", widget.extract_max_discharge.get()),
+            ) if selected
+        ]
+
+        if widget.all_datasets.get():
+            results = self.apply_filters_to_slot(dataset_type)
+            if results is None:
+                return None
+            return key_values({name: filtered_data for name, (filtered_data, _) in results.items()}, extract)
+
+        filtered_data, _ = self.apply_filters(dataset_type)
+        if filtered_data is None:
+            return None
+        return key_values({self.datasets[dataset_type]["file_path"].get(): filtered_data}, extract).drop(columns="Dataset")
 
     def extract_key_values(self, dataset_type):
         """
@@ -750,8 +1302,8 @@ def apply_filters(self, dataset_type):
 
         # Max Voltage for U-t
         if plot_type == "U-t" and key_values_widget.extract_max_voltage.get():
-            max_voltage = filtered_data["U[V]"].max()
-            time_at_max_voltage = filtered_data.loc[filtered_data["U[V]"] == max_voltage, "Time[h]"].iloc[0]
+            max_voltage = filtered_data[VOLTAGE].max()
+            time_at_max_voltage = filtered_data.loc[filtered_data[VOLTAGE] == max_voltage, TIME].iloc[0]
             key_points.append(
                 {
                     "x": time_at_max_voltage,
@@ -764,8 +1316,8 @@ def apply_filters(self, dataset_type):
 
         # Max Current for I-t
         if plot_type == "I-t" and key_values_widget.extract_max_charge.get():  # Assuming this refers to max current
-            max_current = filtered_data["I[A]"].max()
-            time_at_max_current = filtered_data.loc[filtered_data["I[A]"] == max_current, "Time[h]"].iloc[0]
+            max_current = filtered_data[CURRENT].max()
+            time_at_max_current = filtered_data.loc[filtered_data[CURRENT] == max_current, TIME].iloc[0]
             key_points.append(
                 {
                     "x": time_at_max_current,
@@ -779,8 +1331,8 @@ def apply_filters(self, dataset_type):
         # Max Charge and Discharge for Q-U
         if plot_type == "Q-U":
             if key_values_widget.extract_max_charge.get() and not filter_widget.select_discharge_half_cycle.get():
-                max_charge = filtered_data["Ah-Cyc-Charge-0"].max()
-                voltage_at_max_charge = filtered_data.loc[filtered_data["Ah-Cyc-Charge-0"] == max_charge, "U[V]"].iloc[0]
+                max_charge = filtered_data[Q_CHARGE].max()
+                voltage_at_max_charge = filtered_data.loc[filtered_data[Q_CHARGE] == max_charge, VOLTAGE].iloc[0]
                 key_points.append(
                     {
                         "x": max_charge,
@@ -792,8 +1344,8 @@ def apply_filters(self, dataset_type):
                 )
 
             if key_values_widget.extract_max_discharge.get() and not filter_widget.select_charge_half_cycle.get():
-                max_discharge = filtered_data["Ah-Cyc-Discharge-0"].max()
-                voltage_at_max_discharge = filtered_data.loc[filtered_data["Ah-Cyc-Discharge-0"] == max_discharge, "U[V]"].iloc[0]
+                max_discharge = filtered_data[Q_DISCHARGE].max()
+                voltage_at_max_discharge = filtered_data.loc[filtered_data[Q_DISCHARGE] == max_discharge, VOLTAGE].iloc[0]
                 key_points.append(
                     {
                         "x": max_discharge,
@@ -810,31 +1362,11 @@ def apply_filters(self, dataset_type):
 
     def compute_linear_spline(self, x, y, step_size=None, num_points=500):
         """
-        Computes a linear spline fit for given x and y data.
-        
-        Parameters:
-        - x (array-like): The independent variable (e.g., charge in Ah).
-        - y (array-like): The dependent variable (e.g., voltage in V).
-        - step_size (float, optional): The desired spacing between generated x values.
-        - num_points (int, optional): Number of evenly spaced points if step_size is not given.
-
-        Returns:
-        - dict: A dictionary with interpolated 'x' and 'y' values.
+        Computes a linear spline fit for given x and y data (see processing.linear_spline).
+        Returns a dictionary with interpolated 'x' and 'y' values, or None if the fit failed.
         """
         try:
-            spline = interp1d(x, y, kind="linear", fill_value="extrapolate")
-
-            if step_size:
-                # Generate x values based on step size
-                x_fit = np.arange(x.min(), x.max(), step_size)
-            else:
-                # Default behavior: Generate evenly spaced points
-                x_fit = np.linspace(x.min(), x.max(), num_points)
-            
-            y_fit = spline(x_fit)
-
-            return {"x": x_fit, "y": y_fit}
-
+            return linear_spline(x, y, step_size, num_points)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to compute linear spline: {e}")
             return None
@@ -843,34 +1375,14 @@ def apply_filters(self, dataset_type):
 
 ### suffix creation for data selection filtered/fit data
 
-    # hkw updated method needs to be checked if working, after fix to apply_filters!
     def _generate_datatype_suffix(self, dataset_type):
         """
         Generate a suffix string based on the selected data type (Modified vs Fit).
         If "Fit Data" is selected and step size is applied, add "_step_<value>_" after "_FitData_linSpline".
         """
-        filter_widget = self.app.filter_widgets.get(dataset_type)
-        if not filter_widget:
+        if not self.app.filter_widgets.get(dataset_type):
             return ""  # Default: No suffix if no filter widget found
-
-        suffix = ""
-
-        # Check if fit data is selected
-        if filter_widget.data_type_selection.get() == "Fit Data":
-            suffix += "_FitData_linSpline"
-
-            # Check if "Use Step Size" is active
-            if filter_widget.use_step_size.get() and filter_widget.step_size_value.get() > 0:
-                step_value = filter_widget.step_size_value.get()
-                suffix += f"_step_{step_value}"
-
-            '''
-            # Check if step size is applied
-            if hasattr(filter_widget, "step_size") and filter_widget.step_size.get() > 0:
-                step_value = filter_widget.step_size.get()
-                suffix += f"_step_{step_value}"            
-            '''    
-        return suffix  # Default: No suffix for modified data
+        return datatype_suffix(self.app.get_filter_options(dataset_type))
 
     def save_filtered_data(self, dataset_type):
         """
@@ -880,6 +1392,9 @@ def apply_filters(self, dataset_type):
         if self.datasets[dataset_type]["data"] is None:
             messagebox.showerror("Error", f"No {dataset_type} data loaded.")
             return
+        if self._all_datasets_selected(dataset_type):
+            self.save_filtered_slot(dataset_type)
+            return
 
         # ✅ Ensure apply_filters always returns a tuple
         filtered_data, fit_data = self.apply_filters(dataset_type)
@@ -894,7 +1409,7 @@ def apply_filters(self, dataset_type):
             messagebox.showerror("Error", f"No {dataset_type} file loaded.")
             return
 
-        base_filename = os.path.splitext(os.path.basename(dataset_file))[0]
+        base_filename = base_name(self.datasets[dataset_type].get("source_path") or dataset_file)
         filter_suffix = self._generate_filter_suffix(dataset_type)
         modification_suffix = self._generate_modification_suffix(dataset_type)
         datatype_suffix = self._generate_datatype_suffix(dataset_type)
@@ -924,6 +1439,9 @@ def apply_filters(self, dataset_type):
         if self.datasets[dataset_type]["data"] is None:
             messagebox.showerror("Error", f"No {dataset_type} data loaded.")
             return
+        if self._all_datasets_selected(dataset_type):
+            self.store_filtered_slot(dataset_type)
+            return
 
         filtered_data, fit_data = self.apply_filters(dataset_type)
 
@@ -944,7 +1462,7 @@ def apply_filters(self, dataset_type):
         filter_suffix = self._generate_filter_suffix(dataset_type)
         modification_suffix = self._generate_modification_suffix(dataset_type)
         datatype_suffix = self._generate_datatype_suffix(dataset_type)
-        dataset_name = f"{os.path.splitext(dataset_file)[0]}_{filter_suffix}_{modification_suffix}_{datatype_suffix}"
+        dataset_name = f"{base_name(self.datasets[dataset_type].get('source_path') or dataset_file)}_{filter_suffix}_{modification_suffix}_{datatype_suffix}"
         
         # Store Dataset in the correct browser
         self.filtered_datasets[dataset_type].append({"name": dataset_name, "data": data_to_store})
@@ -958,6 +1476,51 @@ def apply_filters(self, dataset_type):
 
         messagebox.showinfo("Success", f"Filtered dataset stored: {dataset_name}")
 
+    def _all_datasets_selected(self, dataset_type):
+        widget = self.app.filter_widgets.get(dataset_type)
+        return widget is not None and widget.all_datasets.get()
+
+    def save_filtered_slot(self, dataset_type):
+        """
+        Saves the filtered data of every dataset of the slot into a user-selected folder, named like single saves.
+        """
+        results = self.apply_filters_to_slot(dataset_type)
+        if results is None:
+            return
+
+        save_folder = os.path.join(os.getcwd(), "filtered_data")
+        os.makedirs(save_folder, exist_ok=True)
+        folder = filedialog.askdirectory(title="Save Filtered Data of all Datasets", initialdir=save_folder)
+        if not folder:
+            return
+
+        options = {**self.app.get_filter_options(dataset_type), **self.app.get_modification_options(dataset_type)}
+        try:
+            for name, (filtered_data, fit_data) in results.items():
+                result_to_save(filtered_data, fit_data, options).to_csv(os.path.join(folder, output_filename(name, options)), index=False)
+            messagebox.showinfo("Success", f"Filtered data of {len(results)} datasets saved to {folder}.")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save filtered data: {e}")
+
+    def store_filtered_slot(self, dataset_type):
+        """
+        Stores the filtered data of every dataset of the slot in the respective browser.
+        """
+        if dataset_type not in self.app.data_browsers:
+            messagebox.showerror("Error", f"No data browser found for {dataset_type}.")
+            return
+        results = self.apply_filters_to_slot(dataset_type)
+        if results is None:
+            return
+
+        options = {**self.app.get_filter_options(dataset_type), **self.app.get_modification_options(dataset_type)}
+        for name, (filtered_data, fit_data) in results.items():
+            dataset_name = os.path.splitext(output_filename(name, options))[0]
+            self.filtered_datasets[dataset_type].append({"name": dataset_name, "data": result_to_save(filtered_data, fit_data, options)})
+            self.app.data_browsers[dataset_type].add_dataset(dataset_name)
+
+        messagebox.showinfo("Success", f"Filtered data of {len(results)} datasets stored.")
+
 ### plot modified and filtered data
 
     def plot_filtered_data(self, dataset_type):
@@ -1014,26 +1577,26 @@ def apply_filters(self, dataset_type):
 
             # Determine x, y columns based on the plot type
             if plot_type == "U-t":
-                x = filtered_data["Time[h]"]
-                y = filtered_data["U[V]"]
+                x = filtered_data[TIME]
+                y = filtered_data[VOLTAGE]
                 xlabel, ylabel, title = "Time (h)", "Voltage (V)", f"{dataset_type.capitalize()} Data: U vs t"
 
             elif plot_type == "I-t":
-                x = filtered_data["Time[h]"]
-                y = filtered_data["I[A]"]
+                x = filtered_data[TIME]
+                y = filtered_data[CURRENT]
                 xlabel, ylabel, title = "Time (h)", "Current (A)", f"{dataset_type.capitalize()} Data: I vs t"
 
             elif plot_type == "Q-U":
                 charge_column = (
-                    "Ah-Cyc-Discharge-0"
+                    Q_DISCHARGE
                     if filter_widget.select_discharge_half_cycle.get()
-                    else "Ah-Cyc-Charge-0"
+                    else Q_CHARGE
                 )
                 if charge_column not in filtered_data.columns:
                     messagebox.showerror("Error", f"Column '{charge_column}' not found in dataset.")
                     return
                 x = filtered_data[charge_column]
-                y = filtered_data["U[V]"]
+                y = filtered_data[VOLTAGE]
                 xlabel, ylabel, title = "Charge (Ah)", "Voltage (V)", f"{dataset_type.capitalize()} Data: Q vs U"
 
             else:
@@ -1046,9 +1609,10 @@ def apply_filters(self, dataset_type):
                     messagebox.showerror("Error", f"Selected cycle column '{cycle_column}' is missing in the dataset.")
                     return
 
-                cycle_groups = filtered_data.groupby(cycle_column)
+                cycle_groups = CycleSegmentIndex(filtered_data, cycle_column, command_column=None).cycle_rows()
                 colors = plt.cm.tab10.colors  # Use a colormap for cycles
-                for i, (cycle, group) in enumerate(cycle_groups):
+                for i, (cycle, rows) in enumerate(cycle_groups.items()):
+                    group = filtered_data.iloc[rows]
                     plt.plot(group[x.name], group[y.name], label=f"Cycle {cycle}", color=colors[i % len(colors)])
             else:
                 # Default plot (no cycle grouping)
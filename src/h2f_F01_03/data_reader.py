@@ -0,0 +1,517 @@
+import io
+import os
+import time
+import numpy as np
+import pandas as pd
+from settings import DataSettings
+from data_archives import open_source, is_archive, source_size, uncompressed_size_hint, display_name
+from data_schema import TIME, VOLTAGE, CURRENT, Q_CHARGE, Q_DISCHARGE, CYCLE, LINE, COMMAND, canonical_columns, apply_unit_factors, derive_command
+
+# Explicit dtypes for the known columns of a cycler export (no dtype inference needed)
+CYCLER_DTYPES = {
+    TIME: "float64",
+    VOLTAGE: "float64",
+    CURRENT: "float64",
+    Q_CHARGE: "float64",
+    Q_DISCHARGE: "float64",
+    CYCLE: "int64",
+    LINE: "int64",
+    COMMAND: "object",
+}
+
+# Normalized "~" metadata keys of the fields CyclerFileHeader exposes as attributes
+HEADER_FIELD_KEYS = {
+    "cell": ("cell", "cellname", "cellid", "battery"),
+    "test_plan": ("testplan", "plan", "program", "procedure", "schedule"),
+    "channel": ("channel", "circuit", "chan"),
+    "start_time": ("starttime", "start", "startdate", "teststart", "date"),
+}
+
+
+class CyclerFileHeader:
+    """
+    Metadata block ("~" lines) and table layout of a cycler export.
+    """
+
+    def __init__(self):
+        self.metadata = {}  # All "~key: value" pairs in file order
+        self.cell = None
+        self.test_plan = None
+        self.channel = None
+        self.start_time = None
+        self.columns = []  # Canonical column names of the data table
+        self.unit_factors = {}  # Columns stored in other units -> factor to the canonical unit
+        self.header_lines = 0  # Lines before the first data row (metadata + column header)
+        self.data_offset = 0  # Byte offset of the first data row
+
+    def __repr__(self):
+        return (f"CyclerFileHeader(cell={self.cell!r}, test_plan={self.test_plan!r}, channel={self.channel!r}, "
+                f"start_time={self.start_time!r}, columns={len(self.columns)}, data_offset={self.data_offset})")
+
+    def to_dict(self):
+        """
+        Returns the header as JSON serializable dictionary.
+        """
+        return {
+            "metadata": self.metadata,
+            "columns": self.columns,
+            "unit_factors": self.unit_factors,
+            "header_lines": self.header_lines,
+            "data_offset": self.data_offset,
+        }
+
+    @classmethod
+    def from_dict(cls, values):
+        """
+        Rebuilds a header from the dictionary created by to_dict().
+        """
+        header = cls()
+        for key, value in values.get("metadata", {}).items():
+            header.add_metadata_line(f"~{key}: {value}" if value else f"~{key}")
+        header.columns = list(values.get("columns", []))
+        header.unit_factors = dict(values.get("unit_factors", {}))
+        header.header_lines = values.get("header_lines", 0)
+        header.data_offset = values.get("data_offset", 0)
+        return header
+
+    def add_metadata_line(self, line):
+        """
+        Parses one "~" line into a key/value pair and fills the known fields.
+        """
+        text = line.lstrip("~").strip()
+        if not text:
+            return
+
+        # Split at the first separator the line uses ("key: value", "key=value", "key,value", "key<TAB>value")
+        positions = [pos for pos in (text.find(sep) for sep in (":", "=", "\t", ",")) if pos > 0]
+        if positions:
+            split_at = min(positions)
+            key, value = text[:split_at].strip(), text[split_at + 1:].strip().strip(",")
+        else:
+            key, value = text, ""
+        self.metadata[key] = value
+
+        normalized_key = "".join(ch for ch in key.lower() if ch.isalnum())
+        for field, keys in HEADER_FIELD_KEYS.items():
+            if normalized_key in keys and getattr(self, field) is None and value:
+                setattr(self, field, self._parse_time(value) if field == "start_time" else value)
+
+    @staticmethod
+    def _parse_time(value):
+        """
+        Returns the value as Timestamp, or the raw string if it is not a date.
+        """
+        timestamp = pd.to_datetime(value, errors="coerce", dayfirst="." in value)
+        return value if pd.isna(timestamp) else timestamp
+
+
+def scan_header(file_obj, delimiter=",", header_columns=None):
+    """
+    Reads the "~" metadata block and the column header from a binary file object.
+    Only the file prefix is read; afterwards the file object is positioned at the first data row.
+    With header_columns, the column header is the first line that contains these canonical columns and
+    the lines before it are kept as metadata (preamble of other cycler layouts). Otherwise it is the first line that is no "~" line.
+    """
+    header = CyclerFileHeader()
+    offset = 0
+    for _ in range(DataSettings.HEADER_SCAN_MAX_LINES):
+        raw_line = file_obj.readline()
+        if not raw_line:
+            break
+        offset += len(raw_line)
+        header.header_lines += 1
+        line = raw_line.decode("utf-8", errors="replace").lstrip("\ufeff").rstrip("\r\n")
+
+        if line.startswith("~"):
+            header.add_metadata_line(line)
+        elif line.strip():
+            # Aliases of other layouts get the canonical names right away, so the parser uses canonical names and dtypes
+            columns, unit_factors = canonical_columns(_unique_column_names(line.split(delimiter)))
+            if header_columns is not None and not all(col in columns for col in header_columns):
+                header.add_metadata_line(line)
+                continue
+            header.columns, header.unit_factors = columns, unit_factors
+            header.data_offset = offset
+            return header
+
+    raise ValueError(f"No column header found in the first {DataSettings.HEADER_SCAN_MAX_LINES} lines.")
+
+
+def _unique_column_names(names):
+    """
+    Strips column names and names empty or duplicate ones like pandas does.
+    """
+    unique_names = []
+    for i, name in enumerate(names):
+        name = name.strip() or f"Unnamed: {i}"
+        candidate, count = name, 0
+        while candidate in unique_names:
+            count += 1
+            candidate = f"{name}.{count}"
+        unique_names.append(candidate)
+    return unique_names
+
+
+def last_line_end(file_obj, file_size, start=0):
+    """
+    Returns the byte offset behind the last complete line (last newline) between start and file_size.
+    Lines that are still being written by the cycler are left out this way.
+    """
+    block_size = 65536
+    position = file_size
+    while position > start:
+        block_start = max(position - block_size, start)
+        file_obj.seek(block_start)
+        block = file_obj.read(position - block_start)
+        newline = block.rfind(b"\n")
+        if newline >= 0:
+            return block_start + newline + 1
+        position = block_start
+    return start
+
+
+def _sample_lines(sample):
+    """
+    Returns the complete lines of the first bytes of a file.
+    """
+    return sample.decode("utf-8", errors="replace").lstrip("\ufeff").split("\n")[:-1]
+
+
+class _BoundedFile(io.RawIOBase):
+    """
+    Read-only view of a binary file that ends at a fixed byte offset (or at the end of the stream if end_offset is None).
+    Counts the lines passed to the parser, so rows skipped by on_bad_lines="skip" can be reported.
+    """
+
+    def __init__(self, file_obj, end_offset=None):
+        self._file = file_obj
+        self._end_offset = end_offset
+        self.line_count = 0
+        self._last_byte = b"\n"
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        view = memoryview(buffer)
+        if self._end_offset is not None:
+            remaining = self._end_offset - self._file.tell()
+            if remaining <= 0:
+                return 0
+            view = view[:remaining]
+        n_bytes = self._file.readinto(view) or 0
+        if n_bytes:
+            block = view[:n_bytes].tobytes()
+            self.line_count += block.count(b"\n")
+            self._last_byte = block[-1:]
+        return n_bytes
+
+    @property
+    def lines(self):
+        """
+        Lines read so far, including a last line without line break.
+        """
+        return self.line_count + (self._last_byte != b"\n")
+
+
+class LoadCancelled(Exception):
+    """
+    Raised by CyclerFileReader when a load is cancelled between two chunks.
+    """
+
+
+class CyclerFileReader:
+    """
+    Streams a cycler export in bounded-size chunks into preallocated column arrays.
+    Reads comma separated exports with an optional "~" metadata block; the readers of other layouts
+    in reader_registry change the class attributes below.
+    """
+
+    name = "comma"
+    delimiter = ","
+    decimal = "."
+    header_columns = None  # Canonical columns that identify the column header, None for the first line after the "~" block
+
+    @classmethod
+    def _header_line_index(cls, lines):
+        """
+        Returns the index of the column header in the first lines of a file, or None if the lines do not match the layout.
+        """
+        for i, line in enumerate(lines[:DataSettings.HEADER_SCAN_MAX_LINES]):
+            if line.startswith("~") or not line.strip():
+                continue
+            columns = canonical_columns(_unique_column_names(line.split(cls.delimiter)))[0]
+            if all(col in columns for col in cls.header_columns or (TIME,)):
+                return i
+            if cls.header_columns is None:
+                return None
+        return None
+
+    @classmethod
+    def sniff(cls, file_path, sample):
+        """
+        Returns True if the first bytes of a (decompressed) file look like the layout of this reader.
+        """
+        return cls._header_line_index(_sample_lines(sample)) is not None
+
+    def configure(self, sample):
+        """
+        Adjusts the reader to a file from its first bytes: layouts that are not comma separated may use decimal commas.
+        """
+        if self.delimiter == ",":
+            return
+        lines = _sample_lines(sample)
+        header_index = self._header_line_index(lines)
+        rows = [line for line in lines[header_index + 1:] if line.strip()] if header_index is not None else []
+        if rows:
+            self.decimal = "," if "," in rows[0] else "."
+
+    def supports_random_access(self, file_path):
+        """
+        Returns True if previews and follow updates can seek in the file (not for compressed files).
+        """
+        return not is_archive(file_path)
+
+    def scan_header(self, file_obj):
+        return scan_header(file_obj, self.delimiter, self.header_columns)
+
+    def read_header(self, file_path):
+        """
+        Returns the header of a file without parsing its data.
+        """
+        with open_source(file_path) as (f, _):
+            return self.scan_header(f)
+
+    def __init__(self, chunk_rows=None):
+        self.chunk_rows = chunk_rows or DataSettings.CHUNK_ROWS
+        self.last_stats = None  # rows, seconds and rows per second of the last read
+        self.last_header = None  # CyclerFileHeader of the last read
+        self._end_offset = 0
+        self._tail_rows = 0
+        self._lines_read = 0
+
+    def read(self, file_path, columns=None, progress_callback=None, cancel_event=None):
+        """
+        Reads the given file chunk by chunk and returns a DataFrame.
+        Integer columns fall back to float64 if the file contains gaps in them.
+
+        Parameters:
+        - columns (list, optional): Only these columns are parsed (if present in the file); all columns if None.
+        - progress_callback (callable, optional): Called after every chunk as progress_callback(bytes_read, total_bytes, rows).
+        - cancel_event (threading.Event, optional): Raises LoadCancelled at the next chunk once it is set.
+        """
+        start = time.perf_counter()
+        try:
+            data = self._read_chunks(file_path, CYCLER_DTYPES, columns, progress_callback, cancel_event)
+        except (ValueError, TypeError) as e:
+            print(f"⚠️ Typed import failed ({e}), retrying with float columns.")
+            relaxed_dtypes = {col: ("float64" if dtype.startswith("int") else dtype) for col, dtype in CYCLER_DTYPES.items()}
+            data = self._read_chunks(file_path, relaxed_dtypes, columns, progress_callback, cancel_event)
+        apply_unit_factors(data, self.last_header.unit_factors)
+        derive_command(data, self.last_header.columns, columns)
+
+        seconds = max(time.perf_counter() - start, 1e-9)
+        self.last_stats = {
+            "rows": len(data),
+            "seconds": seconds,
+            "rows_per_second": len(data) / seconds,
+            "end_offset": self._end_offset,  # Byte offset behind the last complete line (None for archives)
+            "tail_rows": self._tail_rows,  # Rows parsed from an unterminated last line behind end_offset
+            "skipped_lines": max(self._lines_read - len(data), 0),  # Malformed and blank lines dropped by the parser
+        }
+        print(f"✅ Imported {len(data)} rows in {seconds:.2f} s ({self.last_stats['rows_per_second']:,.0f} rows/s)")
+        return data
+
+    def _read_chunks(self, file_path, dtypes, columns=None, progress_callback=None, cancel_event=None):
+        """
+        Scans the header, then parses all chunks from the data offset and copies them into the column buffers.
+        """
+        total_bytes = source_size(file_path)
+        with open_source(file_path) as (f, raw_file):
+            start_position = raw_file.tell()  # Start of the compressed data of zip members
+            header = self.scan_header(f)  # Leaves f at the first data row
+            self.last_header = header
+
+            if is_archive(file_path):
+                # Archives are decompressed as a stream straight into the parser and are not followed
+                self._end_offset = None
+                self._tail_rows = 0
+                line_counter = _BoundedFile(f)
+            else:
+                # Parse to the end of the file as it was when the load started, rows appended while reading are
+                # left for the next follow update. Follow mode continues behind the last complete line, so an
+                # unterminated last line is parsed now and replaced once the cycler has finished writing it.
+                self._end_offset = last_line_end(f, total_bytes, header.data_offset)
+                f.seek(self._end_offset)
+                self._tail_rows = int(bool(f.read(total_bytes - self._end_offset).strip()))
+                f.seek(header.data_offset)
+                line_counter = _BoundedFile(f, total_bytes)
+            data_stream = io.BufferedReader(line_counter)
+
+            usecols = self._projected_columns(header, columns)
+            reader = pd.read_csv(
+                data_stream, header=None, names=header.columns, usecols=usecols, delimiter=self.delimiter, decimal=self.decimal,
+                encoding="utf-8", on_bad_lines="skip",
+                dtype={col: dtype for col, dtype in dtypes.items() if col in header.columns}, chunksize=self.chunk_rows,
+            )
+
+            def on_chunk(rows):
+                if cancel_event is not None and cancel_event.is_set():
+                    raise LoadCancelled(f"Loading {display_name(file_path)} was cancelled.")
+                if progress_callback is not None:
+                    progress_callback(min(raw_file.tell() - start_position, total_bytes), total_bytes, rows)
+
+            with reader:
+                data = self._collect_chunks(reader, header, self._estimate_rows(file_path, header.data_offset), on_chunk)
+            self._lines_read = line_counter.lines
+            return data
+
+    def _collect_chunks(self, chunks, header, estimated_rows, on_chunk=None):
+        """
+        Copies DataFrame chunks (e.g. of a pandas chunk reader) into preallocated column buffers.
+        on_chunk(rows) is called after every chunk.
+        """
+        buffers = None
+        columns = []
+        n_rows = 0
+        for chunk in chunks:
+            if buffers is None:
+                columns = chunk.columns.tolist()
+                capacity = max(estimated_rows, len(chunk))
+                buffers = {col: np.empty(capacity, dtype=chunk[col].to_numpy().dtype) for col in columns}
+
+            n_chunk = len(chunk)
+            capacity = len(buffers[columns[0]]) if columns else 0
+            if n_rows + n_chunk > capacity:
+                new_capacity = max(int(capacity * DataSettings.GROWTH_FACTOR), n_rows + n_chunk)
+                buffers = {col: self._grow(buf, n_rows, new_capacity) for col, buf in buffers.items()}
+
+            for col in columns:
+                values = chunk[col].to_numpy()
+                if values.dtype != buffers[col].dtype:
+                    # Inferred columns may change their dtype between chunks (e.g. int -> float)
+                    buffers[col] = self._grow(buffers[col], n_rows, len(buffers[col]), np.result_type(buffers[col].dtype, values.dtype))
+                buffers[col][n_rows:n_rows + n_chunk] = values
+            n_rows += n_chunk
+            if on_chunk is not None:
+                on_chunk(n_rows)
+
+        if buffers is None:
+            return pd.DataFrame(columns=self._projected_columns(header, columns) or header.columns)
+
+        # Release the unused part of the preallocation
+        return pd.DataFrame({col: self._trim(buffers[col], n_rows) for col in columns}, copy=False)
+
+    @staticmethod
+    def _projected_columns(header, columns):
+        """
+        Returns the requested columns that exist in the file (in file order), or None to parse all columns.
+        The current is added if Command has to be derived from it.
+        """
+        if columns is None:
+            return None
+        columns = set(columns)
+        if COMMAND in columns and COMMAND not in header.columns:
+            columns.add(CURRENT)  # Command is derived from the current (see derive_command)
+        usecols = [col for col in header.columns if col in columns]
+        return usecols or None
+
+    def read_preview(self, file_path, columns=None, max_rows=None, time_budget=None):
+        """
+        Returns a time-decimated subset of the file within a fixed latency budget.
+        Single rows are read at evenly spaced byte offsets, so no full parse is needed. The offsets are
+        visited coarse to fine (0, 1/2, 1/4, 3/4, ...), so a preview cut short by the budget still spans the whole test.
+        """
+        if not self.supports_random_access(file_path):
+            raise ValueError("Previews need random access and are not available for compressed files and workbooks.")
+        max_rows = max_rows or DataSettings.PREVIEW_ROWS
+        time_budget = time_budget or DataSettings.PREVIEW_TIME_BUDGET
+        start = time.perf_counter()
+
+        with open(file_path, "rb") as f:
+            header = self.scan_header(f)
+            self.last_header = header
+            data_size = os.path.getsize(file_path) - header.data_offset
+
+            n_bits = max(int(np.ceil(np.log2(max(max_rows, 2)))), 1)
+            lines = {}
+            for i in range(2 ** n_bits):
+                if time.perf_counter() - start > time_budget:
+                    break
+                # Bit-reversed index gives the coarse to fine order of the sample positions
+                position = header.data_offset + data_size * int(format(i, f"0{n_bits}b")[::-1], 2) // 2 ** n_bits
+                f.seek(position)
+                if position > header.data_offset:
+                    f.readline()  # Skip the partial line at the sample position
+                row_offset = f.tell()
+                line = f.readline()
+                if line.strip():
+                    lines[row_offset] = line if line.endswith(b"\n") else line + b"\n"
+
+        text = b"".join(lines[offset] for offset in sorted(lines))
+        data = pd.read_csv(
+            io.BytesIO(text), header=None, names=header.columns, usecols=self._projected_columns(header, columns),
+            delimiter=self.delimiter, decimal=self.decimal, encoding="utf-8", on_bad_lines="skip",
+            dtype={col: ("float64" if dtype.startswith("int") else dtype) for col, dtype in CYCLER_DTYPES.items() if col in header.columns},
+        )
+
+        apply_unit_factors(data, header.unit_factors)
+        derive_command(data, header.columns, columns)
+
+        seconds = max(time.perf_counter() - start, 1e-9)
+        self.last_stats = {"rows": len(data), "seconds": seconds, "rows_per_second": len(data) / seconds}
+        print(f"✅ Preview of {len(data)} rows in {seconds:.2f} s")
+        return data
+
+    def read_appended(self, file_path, header, start_offset, columns=None):
+        """
+        Parses only the complete lines appended to a file behind start_offset.
+        Returns the new rows and the byte offset behind the last parsed line.
+        """
+        with open(file_path, "rb") as f:
+            file_size = os.fstat(f.fileno()).st_size
+            end_offset = last_line_end(f, file_size, start_offset)
+            if end_offset <= start_offset:
+                return pd.DataFrame(columns=self._projected_columns(header, columns) or header.columns), start_offset
+
+            f.seek(start_offset)
+            text = f.read(end_offset - start_offset)
+
+        data = pd.read_csv(
+            io.BytesIO(text), header=None, names=header.columns, usecols=self._projected_columns(header, columns),
+            delimiter=self.delimiter, decimal=self.decimal, encoding="utf-8", on_bad_lines="skip",
+            dtype={col: ("float64" if dtype.startswith("int") else dtype) for col, dtype in CYCLER_DTYPES.items() if col in header.columns},
+        )
+        apply_unit_factors(data, header.unit_factors)
+        return derive_command(data, header.columns, columns), end_offset
+
+    def _estimate_rows(self, file_path, data_offset=0):
+        """
+        Estimates the number of rows from the file size and the line length of the first data block.
+        """
+        data_size = uncompressed_size_hint(file_path) - data_offset
+        with open_source(file_path) as (f, _):
+            f.read(data_offset)  # Skips the header (streams of archives cannot seek)
+            sample = f.read(DataSettings.ROW_ESTIMATE_SAMPLE_BYTES)
+        newlines = sample.count(b"\n")
+        if not newlines:
+            return self.chunk_rows
+        return int(data_size / (len(sample) / newlines) * 1.02) + 1
+
+    @staticmethod
+    def _grow(buffer, n_rows, capacity, dtype=None):
+        """
+        Returns a larger (or retyped) buffer containing the first n_rows values.
+        """
+        grown = np.empty(capacity, dtype=dtype or buffer.dtype)
+        grown[:n_rows] = buffer[:n_rows]
+        return grown
+
+    @staticmethod
+    def _trim(buffer, n_rows):
+        """
+        Cuts a buffer to n_rows, copying only if a noticeable part is unused.
+        """
+        if len(buffer) - n_rows > 0.05 * len(buffer):
+            return buffer[:n_rows].copy()
+        return buffer[:n_rows]
@@ -0,0 +1,326 @@
+import numpy as np
+import pandas as pd
+from settings import DataSettings
+
+### canonical column names
+
+TIME = "Time[h]"
+VOLTAGE = "U[V]"
+CURRENT = "I[A]"
+Q_CHARGE = "Ah-Cyc-Charge-0"
+Q_DISCHARGE = "Ah-Cyc-Discharge-0"
+CYCLE = "Cyc-Count"
+LINE = "Line"
+COMMAND = "Command"
+AH_TOTAL = "Ah[Ah]"
+ENERGY = "Wh[Wh]"
+TEMPERATURE = "T1[°C]"
+ABS_CYCLE = "abs_cycle"  # Computed, see cycle_tools.compute_abs_cycle
+
+CANONICAL_COLUMNS = (TIME, VOLTAGE, CURRENT, Q_CHARGE, Q_DISCHARGE, CYCLE, LINE, COMMAND, AH_TOTAL, ENERGY, TEMPERATURE)
+
+# Other names of the canonical columns -> (canonical name, factor to the canonical unit)
+COLUMN_ALIASES = {
+    "Time": (TIME, 1.0),
+    "Voltage": (VOLTAGE, 1.0),
+    "Current": (CURRENT, 1.0),
+    "Charge_Ah": (AH_TOTAL, 1.0),
+    "Energy_Wh": (ENERGY, 1.0),
+    "Temperature": (TEMPERATURE, 1.0),
+    "mAh-Cyc-Charge-0": (Q_CHARGE, 1e-3),
+    "mAh-Cyc-Discharge-0": (Q_DISCHARGE, 1e-3),
+    "Cycle": (CYCLE, 1.0),
+    # Layouts of other cycler vendors (see reader_registry)
+    "Cycle_Index": (CYCLE, 1.0),
+    "Step_Index": (LINE, 1.0),
+    "Charge_Capacity(Ah)": (Q_CHARGE, 1.0),
+    "Discharge_Capacity(Ah)": (Q_DISCHARGE, 1.0),
+    "cycle number": (CYCLE, 1.0),
+    "Ns": (LINE, 1.0),
+    "Q charge/mA.h": (Q_CHARGE, 1e-3),
+    "Q discharge/mA.h": (Q_DISCHARGE, 1e-3),
+}
+
+# Other names of the quantities of canonical columns with a unit ("Voltage(mV)" and "Ewe/mV" are read like "U[mV]")
+QUANTITY_ALIASES = {
+    "Voltage": "U",
+    "Ewe": "U",
+    "Current": "I",
+    "Test_Time": "Time",
+    "time": "Time",
+    "Temperature": "T1",
+}
+
+# Factors between units of the same quantity ("U[mV]" is read as "U[V]" times 1e-3)
+UNIT_FACTORS = {
+    ("s", "h"): 1 / 3600,
+    ("min", "h"): 1 / 60,
+    ("mV", "V"): 1e-3,
+    ("mA", "A"): 1e-3,
+    ("µA", "A"): 1e-6,
+    ("mAh", "Ah"): 1e-3,
+    ("mWh", "Wh"): 1e-3,
+}
+
+# Categories of the Command column derived from the current (see derive_command)
+DERIVED_COMMANDS = ("Charge", "Discharge", "Pause")
+
+# Column groups of the compact schema
+CATEGORICAL_COLUMNS = (COMMAND,)
+INTEGER_COLUMNS = (CYCLE, LINE)
+MEASUREMENT_COLUMNS = (TIME, VOLTAGE, CURRENT, Q_CHARGE, Q_DISCHARGE)
+
+
+def _split_unit(name):
+    """
+    Splits "U[mV]", "Voltage(mV)" and "Ewe/mV" into (quantity, "mV"). Names without unit return (name, None).
+    """
+    for opening, closing in (("[", "]"), ("(", ")")):
+        if name.endswith(closing) and opening in name:
+            base, unit = name[:-1].rsplit(opening, 1)
+            return base.strip(), unit.strip()
+    if "/" in name:
+        base, unit = name.rsplit("/", 1)
+        return base.strip(), unit.strip()
+    return name, None
+
+
+# Canonical columns by quantity ("U" -> ("U[V]", "V"))
+_CANONICAL_UNITS = {_split_unit(col)[0]: (col, _split_unit(col)[1]) for col in CANONICAL_COLUMNS if _split_unit(col)[1]}
+
+
+def canonical_column(name):
+    """
+    Returns (canonical name, unit factor) of a column name of any supported layout.
+    Unknown columns keep their name and a factor of 1.
+    """
+    name = name.strip()
+    if name in CANONICAL_COLUMNS:
+        return name, 1.0
+    if name in COLUMN_ALIASES:
+        return COLUMN_ALIASES[name]
+
+    base, unit = _split_unit(name)
+    base = QUANTITY_ALIASES.get(base, base)
+    if base in _CANONICAL_UNITS and unit is not None:
+        canonical, canonical_unit = _CANONICAL_UNITS[base]
+        if unit == canonical_unit:
+            return canonical, 1.0
+        if (unit, canonical_unit) in UNIT_FACTORS:
+            return canonical, UNIT_FACTORS[(unit, canonical_unit)]
+    return name, 1.0
+
+
+def canonical_columns(names):
+    """
+    Maps the column names of a file to canonical names. Returns (names, unit factors of the converted columns).
+    If several columns map to the same canonical name, the first one wins and the others keep their names.
+    """
+    canonical_names, unit_factors = [], {}
+    for name in names:
+        canonical, factor = canonical_column(name)
+        if canonical != name and canonical in canonical_names + list(names):
+            canonical, factor = name, 1.0
+        canonical_names.append(canonical)
+        if factor != 1.0:
+            unit_factors[canonical] = factor
+    return canonical_names, unit_factors
+
+
+def apply_unit_factors(data, unit_factors):
+    """
+    Converts the columns of a freshly parsed dataset to canonical units (one vectorized multiplication per column).
+    """
+    for col, factor in unit_factors.items():
+        if col in data.columns:
+            data[col] = data[col].to_numpy(dtype=np.float64) * factor
+    return data
+
+
+def derive_command(data, header_columns, columns=None):
+    """
+    Adds a Command column to datasets of layouts without one (e.g. Arbin, EC-Lab and workbook exports),
+    so the pause and half cycle filters work on them: Charge if I > 0, Discharge if I < 0, Pause if I == 0.
+    Rows without a current get no command. Nothing is added if the file has a Command column,
+    if the current was not parsed or if Command is not among the requested columns.
+    """
+    if COMMAND in header_columns or CURRENT not in data.columns or (columns is not None and COMMAND not in columns):
+        return data
+    current = data[CURRENT].to_numpy(dtype=np.float64)
+    codes = np.select([current > 0, current < 0, current == 0], [0, 1, 2], default=-1).astype(np.int8)
+    data[COMMAND] = pd.Categorical.from_codes(codes, categories=DERIVED_COMMANDS)
+    return data
+
+
+def normalize_columns(data):
+    """
+    Renames the columns of a DataFrame to the canonical names and converts them to canonical units.
+    """
+    names, unit_factors = canonical_columns([str(col) for col in data.columns])
+    data = data.set_axis(names, axis=1)
+    return apply_unit_factors(data, unit_factors)
+
+
+def schema_signature():
+    """
+    Returns a short tag of the schema and repair options, so cached data of other options is not reused.
+    """
+    columns = ",".join(DataSettings.WORKING_COLUMNS) if DataSettings.PROJECT_COLUMNS else "all"
+    return f"compact-v2-f32={int(DataSettings.USE_FLOAT32)}-repair={int(DataSettings.VALIDATION_REPAIR)}-cols={columns}"
+
+
+def working_columns():
+    """
+    Returns the columns parsed at import, or None if all columns are imported.
+    """
+    return list(DataSettings.WORKING_COLUMNS) if DataSettings.PROJECT_COLUMNS else None
+
+
+def apply_compact_schema(data, use_float32=None):
+    """
+    Converts a raw dataset to compact dtypes and returns (data, memory_report):
+    - Command (and other repetitive text columns) become categorical
+    - Cyc-Count and Line become the smallest sufficient integer type
+    - measurement columns become float32 if enabled and the precision guard allows it
+    """
+    use_float32 = DataSettings.USE_FLOAT32 if use_float32 is None else use_float32
+    before = _column_usage(data)
+    compact = {}
+
+    for col in data.columns:
+        values = data[col]
+
+        if col in INTEGER_COLUMNS and pd.api.types.is_numeric_dtype(values):
+            compact[col] = _downcast_integer(values)
+
+        elif use_float32 and col in MEASUREMENT_COLUMNS and pd.api.types.is_float_dtype(values):
+            compact[col] = _to_float32(col, values)
+
+        elif (col in CATEGORICAL_COLUMNS or _is_repetitive_text(values)) and not isinstance(values.dtype, pd.CategoricalDtype):
+            if pd.api.types.is_object_dtype(values) or pd.api.types.is_string_dtype(values):
+                compact[col] = values.astype("category")
+            else:
+                compact[col] = values
+
+        else:
+            compact[col] = values
+
+    compact_data = pd.DataFrame(compact, index=data.index, copy=False)
+    after = _column_usage(compact_data)
+    report = {
+        col: {
+            "dtype_before": before[col][0], "bytes_before": before[col][1],
+            "dtype_after": after[col][0], "bytes_after": after[col][1],
+        }
+        for col in compact_data.columns
+    }
+    return compact_data, report
+
+
+def append_rows(data, new_rows):
+    """
+    Appends rows to a compact dataset and returns the combined dataset (see concat_datasets).
+    """
+    return concat_datasets([data, new_rows])
+
+
+def concat_datasets(parts):
+    """
+    Concatenates compact datasets at once and returns the combined dataset with the columns of the first part.
+    Categories of all parts are merged, so categorical columns stay categorical, float columns keep the
+    type of the first part and integer columns get the smallest type that holds the combined values.
+    """
+    columns = parts[0].columns
+    parts = [part.reindex(columns=columns) for part in parts]
+    combined = {}
+    for col in columns:
+        first = parts[0][col]
+        values = [part[col].reset_index(drop=True) for part in parts]
+        if isinstance(first.dtype, pd.CategoricalDtype):
+            categories = first.cat.categories
+            for part_values in values[1:]:
+                new_values = part_values.cat.categories if isinstance(part_values.dtype, pd.CategoricalDtype) else part_values.dropna().unique()
+                categories = categories.union(pd.Index(new_values), sort=False)
+            values = [pd.Series(pd.Categorical(part_values, categories=categories), name=col) for part_values in values]
+        elif pd.api.types.is_float_dtype(first):
+            values = [part_values.astype(first.dtype) if pd.api.types.is_numeric_dtype(part_values) else part_values for part_values in values]
+        combined[col] = pd.concat(values, ignore_index=True)
+
+    combined_data = pd.DataFrame(combined, copy=False)
+    for col in INTEGER_COLUMNS:
+        if col in combined_data.columns and pd.api.types.is_numeric_dtype(combined_data[col]):
+            combined_data[col] = _downcast_integer(combined_data[col])
+    return combined_data
+
+
+def _downcast_integer(values):
+    """
+    Returns the smallest integer type (at least int16, to leave room for offsets) that holds all values.
+    Columns with gaps stay as they are.
+    """
+    if values.isna().any():
+        return values
+    as_int = values.to_numpy()
+    if not np.issubdtype(as_int.dtype, np.integer):
+        if not np.all(np.mod(as_int, 1) == 0):
+            return values
+    low, high = (int(as_int.min()), int(as_int.max())) if len(as_int) else (0, 0)
+    for dtype in (np.int16, np.int32, np.int64):
+        if np.iinfo(dtype).min <= low and high <= np.iinfo(dtype).max:
+            return pd.Series(as_int.astype(dtype, copy=False), index=values.index, name=values.name)
+    return values
+
+
+def _to_float32(col, values):
+    """
+    Returns the column as float32 if the rounding error stays within the tolerance of the column (precision guard).
+    """
+    as_float32 = values.to_numpy().astype(np.float32)
+    tolerance = DataSettings.FLOAT32_TOLERANCES.get(col, DataSettings.FLOAT32_DEFAULT_TOLERANCE)
+    error = np.nanmax(np.abs(as_float32.astype(np.float64) - values.to_numpy())) if len(values) else 0.0
+    if error > tolerance:
+        print(f"⚠️ Keeping {col} as float64: float32 error {error:.3g} exceeds tolerance {tolerance:.3g}")
+        return values
+    return pd.Series(as_float32, index=values.index, name=values.name)
+
+
+def _is_repetitive_text(values):
+    """
+    True for text columns with few distinct values compared to their length (checked on a sample).
+    """
+    if not (pd.api.types.is_object_dtype(values) or pd.api.types.is_string_dtype(values)) or len(values) == 0:
+        return False
+    sample = values.iloc[:: max(len(values) // 10_000, 1)]
+    return sample.nunique(dropna=True) <= DataSettings.CATEGORY_MAX_UNIQUE_RATIO * len(sample)
+
+
+def _column_usage(data):
+    """
+    Returns {column: (dtype name, bytes)} including the memory of Python string objects.
+    """
+    usage = data.memory_usage(index=False, deep=True)
+    return {col: (str(data[col].dtype), int(usage[col])) for col in data.columns}
+
+
+def memory_report_table(report):
+    """
+    Converts a memory report to a DataFrame with one row per column and a total row.
+    """
+    rows = [
+        {
+            "Column": col,
+            "dtype before": entry["dtype_before"],
+            "MB before": entry["bytes_before"] / 1024 ** 2,
+            "dtype after": entry["dtype_after"],
+            "MB after": entry["bytes_after"] / 1024 ** 2,
+        }
+        for col, entry in report.items()
+    ]
+    table = pd.DataFrame(rows)
+    if not table.empty:
+        total_before, total_after = table["MB before"].sum(), table["MB after"].sum()
+        table.loc[len(table)] = ["Total", "", total_before, "", total_after]
+        table["Reduction"] = (table["MB before"] / table["MB after"].where(table["MB after"] > 0)).map(
+            lambda ratio: f"{ratio:.1f}x" if pd.notna(ratio) else "-"
+        )
+    return table
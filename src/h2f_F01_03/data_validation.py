@@ -0,0 +1,139 @@
+import time
+import numpy as np
+import pandas as pd
+from settings import DataSettings
+from data_schema import TIME
+
+
+def _numeric_values(series):
+    """
+    Returns the values of a column as NumPy array for comparisons (category codes for categorical columns), or None for text columns.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy()
+    values = series.to_numpy()
+    return values if np.issubdtype(values.dtype, np.number) else None
+
+
+def _duplicate_row_mask(data):
+    """
+    Marks rows that repeat the row before them in every comparable column (e.g. rows exported twice after a resume).
+    """
+    duplicates = np.zeros(len(data), dtype=bool)
+    if len(data) < 2:
+        return duplicates
+    same = None
+    for col in data.columns:
+        values = _numeric_values(data[col])
+        if values is None:
+            continue
+        equal = values[1:] == values[:-1]
+        same = equal if same is None else same & equal
+    if same is not None:
+        duplicates[1:] = same
+    return duplicates
+
+
+def validate_dataset(data, skipped_lines=0, ranges=None):
+    """
+    Checks a freshly parsed dataset in a few vectorized passes and returns a JSON serializable quality report:
+    - skipped_lines: lines dropped by the parser (malformed or blank)
+    - nan_counts: missing values per column (only columns with gaps)
+    - time_reversals / duplicate_timestamps: steps in which Time[h] decreases / does not advance
+    - duplicate_rows: rows that repeat the row before them
+    - out_of_range: values outside the plausible range per column (see DataSettings.VALIDATION_RANGES)
+    """
+    start = time.perf_counter()
+    ranges = DataSettings.VALIDATION_RANGES if ranges is None else ranges
+
+    nan_counts = data.isna().sum()
+    report = {
+        "rows": len(data),
+        "skipped_lines": int(skipped_lines),
+        "nan_counts": {col: int(count) for col, count in nan_counts.items() if count},
+        "time_reversals": 0,
+        "duplicate_timestamps": 0,
+        "duplicate_rows": int(_duplicate_row_mask(data).sum()),
+        "out_of_range": {},
+    }
+
+    if TIME in data.columns and len(data) > 1:
+        steps = np.diff(data[TIME].to_numpy(dtype=np.float64))
+        report["time_reversals"] = int(np.count_nonzero(steps < 0))
+        report["duplicate_timestamps"] = int(np.count_nonzero(steps == 0))
+
+    for col, (lower, upper) in ranges.items():
+        if col not in data.columns:
+            continue
+        values = data[col].to_numpy(dtype=np.float64)
+        count = np.count_nonzero((values < lower) | (values > upper))
+        if count:
+            report["out_of_range"][col] = int(count)
+
+    report["issues"] = issue_count(report)
+    report["seconds"] = time.perf_counter() - start
+    if report["issues"]:
+        print(f"⚠️ Data quality: {report['issues']:,} issues in {len(data):,} rows")
+    return report
+
+
+def issue_count(report):
+    """
+    Returns the number of problems listed in a quality report.
+    """
+    return (
+        report["skipped_lines"] + sum(report["nan_counts"].values()) + report["time_reversals"]
+        + report["duplicate_timestamps"] + report["duplicate_rows"] + sum(report["out_of_range"].values())
+    )
+
+
+def repair_dataset(data):
+    """
+    Removes the rows that break later processing steps and returns (repaired data, number of removed rows per reason):
+    - rows without a time value
+    - rows that repeat the row before them
+    - rows whose time does not advance past all earlier rows, so Time[h] becomes strictly increasing
+    Out-of-range values are only reported, they are never changed.
+    """
+    keep = ~_duplicate_row_mask(data)
+    repairs = {"duplicate_rows": int(np.count_nonzero(~keep))}
+
+    if TIME in data.columns and len(data):
+        times = data[TIME].to_numpy(dtype=np.float64)
+        missing_time = np.isnan(times)
+        repairs["missing_time"] = int(np.count_nonzero(missing_time & keep))
+        keep &= ~missing_time
+
+        # Latest time of all earlier kept rows (fmax ignores the NaN placeholders of removed rows)
+        kept_times = np.where(keep, times, np.nan)
+        previous_max = np.r_[-np.inf, np.fmax.accumulate(kept_times)[:-1]]
+        advancing = np.isnan(previous_max) | (times > previous_max)
+        repairs["non_increasing_time"] = int(np.count_nonzero(keep & ~advancing))
+        keep &= advancing
+
+    if keep.all():
+        return data, repairs
+    return data[keep].reset_index(drop=True), repairs
+
+
+def quality_report_text(report):
+    """
+    Formats a quality report for display.
+    """
+    lines = [
+        f"Rows: {report['rows']:,}",
+        f"Skipped lines: {report['skipped_lines']:,}",
+        f"Time reversals: {report['time_reversals']:,}",
+        f"Duplicate timestamps: {report['duplicate_timestamps']:,}",
+        f"Duplicate rows: {report['duplicate_rows']:,}",
+        "",
+        "Missing values:",
+    ]
+    lines += [f"  {col}: {count:,}" for col, count in report["nan_counts"].items()] or ["  none"]
+    lines += ["", "Out of range:"]
+    lines += [f"  {col}: {count:,}" for col, count in report["out_of_range"].items()] or ["  none"]
+    if report.get("repairs"):
+        lines += ["", "Removed by repair:"]
+        lines += [f"  {reason}: {count:,}" for reason, count in report["repairs"].items()]
+    lines += ["", f"Checked in {report['seconds'] * 1000:.1f} ms"]
+    return "\n".join(lines)
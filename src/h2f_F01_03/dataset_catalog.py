@@ -0,0 +1,147 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import numpy as np
+from settings import DataSettings
+from reader_registry import reader_for
+from data_archives import list_cycler_files, split_member, display_name
+from data_schema import TIME, VOLTAGE, Q_CHARGE, Q_DISCHARGE, CYCLE
+from cycle_tools import compute_abs_cycle
+
+# Columns parsed for a file summary, all other columns are skipped
+SUMMARY_COLUMNS = (TIME, VOLTAGE, Q_CHARGE, Q_DISCHARGE, CYCLE)
+
+
+def file_stamp(file_path):
+    """
+    Returns (size, mtime_ns) of the file on disk (the archive for zip members), used to detect changed files.
+    """
+    stat = os.stat(split_member(file_path)[0])
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def summarize_file(file_path):
+    """
+    Parses the summary columns of a file and returns its catalog entry.
+    """
+    reader = reader_for(file_path)
+    data = reader.read(file_path, columns=SUMMARY_COLUMNS)
+    header = reader.last_header
+
+    def column_range(column):
+        if column not in data.columns or data[column].isna().all():
+            return None, None
+        values = data[column].to_numpy()
+        return float(np.nanmin(values)), float(np.nanmax(values))
+
+    time_min, time_max = column_range(TIME)
+    u_min, u_max = column_range(VOLTAGE)
+    return {
+        "name": display_name(file_path),
+        "stamp": file_stamp(file_path),
+        "rows": len(data),
+        "cycles": int(compute_abs_cycle(data[CYCLE].to_numpy()).max()) if CYCLE in data.columns and len(data) else None,  # Cyc-Count restarts
+        "time_span_h": time_max - time_min if time_min is not None else None,
+        "u_min": u_min,
+        "u_max": u_max,
+        "q_charge_max": column_range(Q_CHARGE)[1],
+        "q_discharge_max": column_range(Q_DISCHARGE)[1],
+        "columns": header.columns,
+        "cell": header.cell,
+        "test_plan": header.test_plan,
+        "start_time": str(header.start_time) if header.start_time is not None else None,
+    }
+
+
+class DatasetCatalog:
+    """
+    Index of the cycler files of a data folder with a precomputed summary per file.
+    The index is kept as small JSON file in the cache folder; rescans only re-read new and changed files.
+    """
+
+    INDEX_VERSION = 2
+
+    def __init__(self, folder, cache_dir=None):
+        self.folder = os.path.abspath(folder)
+        self.cache_dir = cache_dir or DataSettings.CACHE_DIR
+        folder_key = hashlib.blake2b(self.folder.encode("utf-8"), digest_size=8).hexdigest()
+        self.index_path = os.path.join(self.cache_dir, f"catalog_{folder_key}.json")
+        self.entries = self._load_index()  # File path -> summary
+        self._lock = threading.Lock()
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if index.get("version") != self.INDEX_VERSION or index.get("folder") != self.folder:
+            return {}
+        return index.get("files", {})
+
+    def _save_index(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f"{self.index_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": self.INDEX_VERSION, "folder": self.folder, "files": self.entries}, f, indent=1)
+        os.replace(tmp_path, self.index_path)
+
+    def scan(self, progress_callback=None, cancel_event=None):
+        """
+        Brings the index up to date with the folder: new and changed files are summarized in parallel,
+        unchanged files keep their summary and removed files are dropped.
+        progress_callback(done, total, file_path) is called after every summarized file.
+        Returns (number of summarized files, number of failed files, seconds).
+        """
+        start = time.perf_counter()
+        file_paths = list_cycler_files(self.folder)
+        outdated = [path for path in file_paths if self.entries.get(path, {}).get("stamp") != file_stamp(path)]
+
+        with self._lock:
+            self.entries = {path: entry for path, entry in self.entries.items() if path in file_paths}
+
+        failed = 0
+        if outdated:
+            with ThreadPoolExecutor(max_workers=min(len(outdated), DataSettings.CATALOG_MAX_WORKERS)) as pool:
+                futures = {pool.submit(summarize_file, path): path for path in outdated}
+                for done, future in enumerate(as_completed(futures), start=1):
+                    path = futures[future]
+                    try:
+                        entry = future.result()
+                    except Exception as e:
+                        failed += 1
+                        entry = {"name": display_name(path), "stamp": file_stamp(path), "error": str(e)}
+                    with self._lock:
+                        self.entries[path] = entry
+                    if progress_callback is not None:
+                        progress_callback(done, len(outdated), path)
+                    if cancel_event is not None and cancel_event.is_set():
+                        for pending in futures:
+                            pending.cancel()
+                        break
+
+        with self._lock:
+            self._save_index()
+        return len(outdated), failed, time.perf_counter() - start
+
+    def rows(self, search_text="", sort_key="name", descending=False):
+        """
+        Returns (file path, summary) pairs whose name, cell or test plan contain the search text, sorted by sort_key.
+        """
+        search_text = search_text.strip().lower()
+        with self._lock:
+            items = list(self.entries.items())
+        if search_text:
+            items = [
+                (path, entry) for path, entry in items
+                if search_text in " ".join(str(entry.get(key) or "") for key in ("name", "cell", "test_plan")).lower()
+            ]
+
+        # Entries without a value are always listed last
+        present = [item for item in items if item[1].get(sort_key) is not None]
+        missing = [item for item in items if item[1].get(sort_key) is None]
+        present.sort(key=lambda item: item[1][sort_key], reverse=descending)
+        return present + missing
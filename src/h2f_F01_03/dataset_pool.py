@@ -0,0 +1,152 @@
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+from settings import DataSettings
+from data_cache import full_content_hash
+from data_archives import split_member, display_name
+from data_schema import schema_signature
+
+
+class DatasetPool:
+    """
+    Raw datasets of all slots, stored once per file content. Loading a file that is already in the pool
+    (also a copy under another name or a file loaded into another slot) returns the pooled DataFrame instead of
+    parsing it again. Entries are reference counted by the slots that hold them; entries no slot holds anymore
+    are kept for a quick reload and evicted least recently used first once the pool exceeds POOL_MAX_BYTES.
+    on_release(key) is called when an entry is evicted or its data is replaced, so results holding views of
+    the old data (see ResultCache.invalidate) are released with it.
+    """
+
+    def __init__(self, max_bytes=None, on_release=None):
+        self.max_bytes = max_bytes or DataSettings.POOL_MAX_BYTES
+        self.on_release = on_release
+        self.entries = OrderedDict()  # key -> entry dict, least recently used first
+        self._hashes = {}  # (path, size, mtime) -> full content hash, so unchanged files are hashed once
+        self._lock = threading.RLock()  # Background loads look up entries
+
+    def key_for(self, file_paths):
+        """
+        Returns the pool key of the dataset parsed from file_paths (several files for stitched test runs).
+        The key depends on the file contents and the import schema, not on the file names. The whole content
+        is hashed (a sampled hash would share the stale data of a file re-exported at the same size).
+        """
+        parts = [schema_signature()]
+        for path in file_paths:
+            archive_path, member = split_member(path)
+            size = os.path.getsize(archive_path)
+            parts.append(f"{member or ''}|{size}|{self._file_hash(archive_path)}")
+        return hashlib.blake2b("\n".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+    def _file_hash(self, file_path):
+        """
+        Returns the full content hash of a file, hashed again only if its path, size or mtime changed.
+        """
+        stat = os.stat(file_path)
+        stamp = (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            digest = self._hashes.get(stamp)
+        if digest is None:
+            digest = full_content_hash(file_path)
+            with self._lock:
+                self._hashes[stamp] = digest
+        return digest
+
+    def get(self, key):
+        """
+        Returns the entry of a key or None.
+        """
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+            return entry
+
+    def add(self, key, data, header, info, source_path):
+        """
+        Adds a loaded dataset and returns its entry. If the key is already pooled, the pooled entry is returned
+        and data is dropped, so every slot holding the file shares one DataFrame.
+        """
+        with self._lock:
+            entry = self.get(key)
+            if entry is not None:
+                return entry
+            source_files = info.get("source_files", [source_path])
+            name = display_name(source_path) if len(source_files) == 1 else f"{display_name(source_path)} (+{len(source_files) - 1} files)"
+            entry = {
+                "key": key,
+                "name": name,
+                "data": data,
+                "header": header,
+                "info": info,
+                "source_path": source_path,
+                "resolution": "full",
+                "refs": 0,
+                "bytes": self._data_bytes(data),
+                "segments": {},  # Cycle column -> CycleSegmentIndex, see DataManager.segment_index
+            }
+            self.entries[key] = entry
+            self._evict()
+            return entry
+
+    def update(self, key, data):
+        """
+        Replaces the data of an entry after rows were appended (follow mode) or columns were loaded.
+        """
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                entry["data"] = data
+                entry["bytes"] = self._data_bytes(data)
+                self._released(key)
+                self._evict()
+
+    def acquire(self, key):
+        with self._lock:
+            self.entries[key]["refs"] += 1
+
+    def release(self, key):
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                entry["refs"] = max(entry["refs"] - 1, 0)
+                self._evict()
+
+    def _evict(self):
+        """
+        Drops entries no slot holds, least recently used first, until the pool fits into max_bytes.
+        """
+        total_bytes = self.memory_bytes()
+        for key in [key for key, entry in self.entries.items() if entry["refs"] == 0]:
+            if total_bytes <= self.max_bytes:
+                return
+            total_bytes -= self.entries[key]["bytes"]
+            print(f"Releasing pooled dataset {self.entries[key]['name']}")
+            del self.entries[key]
+            self._released(key)
+        if total_bytes > self.max_bytes:
+            print(f"⚠️ Loaded datasets use {total_bytes / 1024 ** 2:,.0f} MB, more than the pool limit of {self.max_bytes / 1024 ** 2:,.0f} MB")
+
+    def _released(self, key):
+        if self.on_release is not None:
+            self.on_release(key)
+
+    @staticmethod
+    def _data_bytes(data):
+        return int(data.memory_usage(index=True, deep=True).sum())
+
+    def memory_bytes(self):
+        with self._lock:
+            return sum(entry["bytes"] for entry in self.entries.values())
+
+    def summary(self):
+        """
+        Returns a one-line description of the pool for the memory report.
+        """
+        with self._lock:
+            held = [entry for entry in self.entries.values() if entry["refs"]]
+            shared = sum(1 for entry in held if entry["refs"] > 1)
+            return (
+                f"Dataset pool: {len(self.entries)} dataset(s), {len(held)} held by slots ({shared} shared), "
+                f"{self.memory_bytes() / 1024 ** 2:,.1f} of {self.max_bytes / 1024 ** 2:,.0f} MB"
+            )
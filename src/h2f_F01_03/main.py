@@ -5,7 +5,7 @@ import matplotlib.pyplot as plt
 import numpy as np
 from PIL import Image, ImageTk
 # from data_handling import ModifyDataWidget, FilterWidget, KeyValuesWidget
-from ui_widgets import ModifyDataWidget, FilterWidget, KeyValuesWidget, DataWidget, FilteredDataBrowser
+from ui_widgets import ModifyDataWidget, FilterWidget, KeyValuesWidget, DataWidget, FilteredDataBrowser, DatasetCatalogBrowser
 from project_management import ProjectManager
 from data_management import DataManager
 from multidata_management import MultiDataProcessor
@@ -111,6 +111,14 @@ class HC2FCApp:
                 command=lambda: self.project_manager.show_loaded_plots(),
                 font=UIStyling.BUTTON_FONT).pack(side="left", padx=UIStyling.PAD_X)
 
+        tk.Button(project_frame, text="Dataset Catalog",
+                command=lambda: DatasetCatalogBrowser(self),
+                font=UIStyling.BUTTON_FONT).pack(side="left", padx=UIStyling.PAD_X)
+
+        tk.Button(project_frame, text="Rebuild Cache",
+                command=lambda: self.data_manager.rebuild_cache(),
+                font=UIStyling.BUTTON_FONT).pack(side="left", padx=UIStyling.PAD_X)
+
     def _create_single_data_sections(self):
         """
         creates anode, cathode and full-cell single data sections 
@@ -307,6 +315,24 @@ class HC2FCApp:
             "data_type_selection": widget.data_type_selection.get(),
         }
 
+    def get_modification_options(self, dataset_type):
+        """
+        Extracts all selected modification options for the given dataset type
+        and returns them as a dictionary (keys of processing.DEFAULT_MODIFICATION_OPTIONS).
+        """
+        widget = self.modify_widgets.get(dataset_type)
+        if not widget:
+            return {}
+
+        return {
+            "compute_abs_cycle": widget.compute_abs_cycle.get(),
+            "compute_du_dq": widget.compute_du_dq.get(),
+            "normalize_voltage": widget.normalize_voltage.get(),
+            "apply_offset": widget.apply_offset.get(),
+            "offset_column": widget.selected_column.get(),
+            "offset_value": widget.offset_value.get(),
+        }
+
 if __name__ == "__main__":
     root = tk.Tk()
     app = HC2FCApp(root)
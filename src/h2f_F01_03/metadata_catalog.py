@@ -0,0 +1,146 @@
+import os
+import pickle
+import hashlib
+import threading
+import pandas as pd
+from settings import DataSettings
+from data_archives import split_member
+
+# Columns of the tests sheet that are indexed for lookups
+INDEXED_COLUMNS = ("datafile_full", "cell", "test", "testplan")
+
+
+def normalize_filename(file_path):
+    """
+    Returns the data file name as matched against 'datafile_full': lower case, without folder,
+    without .gz/.zst and the member name for zip archives.
+    """
+    archive_path, member = split_member(str(file_path))
+    filename = os.path.basename(member if member is not None else archive_path).strip().lower()
+    if filename.endswith((".gz", ".zst")):
+        filename = os.path.splitext(filename)[0]
+    return filename
+
+
+class MetadataCatalog:
+    """
+    Indexed view of the cells_meta workbook.
+    The workbook is converted once into a pickle next to the dataset cache, which is rebuilt when the workbook changes.
+    """
+
+    CACHE_VERSION = 1
+
+    def __init__(self, workbook_path=None, cache_dir=None):
+        self.workbook_path = workbook_path or DataSettings.METADATA_WORKBOOK
+        self.cache_dir = cache_dir or DataSettings.CACHE_DIR
+        self.sheets = {}  # Sheet name -> DataFrame
+        self._indices = {}  # Column -> {normalized value: row positions in the tests sheet}
+        self._stamp = None  # (mtime_ns, size) of the loaded workbook
+        self._lock = threading.Lock()  # Background loads may look up metadata at the same time
+
+### loading
+
+    def _cache_path(self):
+        name = os.path.splitext(os.path.basename(self.workbook_path))[0]
+        # Workbooks of the same name in other folders get their own cache
+        path_key = hashlib.blake2b(os.path.abspath(self.workbook_path).encode("utf-8"), digest_size=8).hexdigest()
+        return os.path.join(self.cache_dir, f"{name}_{path_key}.metadata.pkl")
+
+    def load(self):
+        """
+        Loads the workbook (from the pickle if it is up to date) and builds the indices.
+        Returns False if there is no workbook.
+        """
+        with self._lock:
+            if not os.path.exists(self.workbook_path):
+                return False
+            stat = os.stat(self.workbook_path)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            if stamp == self._stamp:
+                return True
+
+            self.sheets = self._read_cache(stamp)
+            if self.sheets is None:
+                print(f"Converting {os.path.basename(self.workbook_path)} into the metadata cache")
+                self.sheets = pd.read_excel(self.workbook_path, sheet_name=None)
+                self._write_cache(stamp)
+
+            self._build_indices()
+            self._stamp = stamp
+            return True
+
+    def _read_cache(self, stamp):
+        """
+        Returns the cached sheets, or None if the cache is missing, outdated or unreadable
+        (e.g. pickled by another pandas version), so the workbook is converted again.
+        """
+        if not os.path.exists(self._cache_path()):
+            return None
+        try:
+            with open(self._cache_path(), "rb") as f:
+                cached = pickle.load(f)
+        except Exception as e:
+            print(f"⚠️ Ignoring unreadable metadata cache: {e}")
+            return None
+        if not isinstance(cached, dict) or cached.get("version") != self.CACHE_VERSION:
+            return None
+        if cached.get("pandas") != pd.__version__ or tuple(cached.get("stamp", ())) != stamp:
+            return None
+        return cached.get("sheets")
+
+    def _write_cache(self, stamp):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{self._cache_path()}.tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump({"version": self.CACHE_VERSION, "pandas": pd.__version__, "stamp": stamp, "sheets": self.sheets}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._cache_path())
+        except Exception as e:
+            print(f"⚠️ Failed to write metadata cache: {e}")
+
+    def _build_indices(self):
+        """
+        Groups the row positions of the tests sheet by the normalized values of the indexed columns.
+        """
+        tests = self.tests
+        self._indices = {}
+        for column in INDEXED_COLUMNS:
+            if column not in tests.columns:
+                continue
+            keys = tests[column].astype(str).str.strip().str.lower()
+            self._indices[column] = {key: positions for key, positions in keys.groupby(keys).indices.items()}
+
+### lookups
+
+    @property
+    def tests(self):
+        return self.sheets.get(DataSettings.METADATA_SHEET, pd.DataFrame())
+
+    def find(self, column, value):
+        """
+        Returns the rows of the tests sheet whose column matches the value (case and whitespace insensitive).
+        """
+        if not self.load():
+            return pd.DataFrame()
+        positions = self._indices.get(column, {}).get(str(value).strip().lower())
+        if positions is None:
+            return self.tests.iloc[0:0]
+        return self.tests.iloc[positions]
+
+    def by_datafile(self, file_path):
+        """
+        Returns the metadata of a data file as dictionary (first matching row), or None.
+        """
+        rows = self.find("datafile_full", normalize_filename(file_path))
+        if rows.empty:
+            return None
+        return {column: value for column, value in rows.iloc[0].items() if pd.notna(value)}
+
+    def by_cell(self, cell):
+        return self.find("cell", cell)
+
+    def by_test(self, test):
+        return self.find("test", test)
+
+    def by_testplan(self, testplan):
+        return self.find("testplan", testplan)
@@ -2,6 +2,7 @@ from tkinter import filedialog, messagebox
 import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
+from data_schema import VOLTAGE, Q_CHARGE, Q_DISCHARGE, COMMAND
 
 
 class MultiDataProcessor:
@@ -38,8 +39,8 @@ class MultiDataProcessor:
             return
 
         # Filter discharge for anode and charge for cathode
-        anode_discharge = anode_data[anode_data["Command"].str.contains("Discharge", na=False)]
-        cathode_charge = cathode_data[cathode_data["Command"].str.contains("Charge", na=False)]
+        anode_discharge = anode_data[anode_data[COMMAND].str.contains("Discharge", na=False)]
+        cathode_charge = cathode_data[cathode_data[COMMAND].str.contains("Charge", na=False)]
 
         if anode_discharge.empty or cathode_charge.empty:
             messagebox.showerror("Error", "Selected datasets do not contain the required half-cycle data.")
@@ -47,14 +48,14 @@ class MultiDataProcessor:
 
         # Generate common Q range
         common_q = np.linspace(
-            max(anode_discharge["Ah-Cyc-Discharge-0"].min(), cathode_charge["Ah-Cyc-Charge-0"].min()),
-            min(anode_discharge["Ah-Cyc-Discharge-0"].max(), cathode_charge["Ah-Cyc-Charge-0"].max()),
+            max(anode_discharge[Q_DISCHARGE].min(), cathode_charge[Q_CHARGE].min()),
+            min(anode_discharge[Q_DISCHARGE].max(), cathode_charge[Q_CHARGE].max()),
             500  # Generate 500 evenly spaced Q points
         )
 
         # Use linear spline for U values
-        anode_spline = self.app.data_manager.compute_linear_spline(anode_discharge["Ah-Cyc-Discharge-0"], anode_discharge["U[V]"])
-        cathode_spline = self.app.data_manager.compute_linear_spline(cathode_charge["Ah-Cyc-Charge-0"], cathode_charge["U[V]"])
+        anode_spline = self.app.data_manager.compute_linear_spline(anode_discharge[Q_DISCHARGE], anode_discharge[VOLTAGE])
+        cathode_spline = self.app.data_manager.compute_linear_spline(cathode_charge[Q_CHARGE], cathode_charge[VOLTAGE])
 
         if not anode_spline or not cathode_spline:
             messagebox.showerror("Error", "Failed to compute linear splines for one or both datasets.")
@@ -2,6 +2,7 @@ from tkinter import messagebox, Toplevel, Listbox, Scrollbar
 import tkinter as tk
 import matplotlib.pyplot as plt
 from styles import UIStyling  # Import centralized styling
+from data_schema import TIME, VOLTAGE, CURRENT, Q_CHARGE, Q_DISCHARGE, COMMAND
 
 class MultiGraphPlotter:
     def __init__(self, app_context):
@@ -105,9 +106,9 @@ class MultiGraphPlotter:
 
         try:
             if plot_type == "U-t (Voltage-Time)":
-                ax1.plot(dataset["Time[h]"], dataset["U[V]"], label=label, color=color)
+                ax1.plot(dataset[TIME], dataset[VOLTAGE], label=label, color=color)
             elif plot_type == "I-t (Current-Time)":
-                ax1.plot(dataset["Time[h]"], dataset["I[A]"], label=label, color=color)
+                ax1.plot(dataset[TIME], dataset[CURRENT], label=label, color=color)
             elif plot_type == "Q-U (Charge-Voltage)":
                 self._plot_qu_dataset(ax1, ax2, dataset, label, color)
             else:
@@ -121,19 +122,19 @@ class MultiGraphPlotter:
         """
         Plot a dataset for Q-U (Charge-Voltage) visualization.
         """
-        if "Ah-Cyc-Charge-0" not in dataset.columns or "Ah-Cyc-Discharge-0" not in dataset.columns:
+        if Q_CHARGE not in dataset.columns or Q_DISCHARGE not in dataset.columns:
             messagebox.showerror("Error", f"Dataset {label} is missing required columns for Q-U plotting.")
             return
 
-        charge_data = dataset[dataset["Command"].str.contains("Charge", na=False)]
-        discharge_data = dataset[dataset["Command"].str.contains("Discharge", na=False)]
+        charge_data = dataset[dataset[COMMAND].str.contains("Charge", na=False)]
+        discharge_data = dataset[dataset[COMMAND].str.contains("Discharge", na=False)]
 
         if not charge_data.empty:
-            ax1.plot(charge_data["Ah-Cyc-Charge-0"], charge_data["U[V]"], label=f"{label} (Charge)", color=color)
+            ax1.plot(charge_data[Q_CHARGE], charge_data[VOLTAGE], label=f"{label} (Charge)", color=color)
             ax1.set_xlabel("Charge (Ah)")
 
         if ax2 and not discharge_data.empty:
-            ax2.plot(discharge_data["Ah-Cyc-Discharge-0"], discharge_data["U[V]"], label=f"{label} (Discharge)", color=color, linestyle="--")
+            ax2.plot(discharge_data[Q_DISCHARGE], discharge_data[VOLTAGE], label=f"{label} (Discharge)", color=color, linestyle="--")
             ax2.set_xlabel("Discharge (Ah)")
 
     def _get_axis_labels(self, plot_type):
@@ -0,0 +1,550 @@
+from functools import partial
+import numpy as np
+import pandas as pd
+from scipy.interpolate import interp1d
+from data_schema import TIME, VOLTAGE, CURRENT, Q_CHARGE, Q_DISCHARGE, CYCLE, LINE, COMMAND, ABS_CYCLE
+from cycle_tools import compute_abs_cycle, CycleSegmentIndex
+
+# Filter options (keys of HC2FCApp.get_filter_options) and modification options with the defaults of the widgets
+DEFAULT_FILTER_OPTIONS = {
+    "remove_pause": False,
+    "select_cycle": False,
+    "selected_cycle": "All",
+    "cycle_column": CYCLE,
+    "select_charge_half_cycle": False,
+    "select_discharge_half_cycle": False,
+    "apply_step_change": False,
+    "step_change_column": LINE,
+    "apply_range_filter": False,
+    "selected_column": "",
+    "min_value": 0.0,
+    "max_value": 0.0,
+    "fit_option": "no fit",
+    "use_step_size": False,
+    "step_size_value": 0.01,
+    "plot_option": "U-t",
+    "data_type_selection": "Modified Data",
+}
+DEFAULT_MODIFICATION_OPTIONS = {
+    "compute_abs_cycle": False,
+    "compute_du_dq": False,
+    "normalize_voltage": False,
+    "apply_offset": False,
+    "offset_column": "",
+    "offset_value": 0.0,
+}
+
+# Columns of the fit per plot type (Q-U depends on the selected half cycle)
+FIT_COLUMNS = {
+    "U-t": (TIME, VOLTAGE),
+    "I-t": (TIME, CURRENT),
+}
+
+
+class ProcessingError(ValueError):
+    """
+    Raised when the options of a recipe cannot be applied to a dataset.
+    """
+
+
+def recipe_options(options):
+    """
+    Returns the filter and modification options completed with the widget defaults.
+    """
+    return {**DEFAULT_FILTER_OPTIONS, **DEFAULT_MODIFICATION_OPTIONS, **(options or {})}
+
+
+def normalized_options(options):
+    """
+    Returns the options that determine the result of process_dataset. Settings of disabled filters,
+    modifications and of an unused fit are dropped, so they do not tell otherwise equal results apart.
+    """
+    options = recipe_options(options)
+    unused = {"data_type_selection"}  # Only selects which result is saved
+    if not options["select_cycle"]:
+        unused |= {"selected_cycle", "cycle_column"}
+    if not options["apply_step_change"]:
+        unused.add("step_change_column")
+    if not options["apply_range_filter"]:
+        unused |= {"selected_column", "min_value", "max_value"}
+    if options["fit_option"] != "linear spline":
+        unused |= {"use_step_size", "step_size_value", "plot_option"}
+    elif not options["use_step_size"]:
+        unused.add("step_size_value")
+    if not options["apply_offset"]:
+        unused |= {"offset_column", "offset_value"}
+    return {key: value for key, value in options.items() if key not in unused}
+
+
+def uses_abs_cycle(options):
+    """
+    Returns True if the options filter on or add the absolute cycle.
+    """
+    options = recipe_options(options)
+    return options["compute_abs_cycle"] or (options["select_cycle"] and options["cycle_column"] == ABS_CYCLE)
+
+
+def required_columns(options):
+    """
+    Returns the columns the options filter on or modify (loaded on demand if the column projection left them out).
+    """
+    options = recipe_options(options)
+    columns = FilterPipeline(options).columns()
+    if options["compute_abs_cycle"]:
+        columns.append(CYCLE)
+    if options["apply_offset"]:
+        columns.append(options["offset_column"])
+    return [col for col in dict.fromkeys(columns) if col]
+
+### filter stage
+
+def step_change_filter(data, column):
+    """
+    Keeps only the last row before the value in 'column' changes.
+    """
+    if column not in data.columns:
+        raise ProcessingError(f"Column '{column}' not found in dataset.")
+    values = data[column]
+    return data[values != values.shift(-1)]
+
+
+def add_abs_cycle(data):
+    """
+    Adds the absolute cycle count computed from 'Cyc-Count' (see cycle_tools.compute_abs_cycle).
+    An existing column is kept: it is computed once per raw dataset, before rows are filtered.
+    """
+    if ABS_CYCLE in data.columns:
+        return data
+    if CYCLE not in data.columns:
+        raise ProcessingError("Dataset is missing the 'Cyc-Count' column.")
+    return data.assign(**{ABS_CYCLE: compute_abs_cycle(data[CYCLE].to_numpy())})
+
+
+def _command_mask(commands, predicate, na_value):
+    """
+    Evaluates a predicate of the Command column. For categorical columns (compact schema) the predicate runs
+    on the few categories and is mapped to the rows through the category codes.
+    """
+    if isinstance(commands.dtype, pd.CategoricalDtype):
+        category_mask = np.append(predicate(pd.Series(commands.cat.categories, dtype=object)).to_numpy(dtype=bool), na_value)
+        return category_mask[commands.cat.codes.to_numpy()]  # Code -1 (missing) picks na_value
+    return predicate(commands).fillna(na_value).to_numpy(dtype=bool)
+
+
+def _value_changes(series, rows):
+    """
+    Marks the rows (positions) whose value differs from the value of the next of these rows; the last row is always marked.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()[rows]
+        changes = (codes[:-1] != codes[1:]) | (codes[:-1] == -1)  # Missing values never equal their neighbour
+    else:
+        values = series.to_numpy()[rows]
+        changes = values[:-1] != values[1:]
+    return np.append(changes, True) if len(rows) else np.zeros(0, dtype=bool)
+
+
+class FilterPipeline:
+    """
+    The filters of the filter options (keys of HC2FCApp.get_filter_options) compiled into one boolean mask.
+    Row predicates (pause, cycle, half cycle, range) are evaluated over the raw column arrays and combined;
+    the step change filter depends on the rows that survive before it and is evaluated only over those rows.
+    The filtered DataFrame is materialized once, with the same rows as applying the filters one by one
+    in the order of the FilterWidget.
+    With a CycleSegmentIndex of the dataset the pause, cycle and half cycle filters select whole segments;
+    a selection of one block of rows (e.g. one cycle) is returned as slice of the dataset.
+    """
+
+    def __init__(self, options, segments=None):
+        self.options = recipe_options(options)
+        self.segments = segments
+
+    def columns(self):
+        """
+        Returns the columns the filters read.
+        """
+        options = self.options
+        columns = []
+        if options["remove_pause"] or options["select_charge_half_cycle"] or options["select_discharge_half_cycle"]:
+            columns.append(COMMAND)
+        if options["select_cycle"]:
+            columns.append(CYCLE if options["cycle_column"] == ABS_CYCLE else options["cycle_column"])
+        if options["apply_step_change"]:
+            columns.append(options["step_change_column"])
+        if options["apply_range_filter"]:
+            columns.append(options["selected_column"])
+        return list(dict.fromkeys(columns))
+
+    def mask(self, data):
+        """
+        Returns (boolean mask over the rows of data, columns to add to the filtered rows as dict of full-length arrays).
+        """
+        options = self.options
+        mask = np.ones(len(data), dtype=bool)
+        added = {}
+        if (options["remove_pause"] or options["select_charge_half_cycle"] or options["select_discharge_half_cycle"]) and COMMAND not in data.columns:
+            raise ProcessingError("Dataset is missing the 'Command' column for the pause and half cycle filters.")
+
+        keep = self._segment_mask(data)
+        if keep is not None:
+            mask = self.segments.row_mask(keep)
+
+        # Pause filter
+        if options["remove_pause"] and keep is None:
+            mask &= _command_mask(data[COMMAND], lambda commands: commands != "Pause", True)
+
+        # Cycle filter
+        if options["select_cycle"] and keep is None:
+            cycle_column = options["cycle_column"]  # "Cyc-Count" or "abs_cycle"
+            selected_cycle = options["selected_cycle"]
+
+            # `abs_cycle` of the raw rows, unless the dataset already holds it (see process_dataset)
+            if cycle_column == ABS_CYCLE and ABS_CYCLE not in data.columns:
+                if CYCLE not in data.columns:
+                    raise ProcessingError("Dataset is missing the 'Cyc-Count' column.")
+                added[ABS_CYCLE] = compute_abs_cycle(data[CYCLE].to_numpy())
+
+            if selected_cycle and selected_cycle != "All":
+                if cycle_column in added:
+                    cycles = added[cycle_column]
+                elif cycle_column in data.columns:
+                    cycles = data[cycle_column].to_numpy()
+                else:
+                    raise ProcessingError(f"Column '{cycle_column}' not found in dataset.")
+                mask &= cycles == int(selected_cycle)
+
+        # Charge and discharge half cycle filter
+        if options["select_charge_half_cycle"] and keep is None:
+            mask &= _command_mask(data[COMMAND], lambda commands: commands.str.contains("Charge"), False)
+        if options["select_discharge_half_cycle"] and keep is None:
+            mask &= _command_mask(data[COMMAND], lambda commands: commands.str.contains("Discharge"), False)
+
+        # Step change filter (last row before the value changes, among the rows left so far)
+        if options["apply_step_change"]:
+            column = options["step_change_column"]
+            if column not in data.columns:
+                raise ProcessingError(f"Column '{column}' not found in dataset.")
+            rows = np.flatnonzero(mask)
+            mask[rows[~_value_changes(data[column], rows)]] = False
+
+        # Range filter
+        if options["apply_range_filter"]:
+            selected_column = options["selected_column"]
+            if selected_column not in data.columns:
+                raise ProcessingError(f"Column '{selected_column}' not found in dataset.")
+            values = data[selected_column]
+            mask &= ((values >= options["min_value"]) & (values <= options["max_value"])).to_numpy(dtype=bool)
+
+        return mask, added
+
+    def _segment_mask(self, data):
+        """
+        Returns the pause, cycle and half cycle filters as mask over the segments of the segment index,
+        or None without an index that matches the rows and the cycle column of data.
+        """
+        options, segments = self.options, self.segments
+        if segments is None or segments.rows != len(data):
+            return None
+        uses_commands = options["remove_pause"] or options["select_charge_half_cycle"] or options["select_discharge_half_cycle"]
+        if uses_commands and segments.commands is None:
+            return None
+        if options["select_cycle"] and (segments.column != options["cycle_column"] or segments.column not in data.columns):
+            return None
+
+        keep = np.ones(len(segments), dtype=bool)
+        if options["remove_pause"]:
+            keep &= _command_mask(segments.commands, lambda commands: commands != "Pause", True)
+        selected_cycle = options["selected_cycle"]
+        if options["select_cycle"] and selected_cycle and selected_cycle != "All":
+            keep &= segments.cycles == int(selected_cycle)
+        if options["select_charge_half_cycle"]:
+            keep &= _command_mask(segments.commands, lambda commands: commands.str.contains("Charge"), False)
+        if options["select_discharge_half_cycle"]:
+            keep &= _command_mask(segments.commands, lambda commands: commands.str.contains("Discharge"), False)
+        return keep
+
+    def apply(self, data):
+        """
+        Returns the filtered rows of data as a new DataFrame (the raw dataset is never copied as a whole).
+        """
+        keep = self._segment_mask(data)
+        if keep is not None and not self.options["apply_step_change"] and not self.options["apply_range_filter"]:
+            slices = self.segments.row_slices(keep)
+            if len(slices) <= 1:
+                return data.iloc[slices[0] if slices else slice(0, 0)]  # One block of rows: a slice, no row copy
+
+        mask, added = self.mask(data)
+        filtered_data = data.copy(deep=False) if mask.all() else data[mask]
+        for col, values in added.items():
+            filtered_data[col] = values[mask]
+        return filtered_data
+
+
+def filter_dataset(data, options, segments=None):
+    """
+    Applies the filters of the options (see FilterPipeline) and returns the filtered rows.
+    """
+    return FilterPipeline(options, segments).apply(data)
+
+### modification stage
+
+def modify_dataset(data, options):
+    """
+    Adds the computed columns of the modification options to a filtered dataset (the dataset itself is not changed).
+    """
+    options = recipe_options(options)
+    data = data.copy(deep=False)
+
+    # Absolute cycle modification
+    if options["compute_abs_cycle"]:
+        data = add_abs_cycle(data)
+
+    # dU/dQ modification
+    if options["compute_du_dq"] and Q_CHARGE in data.columns and VOLTAGE in data.columns:
+        data["dU/dQ"] = np.gradient(data[VOLTAGE], data[Q_CHARGE])
+
+    # Normalize voltage modification
+    if options["normalize_voltage"] and VOLTAGE in data.columns:
+        data["U_normalized"] = data[VOLTAGE] / data[VOLTAGE].max()
+
+    # Offset modification (applied to the column itself)
+    offset_column = options["offset_column"]
+    if options["apply_offset"] and offset_column and offset_column in data.columns:
+        data[offset_column] = data[offset_column] + options["offset_value"]
+
+    return data
+
+### fit stage
+
+def fit_columns(options):
+    """
+    Returns the (x, y) columns of the fit for the plot type of the options.
+    """
+    options = recipe_options(options)
+    plot_type = options["plot_option"]
+    if plot_type == "Q-U":
+        if options["select_charge_half_cycle"]:
+            return Q_CHARGE, VOLTAGE
+        if options["select_discharge_half_cycle"]:
+            return Q_DISCHARGE, VOLTAGE
+        raise ProcessingError("Please select either Charge or Discharge filter when using Q-U.")
+    if plot_type not in FIT_COLUMNS:
+        raise ProcessingError(f"Invalid plot type '{plot_type}' selected.")
+    return FIT_COLUMNS[plot_type]
+
+
+def linear_spline(x, y, step_size=None, num_points=500):
+    """
+    Computes a linear spline fit for given x and y data.
+
+    Parameters:
+    - x (array-like): The independent variable (e.g., charge in Ah).
+    - y (array-like): The dependent variable (e.g., voltage in V).
+    - step_size (float, optional): The desired spacing between generated x values.
+    - num_points (int, optional): Number of evenly spaced points if step_size is not given.
+
+    Returns:
+    - dict: A dictionary with interpolated 'x' and 'y' values.
+    """
+    spline = interp1d(x, y, kind="linear", fill_value="extrapolate")
+    if step_size:
+        x_fit = np.arange(x.min(), x.max(), step_size)  # x values based on step size
+    else:
+        x_fit = np.linspace(x.min(), x.max(), num_points)  # Evenly spaced points
+    return {"x": x_fit, "y": spline(x_fit)}
+
+
+def fit_dataset(data, options):
+    """
+    Returns the linear spline fit of a filtered dataset as DataFrame with a row number column.
+    """
+    options = recipe_options(options)
+    x_col, y_col = fit_columns(options)
+    if not all(col in data.columns for col in (x_col, y_col)):
+        raise ProcessingError(f"Dataset must contain columns: {x_col}, {y_col}")
+    if not np.all(np.diff(data[x_col].to_numpy()) > 0):
+        raise ProcessingError("X-values must be strictly increasing. Adjust filter settings to prevent duplicate or decreasing values!")
+
+    step_size = options["step_size_value"] if options["use_step_size"] and options["step_size_value"] > 0 else None
+    fit_data = linear_spline(data[x_col], data[y_col], step_size)
+    fit_df = pd.DataFrame({x_col: fit_data["x"], y_col: fit_data["y"]})
+    fit_df["row"] = range(len(fit_df))
+    return fit_df
+
+
+### stage chain
+
+def _fit_stage(data, options):
+    return fit_dataset(data, options) if options["fit_option"] == "linear spline" else None
+
+
+# Stages in processing order with the options each depends on. The output of a stage only changes with its own
+# options and those of the stages before it, so e.g. a step size sweep reuses the filtered and modified data.
+# compute_abs_cycle belongs to the filter stage: the column is derived from the raw rows before they are filtered.
+STAGES = (
+    ("filter", filter_dataset, ("remove_pause", "select_cycle", "selected_cycle", "cycle_column", "select_charge_half_cycle",
+                                "select_discharge_half_cycle", "apply_step_change", "step_change_column",
+                                "apply_range_filter", "selected_column", "min_value", "max_value", "compute_abs_cycle")),
+    ("modify", modify_dataset, tuple(key for key in DEFAULT_MODIFICATION_OPTIONS if key != "compute_abs_cycle")),
+    ("fit", _fit_stage, ("fit_option", "use_step_size", "step_size_value", "plot_option")),
+)
+
+
+def stage_options(options):
+    """
+    Returns [(stage, options the stage output depends on, active)] in processing order. The options are normalized
+    (see normalized_options) and include those of the stages before; a stage is inactive if its own options are
+    the defaults, i.e. it filters, adds or fits nothing.
+    """
+    normalized = normalized_options(options)
+    defaults = normalized_options({})
+    stages, upstream = [], {}
+    for name, _, option_names in STAGES:
+        own = {key: normalized[key] for key in option_names if key in normalized}
+        upstream = {**upstream, **own}
+        active = own != {key: defaults[key] for key in option_names if key in defaults}
+        stages.append((name, upstream, active))
+    return stages
+
+
+def process_dataset(data, options, stage_cache=None, segments=None):
+    """
+    Runs the filter, modification and fit stages. Returns (filtered data, fit data or None).
+    segments is an optional CycleSegmentIndex of data for the cycle column of the options.
+    stage_cache(stage, stage options, compute) may return the stored output of an active stage instead of calling
+    compute (see ResultCache.stage_cache). Stages are looked up from the last one backwards, so upstream stages
+    only run if a downstream output is missing.
+    The absolute cycle is added to the raw data first (DataManager keeps it as column of the pooled dataset).
+    """
+    options = recipe_options(options)
+    if uses_abs_cycle(options):
+        data = add_abs_cycle(data)
+    stages = stage_options(options)
+    outputs = {}
+
+    def output(index):
+        if index < 0:
+            return data
+        if index not in outputs:
+            name, depends_on, active = stages[index]
+            stage = partial(filter_dataset, segments=segments) if name == "filter" else STAGES[index][1]
+            compute = lambda: stage(output(index - 1), options)
+            outputs[index] = stage_cache(name, depends_on, compute) if active and stage_cache is not None else compute()
+        return outputs[index]
+
+    fit_data = output(2)
+    return output(1), fit_data
+
+### key values
+
+# Key values of the KeyValuesWidget: (column, label of the result column)
+KEY_VALUE_COLUMNS = {
+    "max_voltage": (VOLTAGE, "Max Voltage (V)"),
+    "max_charge": (Q_CHARGE, "Max Charge (Ah)"),
+    "max_discharge": (Q_DISCHARGE, "Max Discharge (Ah)"),
+}
+
+
+def key_values(datasets, extract):
+    """
+    Returns the maxima of the extract keys (see KEY_VALUE_COLUMNS) per dataset and cycle of filtered datasets.
+    The rows are reduced to the maxima of their cycle segments (see CycleSegmentIndex) and the segments of all
+    datasets are grouped in one pass; values of missing columns are "N/A".
+    """
+    names = list(datasets)
+    value_columns = [KEY_VALUE_COLUMNS[key] for key in extract]
+    parts = []
+    for code, data in enumerate(datasets.values()):
+        if CYCLE in data.columns:
+            segments = CycleSegmentIndex(data, CYCLE, command_column=None)
+            part = {"Cycle": segments.cycles}
+            for col, label in value_columns:
+                part[label] = segments.reduce_max(data[col].to_numpy()) if col in data.columns else np.nan
+        elif len(data):
+            part = {"Cycle": [np.nan]}
+            for col, label in value_columns:
+                part[label] = [data[col].max() if col in data.columns else np.nan]
+        else:
+            continue
+        parts.append(pd.DataFrame(part).assign(Dataset=code))
+
+    combined = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame(columns=["Dataset", "Cycle"] + [label for _, label in value_columns])
+    combined["Dataset"] = pd.Categorical.from_codes(combined["Dataset"].astype(int), categories=names)
+    results = combined.groupby(["Dataset", "Cycle"], observed=True, dropna=False).max().reset_index()
+    for _, label in value_columns:
+        results[label] = results[label].astype(object).where(results[label].notna(), "N/A")
+    cycles = results["Cycle"]
+    if pd.api.types.is_float_dtype(cycles) and (cycles.dropna() % 1 == 0).all():
+        cycles = cycles.astype("Int64")  # Cycles of datasets without cycle column made the column float
+    results["Cycle"] = cycles.astype(object).where(cycles.notna(), "")
+    return results
+
+### file naming
+
+def filter_suffix(options):
+    """
+    Generate a suffix string based on the applied filters.
+    """
+    options = recipe_options(options)
+    suffixes = []
+    if options["remove_pause"]:
+        suffixes.append("nopause")
+    if options["select_cycle"]:
+        selected_cycle = options["selected_cycle"]
+        suffixes.append(f"cycle{selected_cycle}" if selected_cycle and selected_cycle != "All" else "allcycles")
+    if options["select_charge_half_cycle"]:
+        suffixes.append("charge")
+    if options["select_discharge_half_cycle"]:
+        suffixes.append("discharge")
+    if options["apply_step_change"]:
+        suffixes.append("sc")  # Step Change filter suffix
+    if options["apply_range_filter"]:
+        selected_column = options["selected_column"]
+        if selected_column and selected_column != "Select Column":
+            suffixes.append(f"{selected_column}_range_{options['min_value']}-{options['max_value']}")
+    return "-".join(suffixes) if suffixes else "nofilter"
+
+
+def modification_suffix(options):
+    """
+    Generate a suffix string based on the applied modifications.
+    """
+    options = recipe_options(options)
+    suffixes = []
+    if options["compute_abs_cycle"]:
+        suffixes.append("abs_cycle")
+    if options["compute_du_dq"]:
+        suffixes.append("du_dq")
+    if options["normalize_voltage"]:
+        suffixes.append("U_norm")
+    if options["apply_offset"]:
+        suffixes.append(f"offset_{options['offset_column']}")
+    return "-".join(suffixes) if suffixes else "nomod"
+
+
+def datatype_suffix(options):
+    """
+    Generate a suffix string based on the selected data type (Modified vs Fit).
+    If "Fit Data" is selected and step size is applied, add "_step_<value>" after "_FitData_linSpline".
+    """
+    options = recipe_options(options)
+    if options["data_type_selection"] != "Fit Data":
+        return ""  # No suffix for modified data
+    suffix = "_FitData_linSpline"
+    if options["use_step_size"] and options["step_size_value"] > 0:
+        suffix += f"_step_{options['step_size_value']}"
+    return suffix
+
+
+def output_filename(base_filename, options):
+    """
+    Returns the file name under which the result of a dataset is saved.
+    """
+    return f"{base_filename}_{filter_suffix(options)}_{modification_suffix(options)}_{datatype_suffix(options)}.csv"
+
+
+def result_to_save(filtered_data, fit_data, options):
+    """
+    Returns the fit data if "Fit Data" is selected, otherwise the filtered data.
+    """
+    return fit_data if recipe_options(options)["data_type_selection"] == "Fit Data" else filtered_data
@@ -0,0 +1,186 @@
+import io
+from contextlib import closing
+import numpy as np
+import pandas as pd
+from settings import DataSettings
+from data_archives import open_source, is_archive, source_size, display_name
+from data_reader import CyclerFileReader, CyclerFileHeader, LoadCancelled, _unique_column_names
+from data_schema import TIME, VOLTAGE, canonical_columns
+
+try:
+    import openpyxl
+except ImportError:  # .xlsx exports can only be read with openpyxl installed
+    openpyxl = None
+
+READERS = []  # Reader classes in the order in which they are tried by detect_reader
+
+
+def register_reader(reader_class):
+    """
+    Adds a reader class to the format detection. Readers registered first are tried first.
+    """
+    if reader_class not in READERS:
+        READERS.append(reader_class)
+    return reader_class
+
+
+def detect_reader(file_path):
+    """
+    Returns the reader class of a file and the sniffed first bytes of the (decompressed) file.
+    Files no reader recognizes go to the comma reader, which reports what is wrong with them.
+    """
+    with open_source(file_path) as (f, _):
+        sample = f.read(DataSettings.SNIFF_BYTES)
+    for reader_class in READERS:
+        if reader_class.sniff(file_path, sample):
+            return reader_class, sample
+    return CyclerFileReader, sample
+
+
+def reader_for(file_path, chunk_rows=None):
+    """
+    Returns a new reader for the layout of the file.
+    """
+    reader_class, sample = detect_reader(file_path)
+    reader = reader_class(chunk_rows)
+    reader.configure(sample)
+    return reader
+
+
+class TabSeparatedReader(CyclerFileReader):
+    """
+    Tab separated exports with a free-text preamble before the column header (e.g. EC-Lab .mpt text exports).
+    """
+
+    name = "tab"
+    delimiter = "\t"
+    header_columns = (TIME, VOLTAGE)
+
+
+class SemicolonReader(CyclerFileReader):
+    """
+    Semicolon separated exports, usually written with decimal commas by spreadsheet tools.
+    """
+
+    name = "semicolon"
+    delimiter = ";"
+    decimal = ","
+    header_columns = (TIME, VOLTAGE)
+
+
+class ExcelFileReader(CyclerFileReader):
+    """
+    Reads the data sheet of .xlsx workbook exports (e.g. Arbin or Neware) with openpyxl in read-only mode,
+    row block by row block into the same column buffers as the text readers.
+    """
+
+    name = "xlsx"
+    header_columns = (TIME, VOLTAGE)
+
+    @classmethod
+    def sniff(cls, file_path, sample):
+        return display_name(file_path).lower().endswith(".xlsx") and sample.startswith(b"PK")
+
+    def configure(self, sample):
+        pass
+
+    def supports_random_access(self, file_path):
+        return False
+
+    def read_header(self, file_path):
+        with self._open_workbook(file_path) as workbook:
+            return self._find_data_sheet(workbook)[1]
+
+    def read_appended(self, file_path, header, start_offset, columns=None):
+        raise ValueError("Workbooks cannot be followed.")
+
+    def _open_workbook(self, file_path):
+        """
+        Opens the workbook of a file, workbooks inside archives are decompressed into memory.
+        """
+        if openpyxl is None:
+            raise ValueError("Reading .xlsx files needs the openpyxl package (pip install openpyxl).")
+        workbook_file = file_path
+        if is_archive(file_path):
+            with open_source(file_path) as (f, _):
+                workbook_file = io.BytesIO(f.read())
+        return closing(openpyxl.load_workbook(workbook_file, read_only=True, data_only=True))
+
+    def _find_data_sheet(self, workbook):
+        """
+        Returns (sheet, header, row number of the column header) of the first sheet with the header columns.
+        Rows above the column header and rows of the info sheets before it are kept as metadata.
+        """
+        header = CyclerFileHeader()
+        for sheet in workbook.worksheets:
+            rows = sheet.iter_rows(max_row=DataSettings.HEADER_SCAN_MAX_LINES, values_only=True)
+            for row_number, row in enumerate(rows, start=1):
+                cells = [str(value).strip() if value is not None else "" for value in row]
+                while cells and not cells[-1]:
+                    cells.pop()
+                if not cells:
+                    continue
+                columns, unit_factors = canonical_columns(_unique_column_names(cells))
+                if all(col in columns for col in self.header_columns):
+                    header.columns, header.unit_factors = columns, unit_factors
+                    header.header_lines = row_number
+                    return sheet, header, row_number
+                header.add_metadata_line(f"{cells[0]}: {', '.join(cell for cell in cells[1:] if cell)}")
+        raise ValueError(f"No sheet with the columns {', '.join(self.header_columns)} found.")
+
+    def _read_chunks(self, file_path, dtypes, columns=None, progress_callback=None, cancel_event=None):
+        """
+        Finds the data sheet, then converts blocks of chunk_rows rows into typed DataFrame chunks.
+        """
+        total_bytes = source_size(file_path)
+        with self._open_workbook(file_path) as workbook:
+            sheet, header, header_row = self._find_data_sheet(workbook)
+            self.last_header = header
+            self._end_offset = None  # Workbooks are not followed
+            self._tail_rows = 0
+            self._lines_read = 0
+
+            width = len(header.columns)
+            usecols = self._projected_columns(header, columns) or header.columns
+            positions = [header.columns.index(col) for col in usecols]
+            total_rows = max((sheet.max_row or 0) - header_row, 1)
+
+            def chunks():
+                block = []
+                for row in sheet.iter_rows(min_row=header_row + 1, max_col=width, values_only=True):
+                    self._lines_read += 1
+                    if all(value is None for value in row):
+                        continue
+                    block.append(row if len(row) == width else tuple(row) + (None,) * (width - len(row)))
+                    if len(block) == self.chunk_rows:
+                        yield self._to_frame(block, positions, usecols, dtypes)
+                        block = []
+                if block:
+                    yield self._to_frame(block, positions, usecols, dtypes)
+
+            def on_chunk(rows):
+                if cancel_event is not None and cancel_event.is_set():
+                    raise LoadCancelled(f"Loading {display_name(file_path)} was cancelled.")
+                if progress_callback is not None:
+                    progress_callback(int(total_bytes * min(rows / total_rows, 1.0)), total_bytes, rows)
+
+            return self._collect_chunks(chunks(), header, total_rows, on_chunk)
+
+    @staticmethod
+    def _to_frame(block, positions, usecols, dtypes):
+        """
+        Transposes a block of row tuples into typed columns.
+        """
+        values = list(zip(*block))
+        frame = {}
+        for position, col in zip(positions, usecols):
+            dtype = dtypes.get(col)
+            if dtype is None:
+                frame[col] = pd.Series(values[position]).infer_objects()
+            else:
+                frame[col] = np.array(values[position], dtype=dtype)
+        return pd.DataFrame(frame)
+
+
+for _reader_class in (ExcelFileReader, CyclerFileReader, TabSeparatedReader, SemicolonReader):
+    register_reader(_reader_class)
@@ -0,0 +1,77 @@
+import json
+from collections import OrderedDict, Counter
+from settings import DataSettings
+
+
+def _frame_bytes(frame):
+    return int(frame.memory_usage(index=True, deep=True).sum())
+
+
+class ResultCache:
+    """
+    In-memory cache of the stage outputs of processing.process_dataset (filtered, modified and fit data), so plotting,
+    saving, storing and key value extraction on unchanged settings reuse the result of the first action, and
+    changing a downstream option (e.g. the spline step size) only reruns the stages after the change.
+    Least recently used outputs are evicted once the outputs exceed max_bytes.
+    Outputs may be views into the raw dataset (e.g. the slice of one cycle), so the outputs of a dataset are
+    dropped with invalidate() when the dataset pool releases or replaces it.
+    """
+
+    def __init__(self, max_bytes=None):
+        self.max_bytes = DataSettings.RESULT_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self.entries = OrderedDict()  # key -> (output, bytes, owner), least recently used first
+        self.hits = Counter()  # Per stage
+        self.misses = Counter()
+
+    def stage_cache(self, fingerprint, owner=None):
+        """
+        Returns the stage_cache function of process_dataset for the dataset identified by fingerprint.
+        Outputs are handed out as shallow copies, so columns added by the caller do not end up in the cache.
+        owner (e.g. the pool key of the dataset) groups the outputs for invalidate().
+        """
+        def cached(stage, stage_options, compute):
+            key = json.dumps([fingerprint, stage, stage_options], sort_keys=True, default=str)
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.hits[stage] += 1
+                return entry[0].copy(deep=False)
+            self.misses[stage] += 1
+            output = compute()
+            self.put(key, output, owner)
+            return output.copy(deep=False)
+        return cached
+
+    def put(self, key, output, owner=None):
+        size = _frame_bytes(output)
+        if size > self.max_bytes:
+            return  # Larger than the whole cache
+        self.entries[key] = (output, size, owner)
+        self.entries.move_to_end(key)
+        total_bytes = self.memory_bytes()
+        while total_bytes > self.max_bytes:
+            _, (_, evicted_bytes, _) = self.entries.popitem(last=False)
+            total_bytes -= evicted_bytes
+
+    def invalidate(self, owner):
+        """
+        Drops the outputs of an owner, so they do not keep the buffers of a released dataset alive.
+        """
+        for key in [key for key, (_, _, entry_owner) in self.entries.items() if entry_owner == owner]:
+            del self.entries[key]
+
+    def clear(self):
+        self.entries.clear()
+
+    def memory_bytes(self):
+        return sum(size for _, size, _ in self.entries.values())
+
+    def summary(self):
+        """
+        Returns a one-line description of the cache for the memory report.
+        """
+        stages = ", ".join(f"{stage} {self.hits[stage]}/{self.misses[stage]}" for stage in ("filter", "modify", "fit"))
+        return (
+            f"Result cache: {len(self.entries)} stage output(s), {self.memory_bytes() / 1024 ** 2:,.1f} of "
+            f"{self.max_bytes / 1024 ** 2:,.0f} MB, hits/misses: {stages}"
+        )
@@ -0,0 +1,71 @@
+import os
+
+
+class DataSettings:
+    """
+    Centralized data import and processing configurations.
+    """
+
+    # Chunked import
+    CHUNK_ROWS = 250_000  # 🔹 Rows parsed per chunk when streaming a cycler export
+    ROW_ESTIMATE_SAMPLE_BYTES = 1_048_576  # Bytes sampled to estimate the row count of a file
+    GROWTH_FACTOR = 1.5  # Growth of the preallocated column buffers if the estimate was too small
+    HEADER_SCAN_MAX_LINES = 500  # Lines searched for the column header before a file is rejected
+    SNIFF_BYTES = 65536  # First bytes of a file used to detect its layout (see reader_registry)
+
+    # Columnar sidecar cache
+    CACHE_ENABLED = True  # Write/read Feather sidecars for imported files (needs pyarrow)
+    CACHE_DIR = os.path.join(os.getcwd(), "cache")  # 🔹 Location of the sidecar files
+    CACHE_FORMAT = "feather"  # "npy": raw column store with one memory-mapped .npy file per column (see column_store)
+    CACHE_MAX_BYTES = 5 * 1024 ** 3  # Size limit of the cache, least recently used sidecars are evicted
+    CACHE_HASH_BLOCK_BYTES = 1_048_576  # Size of the head/middle/tail blocks hashed for the content key
+
+    # Metadata catalog
+    METADATA_WORKBOOK = os.path.join(os.getcwd(), "data", "cells_meta_2.xlsx")  # 🔹 Cell/test metadata workbook
+    METADATA_SHEET = "tests"  # Sheet with one row per data file ("datafile_full", "cell", "test", "testplan")
+
+    # Background loading
+    LOAD_POLL_MS = 100  # Interval in which the UI polls the progress of a background load
+
+    # Progressive preview load
+    PREVIEW_ENABLED = True  # Show a decimated preview before the full-resolution data of large files
+    PREVIEW_MIN_BYTES = 20 * 1024 ** 2  # Smaller files are loaded at full resolution right away
+    PREVIEW_ROWS = 4096  # Rows sampled for the preview
+    PREVIEW_TIME_BUDGET = 0.5  # Seconds spent at most on sampling the preview
+
+    # Compact dtype schema
+    USE_FLOAT32 = False  # Opt-in: store measurement columns as float32 if the precision guard allows it
+    FLOAT32_DEFAULT_TOLERANCE = 1e-6  # Max. absolute float32 rounding error of a measurement column
+    FLOAT32_TOLERANCES = {
+        "Time[h]": 0.01 / 3600,  # 10 ms
+        "U[V]": 1e-5,
+    }
+    CATEGORY_MAX_UNIQUE_RATIO = 0.05  # Text columns with fewer distinct values than this share become categorical
+
+    # Column projection
+    PROJECT_COLUMNS = True  # Import only the working set, other columns are loaded when first requested
+    WORKING_COLUMNS = ("Time[h]", "U[V]", "I[A]", "Ah-Cyc-Charge-0", "Ah-Cyc-Discharge-0", "Cyc-Count", "Line", "Command")
+
+    # Data validation at import
+    VALIDATION_REPAIR = False  # Opt-in: drop duplicate rows and rows whose time does not advance (see data_validation)
+    VALIDATION_RANGES = {  # Plausible value range per column, values outside are reported
+        "U[V]": (-1.0, 6.0),
+        "I[A]": (-1000.0, 1000.0),
+        "T1[°C]": (-60.0, 150.0),
+    }
+
+    # Datasets of all slots
+    POOL_MAX_BYTES = 4 * 1024 ** 3  # Datasets no slot holds anymore are released once the loaded datasets exceed this size
+
+    # Processing results
+    RESULT_CACHE_MAX_BYTES = 1024 ** 3  # Filtered, modified and fit data reused by repeated actions and downstream option changes
+
+    # Stitching of continued test runs
+    SERIES_MAX_WORKERS = os.cpu_count() or 4  # Export files of one test parsed in parallel
+
+    # Dataset catalog of a data folder
+    CATALOG_DEFAULT_FOLDER = os.path.join(os.getcwd(), "data")  # Folder shown when the catalog is opened
+    CATALOG_MAX_WORKERS = os.cpu_count() or 4  # Files summarized in parallel during a scan
+
+    # Tail-follow of files that are still being written
+    FOLLOW_INTERVAL_MS = 5000  # 🔹 Interval in which followed files are checked for appended rows
@@ -1,6 +1,10 @@
+import threading
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import messagebox, filedialog, ttk
 from styles import UIStyling
+from settings import DataSettings
+from data_schema import CYCLE, LINE, COMMAND, ABS_CYCLE
+from dataset_catalog import DatasetCatalog
 
 ### widget for data import section
 
@@ -25,23 +29,78 @@ class DataWidget:
         self.file_label = tk.Label(label_frame, textvariable=self.data_manager.datasets[dataset_key]["file_path"], width=40, anchor="w")
         self.file_label.pack(side="left", fill="x", expand=True, padx=5)
 
+        # Cell metadata of the loaded file (from the metadata catalog)
+        tk.Label(self.frame, textvariable=self.data_manager.datasets[dataset_key]["metadata_label"], anchor="w", font=UIStyling.BUTTON_FONT).pack(fill="x", padx=5)
+
+        # Datasets held by the slot, the selected one is shown, filtered and plotted
+        member_frame = tk.Frame(self.frame)
+        member_frame.pack(fill="x", pady=2)
+        tk.Label(member_frame, text="Dataset:", font=UIStyling.BUTTON_FONT).pack(side="left", padx=5)
+        self.member_dropdown = ttk.Combobox(
+            member_frame, textvariable=self.data_manager.datasets[dataset_key]["active_member"], state="readonly",
+            postcommand=self._update_member_dropdown,
+        )
+        self.member_dropdown.pack(side="left", fill="x", expand=True, padx=5)
+        self.member_dropdown.bind("<<ComboboxSelected>>", self._select_member)
+        tk.Button(member_frame, text="Remove", command=self._remove_member, font=UIStyling.BUTTON_FONT).pack(side="left", padx=5, pady=2)
+
         # Buttons Frame
         button_frame = tk.Frame(self.frame)
         button_frame.pack(fill="x", pady=2)
 
         tk.Button(button_frame, text="Load", command=self._load_file, font=UIStyling.BUTTON_FONT).pack(side="left", padx=5, pady=2)
+        tk.Button(button_frame, text="Add", command=self._add_file, font=UIStyling.BUTTON_FONT).pack(side="left", padx=5, pady=2)
+        tk.Button(button_frame, text="Load Series", command=self._load_files, font=UIStyling.BUTTON_FONT).pack(side="left", padx=5, pady=2)
         tk.Button(button_frame, text="Show Data Table", command=self._show_data_table, font=UIStyling.BUTTON_FONT).pack(side="left", padx=5, pady=2)
         tk.Button(button_frame, text="Plot Data", command=self._plot_data, font=UIStyling.BUTTON_FONT).pack(side="left", padx=5, pady=2)
+        tk.Button(button_frame, text="Memory Report", command=self._show_memory_report, font=UIStyling.BUTTON_FONT).pack(side="left", padx=5, pady=2)
+        tk.Button(button_frame, text="Quality Report", command=self._show_quality_report, font=UIStyling.BUTTON_FONT).pack(side="left", padx=5, pady=2)
+        self.follow = tk.BooleanVar(value=False)
+        tk.Checkbutton(button_frame, text="Follow", variable=self.follow, command=self._toggle_follow, font=UIStyling.BUTTON_FONT).pack(side="left", padx=5, pady=2)
+
+        # Progress of background loads
+        progress_frame = tk.Frame(self.frame)
+        progress_frame.pack(fill="x", pady=2)
+
+        tk.Label(progress_frame, textvariable=self.data_manager.datasets[dataset_key]["load_status"], anchor="w", font=UIStyling.BUTTON_FONT).pack(side="left", fill="x", expand=True, padx=5)
+        tk.Button(progress_frame, text="Cancel", command=self._cancel_load, font=UIStyling.BUTTON_FONT).pack(side="right", padx=5, pady=2)
 
     def _load_file(self):
         self.data_manager.select_file(self.dataset_key)  # ✅ Call DataManager
 
+    def _add_file(self):
+        self.data_manager.select_file(self.dataset_key, append=True)
+
+    def _load_files(self):
+        self.data_manager.select_files(self.dataset_key)
+
+    def _update_member_dropdown(self):
+        self.member_dropdown.configure(values=self.data_manager.member_names(self.dataset_key))
+
+    def _select_member(self, event=None):
+        self.data_manager.select_member(self.dataset_key, self.member_dropdown.current())
+
+    def _remove_member(self):
+        self.data_manager.remove_member(self.dataset_key)
+
+    def _cancel_load(self):
+        self.data_manager.cancel_load(self.dataset_key)
+
     def _show_data_table(self):
         self.data_manager.show_data_table(self.dataset_key)  # ✅ Call DataManager
 
     def _plot_data(self):
         self.data_manager.plot_data(self.dataset_key)  # ✅ Call DataManager
 
+    def _show_memory_report(self):
+        self.data_manager.show_memory_report(self.dataset_key)
+
+    def _show_quality_report(self):
+        self.data_manager.show_quality_report(self.dataset_key)
+
+    def _toggle_follow(self):
+        self.follow.set(self.data_manager.set_follow(self.dataset_key, self.follow.get()))
+
 # widgets for data modification section 
 
 class FilterWidget:
@@ -60,7 +119,7 @@ class FilterWidget:
         self.select_charge_half_cycle = tk.BooleanVar()
         self.select_discharge_half_cycle = tk.BooleanVar()
         self.apply_step_change = tk.BooleanVar()
-        self.step_change_column = tk.StringVar(value="Line")
+        self.step_change_column = tk.StringVar(value=LINE)
         self.plot_option = tk.StringVar(value="U-t")
         self.plot_option.trace_add("write", lambda *args: self._on_plot_option_change()) #hkw
         self.fit_option = tk.StringVar(value="no fit")
@@ -69,7 +128,7 @@ class FilterWidget:
         self.visualize_key_values = tk.BooleanVar(value=False)
         self.show_cycles = tk.BooleanVar(value=False)
         self.cycle_selection = tk.StringVar(value="All")
-        self.cycle_column = tk.StringVar(value="Cyc-Count")
+        self.cycle_column = tk.StringVar(value=CYCLE)
         self.apply_range_filter = tk.BooleanVar(value=False)
 
         # Create filter options section
@@ -124,9 +183,9 @@ class FilterWidget:
         self.cycle_dropdown.config(font=UIStyling.DROPDOWN_FONT, state="disabled")
         self.cycle_dropdown.pack(side="left", padx=UIStyling.DROPDOWN_PADX)
         # Dropdown for selecting the cycle column type (Cyc-Count or abs_cycle)
-        self.cycle_column = tk.StringVar(value="Cyc-Count")
+        self.cycle_column = tk.StringVar(value=CYCLE)
         self.cycle_column_dropdown = tk.OptionMenu(
-            cycle_frame, self.cycle_column, "Cyc-Count", "abs_cycle", command=self._update_cycle_column_dropdown
+            cycle_frame, self.cycle_column, CYCLE, ABS_CYCLE, command=self._update_cycle_column_dropdown
         )
 #        self.cycle_column_dropdown.config(font=UIStyling.DROPDOWN_FONT)
         self.cycle_column_dropdown.config(font=UIStyling.DROPDOWN_FONT, state="disabled") # hkw
@@ -141,7 +200,7 @@ class FilterWidget:
         step_change_frame = tk.Frame(self.filter_frame)
         step_change_frame.pack(anchor="w", padx=UIStyling.LISTBOX_PADX, pady=2)
         tk.Checkbutton(step_change_frame, text="Apply Step Change Filter", variable=self.apply_step_change, font=UIStyling.BUTTON_FONT).pack(side="left")
-        self.step_change_dropdown = tk.OptionMenu(step_change_frame, self.step_change_column, "Line", "Command", "Cyc-Count")
+        self.step_change_dropdown = tk.OptionMenu(step_change_frame, self.step_change_column, LINE, COMMAND, CYCLE)
         self.step_change_dropdown.config(font=UIStyling.DROPDOWN_FONT)  # ✅ Apply centralized font
         self.step_change_dropdown.pack(side="left", padx=UIStyling.DROPDOWN_PADX)
 
@@ -190,6 +249,9 @@ class FilterWidget:
         tk.Button(self.button_frame, text="Plot Filtered Data", command=self._plot_filtered_data, font=UIStyling.BUTTON_FONT).pack(side="left", padx=5)
         tk.Button(self.button_frame, text="Save Filtered Data", command=self._save_filtered_data, font=UIStyling.BUTTON_FONT).pack(side="left", padx=5)
         tk.Button(self.button_frame, text="Store Filtered Data", command=self._store_filtered_data, font=UIStyling.BUTTON_FONT).pack(side="left", padx=5)
+        # Save and store the filtered data of every dataset held by the slot
+        self.all_datasets = tk.BooleanVar(value=False)
+        tk.Checkbutton(self.button_frame, text="All Datasets", variable=self.all_datasets, font=UIStyling.BUTTON_FONT).pack(side="left", padx=5)
 
     def _add_data_type_dropdown(self):
         """Dropdown to select modified or fit data to save or store using tk.buttons"""
@@ -221,9 +283,10 @@ class FilterWidget:
 
         # Ensure the dropdown is populated when enabling the filter
         if self.apply_range_filter.get():
-            dataset = self.app_context.data_manager.get_dataset(self.dataset_type)
-            if dataset is not None:
-                self.update_column_dropdown(dataset.columns.tolist())
+            # All file columns are offered, columns that are not loaded yet are fetched when the filter is applied
+            columns = self.app_context.data_manager.get_available_columns(self.dataset_type)
+            if columns:
+                self.update_column_dropdown(columns)
 
     # Updates for dropdown menus
 
@@ -252,17 +315,17 @@ class FilterWidget:
             return
 
         # ✅ Ensure Compute Absolute Cycle is active before allowing 'abs_cycle' selection
-        if selected_column == "abs_cycle":
+        if selected_column == ABS_CYCLE:
             if self.dataset_type in self.app_context.modify_widgets:
                 modify_widget = self.app_context.modify_widgets[self.dataset_type]
                 if not modify_widget.compute_abs_cycle.get():
                     messagebox.showwarning("Warning", "Please enable 'Compute Absolute Cycle' before selecting 'abs_cycle'.")
                     return  # ✅ Prevents changing the dropdown if condition is not met
 
-        # ✅ Extract unique cycle values if the column exists
-        if selected_column in dataset.columns:
-            unique_cycles = sorted(dataset[selected_column].dropna().unique())
-            self.update_cycle_options(unique_cycles)
+        # ✅ Cycle values from the segment index of the dataset (without a scan over the rows)
+        cycles = self.app_context.data_manager.cycle_values(self.dataset_type, selected_column)
+        if cycles:
+            self.update_cycle_options(cycles)
 
     # Toggle for cycle and cycle_column dropdown menus 
     def _toggle_cycle_dropdowns(self):   #hkw
@@ -286,7 +349,7 @@ class FilterWidget:
         if modify_widget.compute_abs_cycle.get():
             self.cycle_column_dropdown.config(state="normal")
         else:
-            self.cycle_column.set("Cyc-Count")  # ✅ Reset to default
+            self.cycle_column.set(CYCLE)  # ✅ Reset to default
             self.cycle_column_dropdown.config(state="disabled")  # ✅ Disable dropdown
 
     # toggle for use_step_size checkbox
@@ -328,6 +391,18 @@ class FilterWidget:
         else:
             self.cycle_selection.set("All")  # Default to "All" if no cycles exist
 
+    def add_cycle_options(self, cycles):
+        """
+        Adds new cycles to the cycle dropdown without resetting the current selection (used by follow mode).
+        """
+        menu = self.cycle_dropdown["menu"]
+        last_index = menu.index("end")
+        existing = {menu.entrycget(i, "label") for i in range(last_index + 1)} if last_index is not None else set()
+
+        for cycle in sorted(cycles):
+            if str(cycle) not in existing:
+                menu.add_command(label=str(cycle), command=lambda c=cycle: self.cycle_selection.set(str(c)))
+
 ### plot save store modified data --> should be moved out of FilterWidget sometimes as it works on all data modifications (maybe class ExportModifiedData?)
 
     def _plot_filtered_data(self):
@@ -457,6 +532,13 @@ class KeyValuesWidget:
             font=UIStyling.BUTTON_FONT
         ).pack(anchor="w", padx=UIStyling.LISTBOX_PADX, pady=2)
 
+        # Key values of every dataset held by the slot in one table
+        self.all_datasets = tk.BooleanVar()
+        tk.Checkbutton(
+            self.frame, text="All Datasets", variable=self.all_datasets,
+            font=UIStyling.BUTTON_FONT
+        ).pack(anchor="w", padx=UIStyling.LISTBOX_PADX, pady=2)
+
         # Extract Button
         tk.Button(
             self.frame, text="Extract Key Values", 
@@ -580,3 +662,153 @@ class FilteredDataBrowser:
                 self.listbox.delete(idx)
                 self.listbox.insert(idx, f"{item} [Selected]")
                 self.listbox.itemconfig(idx, {"fg": "green"})
+
+### dataset catalog of a data folder
+
+class DatasetCatalogBrowser:
+    """
+    Window listing the cycler files of a data folder with their summaries.
+    Files can be searched and sorted and loaded straight into a dataset slot.
+    """
+    COLUMNS = (
+        ("name", "File", 220), ("cell", "Cell", 80), ("rows", "Rows", 70), ("cycles", "Cycles", 55),
+        ("time_span_h", "Time [h]", 70), ("u_min", "U min", 55), ("u_max", "U max", 55),
+        ("q_charge_max", "Q ch. max", 70), ("q_discharge_max", "Q dis. max", 70), ("start_time", "Start", 130),
+    )
+
+    def __init__(self, app_context, folder=None):
+        self.app_context = app_context
+        self.catalog = DatasetCatalog(folder or DataSettings.CATALOG_DEFAULT_FOLDER)
+        self.sort_key = "name"
+        self.sort_descending = False
+        self.scan_job = None
+
+        self.window = tk.Toplevel(app_context.root)
+        self.window.title(f"Dataset Catalog - {self.catalog.folder}")
+        self.window.geometry("1000x500")
+        self.window.protocol("WM_DELETE_WINDOW", self._close)
+
+        # Folder, search and scan controls
+        control_frame = tk.Frame(self.window)
+        control_frame.pack(fill="x", padx=5, pady=5)
+        tk.Button(control_frame, text="Choose Folder", command=self._choose_folder, font=UIStyling.BUTTON_FONT).pack(side="left", padx=5)
+        tk.Button(control_frame, text="Rescan", command=self.scan, font=UIStyling.BUTTON_FONT).pack(side="left", padx=5)
+        tk.Label(control_frame, text="Search:", font=UIStyling.LABEL_FONT).pack(side="left", padx=5)
+        self.search_text = tk.StringVar()
+        self.search_text.trace_add("write", lambda *args: self.refresh())
+        tk.Entry(control_frame, textvariable=self.search_text, font=UIStyling.ENTRY_FONT, width=30).pack(side="left", padx=5)
+        self.status = tk.StringVar(value="")
+        tk.Label(control_frame, textvariable=self.status, anchor="w", font=UIStyling.BUTTON_FONT).pack(side="left", fill="x", expand=True, padx=5)
+
+        # File table, a click on a column heading sorts by that column
+        table_frame = tk.Frame(self.window)
+        table_frame.pack(fill="both", expand=True, padx=5)
+        self.tree = ttk.Treeview(table_frame, columns=[key for key, _, _ in self.COLUMNS], show="headings", selectmode="browse")
+        for key, title, width in self.COLUMNS:
+            self.tree.heading(key, text=title, command=lambda k=key: self._sort_by(k))
+            self.tree.column(key, width=width, anchor="w" if key in ("name", "cell", "start_time") else "e")
+        y_scrollbar = tk.Scrollbar(table_frame, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=y_scrollbar.set)
+        y_scrollbar.pack(side="right", fill="y")
+        self.tree.pack(side="left", fill="both", expand=True)
+
+        # Load the selected file into a slot
+        load_frame = tk.Frame(self.window)
+        load_frame.pack(fill="x", padx=5, pady=5)
+        for dataset_type in self.app_context.data_manager.datasets:
+            tk.Button(load_frame, text=f"Load as {dataset_type.replace('_', ' ').title()}",
+                      command=lambda t=dataset_type: self._load_selected(t), font=UIStyling.BUTTON_FONT).pack(side="left", padx=5)
+
+        self.refresh()
+        self.scan()
+
+    def _choose_folder(self):
+        folder = filedialog.askdirectory(title="Select Data Folder", initialdir=self.catalog.folder, parent=self.window)
+        if folder:
+            self.catalog = DatasetCatalog(folder)
+            self.window.title(f"Dataset Catalog - {self.catalog.folder}")
+            self.refresh()
+            self.scan()
+
+    def scan(self):
+        """
+        Updates the index of the folder on a worker thread (only new and changed files are read).
+        """
+        if self.scan_job is not None:
+            return
+        job = {"catalog": self.catalog, "progress": None, "result": None, "error": None, "done": False, "cancel_event": threading.Event()}
+        self.scan_job = job
+
+        def on_progress(done, total, file_path):
+            job["progress"] = (done, total)
+
+        def worker():
+            try:
+                job["result"] = job["catalog"].scan(on_progress, job["cancel_event"])
+            except Exception as e:
+                job["error"] = e
+            finally:
+                job["done"] = True
+
+        self.status.set("Scanning folder ...")
+        threading.Thread(target=worker, daemon=True).start()
+        self.window.after(DataSettings.LOAD_POLL_MS, self._poll_scan)
+
+    def _poll_scan(self):
+        job = self.scan_job
+        if job is None or not self.window.winfo_exists():
+            return
+        if not job["done"]:
+            if job["progress"] is not None:
+                self.status.set(f"Scanning: {job['progress'][0]} / {job['progress'][1]} changed files")
+            self.window.after(DataSettings.LOAD_POLL_MS, self._poll_scan)
+            return
+
+        self.scan_job = None
+        if job["error"] is not None:
+            self.status.set(f"Scan failed: {job['error']}")
+            return
+        scanned, failed, seconds = job["result"]
+        self.status.set(f"{len(self.catalog.entries)} files, {scanned} re-read ({failed} failed) in {seconds:.1f} s")
+        if job["catalog"] is not self.catalog:
+            self.scan()  # The folder was changed while scanning
+            return
+        self.refresh()
+
+    def refresh(self):
+        """
+        Shows the catalog entries matching the search text in the current sort order.
+        """
+        self.tree.delete(*self.tree.get_children())
+        for file_path, entry in self.catalog.rows(self.search_text.get(), self.sort_key, self.sort_descending):
+            values = [self._format(entry.get(key)) for key, _, _ in self.COLUMNS]
+            if "error" in entry:
+                values[1] = f"error: {entry['error']}"
+            self.tree.insert("", "end", iid=file_path, values=values)
+
+    @staticmethod
+    def _format(value):
+        if value is None:
+            return ""
+        if isinstance(value, float):
+            return f"{value:,.3f}"
+        if isinstance(value, int):
+            return f"{value:,}"
+        return str(value)
+
+    def _sort_by(self, key):
+        self.sort_descending = not self.sort_descending if key == self.sort_key else False
+        self.sort_key = key
+        self.refresh()
+
+    def _load_selected(self, dataset_type):
+        selected = self.tree.selection()
+        if not selected:
+            messagebox.showwarning("Warning", "No file selected.", parent=self.window)
+            return
+        self.app_context.data_manager.load_dataset_async(dataset_type, selected[0])
+
+    def _close(self):
+        if self.scan_job is not None:
+            self.scan_job["cancel_event"].set()
+        self.window.destroy()
@@ -1,10 +1,20 @@
-import pandas as pd
+import os
+import sys
+
+# The metadata catalog of the app converts the workbook once and reuses the converted sheets
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "h2f_F01_03")
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
+
+from metadata_catalog import MetadataCatalog
 
 # Path to the metadata file
 metadata_file = "data/cells_meta_2.xlsx"
 
-# Load all sheets from the Excel file
-metadata_sheets = pd.read_excel(metadata_file, sheet_name=None)
+# Load all sheets from the Excel file (or from the metadata cache if the workbook is unchanged)
+catalog = MetadataCatalog(metadata_file, cache_dir="cache/")
+catalog.load()
+metadata_sheets = catalog.sheets
 
 # Access individual sheets by their names
 for sheet_name, sheet_data in metadata_sheets.items():